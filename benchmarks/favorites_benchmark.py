@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+관심단지 대시보드 조회 벤치마크
+
+관심단지마다 최근 거래/가격 동향을 따로 조회하던 방식(관심단지 수 × 2회 조회)과
+윈도 함수·월별 집계로 한 번에 가져오는 get_favorite_apartments_with_latest_data를
+같은 합성 데이터로 비교하고, 두 결과가 같은지 확인합니다.
+
+사용법:
+    python benchmarks/favorites_benchmark.py [관심단지 수] [단지당 거래 수]   (기본: 200 300)
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.database import ApartmentDatabase
+
+
+def iter_transactions(complexes: int, per_complex: int, seed: int = 0):
+    """최근 1년에 분산된 단지별 합성 거래 (deal_amount로 유일성 보장)"""
+    rnd = random.Random(seed)
+    today = datetime.now()
+    for complex_no in range(complexes):
+        for i in range(per_complex):
+            deal_date = today - timedelta(days=rnd.randint(0, 365))
+            area = rnd.choice([59.9, 84.97, 114.5])
+            amount = 50000 + complex_no * per_complex + i
+            yield {
+                'apt_name': f"관심아파트{complex_no}단지",
+                'apt_seq': f"11680-{complex_no}",
+                'region_code': '11680',
+                'region_name': '서울특별시 강남구',
+                'deal_date': deal_date.strftime('%Y-%m-%d'),
+                'deal_amount': amount,
+                'exclusive_area': area,
+                'price_per_area': round(amount / area, 2),
+                'floor': rnd.randint(1, 30),
+                'build_year': 2005,
+                'umd_nm': '대치동',
+            }
+
+
+def per_favorite_load(db: ApartmentDatabase):
+    """관심단지별 개별 조회 (이전 방식)"""
+    result = []
+    for fav in db.get_favorite_apartments():
+        latest_transactions = db.get_apartment_transactions_old(fav['apt_name'], fav['region_code'], months=3)
+        fav_data = dict(fav)
+        fav_data['latest_transactions'] = latest_transactions[:5]
+        fav_data['price_trend'] = db.get_price_trend(fav['apt_name'], fav['region_code'], months=6)
+        fav_data['has_recent_data'] = len(latest_transactions) > 0
+        result.append(fav_data)
+    return result
+
+
+def timed(func, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        value = func()
+    return (time.perf_counter() - start) / repeat, value
+
+
+def main():
+    logging.disable(logging.WARNING)
+    favorites = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    per_complex = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    repeat = 5
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = ApartmentDatabase(os.path.join(tmp_dir, 'favorites.db'))
+        db.ingest_transactions(iter_transactions(favorites, per_complex))
+        for complex_no in range(favorites):
+            db.add_favorite_apartment({
+                'apt_name': f"관심아파트{complex_no}단지",
+                'region_code': '11680',
+                'region_name': '서울특별시 강남구',
+                'umd_nm': '대치동',
+            })
+
+        per_favorite_time, expected = timed(lambda: per_favorite_load(db), repeat)
+        batched_time, actual = timed(db.get_favorite_apartments_with_latest_data, repeat)
+        db.close()
+
+    same = expected == actual
+    print(f"📊 관심단지 대시보드 조회: 관심단지 {favorites}개, 단지당 거래 {per_complex}건")
+    print(f"  관심단지별 조회 : {per_favorite_time * 1000:8.1f}ms (조회 {favorites * 2 + 1}회)")
+    print(f"  일괄 조회       : {batched_time * 1000:8.1f}ms (조회 3회)")
+    print(f"  속도 향상 {per_favorite_time / batched_time:.1f}배, 결과 일치: {'✅' if same else '❌'}")
+    return 0 if same else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+거래 데이터 DB 저장 벤치마크 (rows/sec)
+
+건별 execute(묶음 크기 1)와 executemany 묶음 저장(ingest_transactions)을
+같은 합성 레코드로 비교합니다. 절반은 이미 저장된 레코드를 다시 넣어 중복 집계도 확인합니다.
+
+사용법:
+    python benchmarks/ingest_benchmark.py [행 수 ...]   (기본: 10000 100000 1000000)
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.database import ApartmentDatabase
+from src.transaction import SaleTransaction
+
+
+def iter_transactions(rows: int, seed: int = 0):
+    """합성 매매 레코드 생성기 (deal_amount로 유일성 보장)"""
+    rnd = random.Random(seed)
+    for i in range(rows):
+        year, month, day = 2024, rnd.randint(1, 12), rnd.randint(1, 28)
+        area = rnd.choice([59.9, 84.97, 114.5])
+        amount = 50000 + i
+        yield SaleTransaction.from_pairs((
+            ('apt_name', rnd.choice(['래미안대치팰리스', '은마', '개포자이프레지던스'])),
+            ('apt_seq', f"11680-{rnd.randint(1000, 1010)}"),
+            ('region_code', '11680'),
+            ('region_name', '서울특별시 강남구'),
+            ('deal_date', f"{year}-{month:02d}-{day:02d}"),
+            ('deal_year', year), ('deal_month', month), ('deal_day', day),
+            ('deal_amount', amount),
+            ('exclusive_area', area),
+            ('price_per_area', round(amount / area, 2)),
+            ('floor', rnd.randint(1, 30)),
+            ('build_year', 2005),
+            ('umd_nm', rnd.choice(['대치동', '개포동'])),
+            ('dealing_gbn', '중개거래'),
+        ))
+
+
+def row_by_row_save(db: ApartmentDatabase, transactions) -> int:
+    """건별 저장 (묶음 크기 1 = 행마다 execute)"""
+    return db.ingest_transactions(transactions, chunk_size=1)['inserted']
+
+
+def run(rows: int):
+    transactions = list(iter_transactions(rows))  # 레코드 생성 시간은 측정에서 제외
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        row_db = ApartmentDatabase(os.path.join(tmp_dir, 'legacy.db'))
+        start = time.perf_counter()
+        row_count = row_by_row_save(row_db, transactions)
+        row_time = time.perf_counter() - start
+        row_db.close()
+
+        bulk_db = ApartmentDatabase(os.path.join(tmp_dir, 'bulk.db'))
+        start = time.perf_counter()
+        result = bulk_db.ingest_transactions(iter(transactions))
+        bulk_time = time.perf_counter() - start
+
+        # 앞 절반을 다시 넣어 중복 집계 확인
+        repeat = bulk_db.ingest_transactions(transactions[:rows // 2])
+        bulk_db.close()
+
+    print(f"\n[{rows:,}행]")
+    print(f"  건별 execute : {rows / row_time:>10,.0f} rows/sec ({row_time:.2f}s, 추가 {row_count:,}건)")
+    print(f"  executemany  : {rows / bulk_time:>10,.0f} rows/sec ({bulk_time:.2f}s, 추가 {result['inserted']:,}건)")
+    print(f"  재저장 {rows // 2:,}건 → 추가 {repeat['inserted']:,}건, 중복 {repeat['duplicates']:,}건")
+
+
+def main():
+    logging.disable(logging.WARNING)
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+
+    print("📊 거래 데이터 저장 벤치마크")
+    for rows in sizes:
+        run(rows)
+
+
+if __name__ == '__main__':
+    main()
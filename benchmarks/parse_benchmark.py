@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+MOLIT XML 항목 파싱 벤치마크 (rows/sec)
+
+기존 방식(필드마다 element.find, 행마다 datetime.strptime/now)과
+필드 매핑 테이블 기반 단일 순회 파서를 같은 합성 응답으로 비교합니다.
+
+사용법:
+    python benchmarks/parse_benchmark.py [행 수] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.molit_parser import SaleItemParser, RentItemParser, parse_amount, safe_int
+
+SALE_ITEM = (
+    "<item><aptDong>{dong}</aptDong><aptNm>{name}</aptNm><aptSeq>11680-{seq}</aptSeq><bonbun>0012</bonbun>"
+    "<bubun>0000</bubun><buildYear>2005</buildYear><buyerGbn>개인</buyerGbn><cdealDay> </cdealDay><cdealType> </cdealType>"
+    "<dealAmount>{amount}</dealAmount><dealDay>{day}</dealDay><dealMonth>{month}</dealMonth><dealYear>{year}</dealYear>"
+    "<dealingGbn>중개거래</dealingGbn><estateAgentSggNm>서울 강남구</estateAgentSggNm><excluUseAr>{area}</excluUseAr>"
+    "<floor>{floor}</floor><jibun>12</jibun><landLeaseholdGbn>N</landLeaseholdGbn><rgsDate> </rgsDate><roadNm>테헤란로</roadNm>"
+    "<roadNmBonbun>00123</roadNmBonbun><roadNmBubun>00000</roadNmBubun><roadNmCd>3121022</roadNmCd><roadNmSeq>01</roadNmSeq>"
+    "<roadNmSggCd>11680</roadNmSggCd><roadNmbCd>0</roadNmbCd><sggCd>11680</sggCd><slerGbn>개인</slerGbn><umdCd>10100</umdCd>"
+    "<umdNm>{umd}</umdNm></item>"
+)
+RENT_ITEM = (
+    "<item><aptNm>{name}</aptNm><buildYear>2005</buildYear><contractTerm>24.01~26.01</contractTerm><contractType>신규</contractType>"
+    "<dealDay>{day}</dealDay><dealMonth>{month}</dealMonth><dealYear>{year}</dealYear><deposit>{amount}</deposit>"
+    "<excluUseAr>{area}</excluUseAr><floor>{floor}</floor><jibun>12</jibun><monthlyRent>{rent}</monthlyRent><preDeposit></preDeposit>"
+    "<preMonthlyRent></preMonthlyRent><sggCd>11680</sggCd><umdNm>{umd}</umdNm><useRRRight></useRRRight></item>"
+)
+
+
+def make_response(template: str, rows: int) -> str:
+    """합성 MOLIT 응답 XML 생성"""
+    rnd = random.Random(rows)
+    items = [template.format(
+        dong=f"{rnd.randint(101, 120)}동", name=rnd.choice(['래미안대치팰리스', '은마', '개포자이프레지던스']),
+        seq=rnd.randint(1000, 1010), amount=f"{rnd.randint(50000, 300000):,}", day=rnd.randint(1, 28),
+        month=rnd.randint(1, 12), year=2024, area=rnd.choice(['59.9', '84.97', '114.5']),
+        floor=rnd.randint(1, 30), umd=rnd.choice(['대치동', '개포동']), rent=rnd.choice([0, 100])
+    ) for _ in range(rows)]
+    return (
+        "<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>"
+        f"<body><items>{''.join(items)}</items><totalCount>{rows}</totalCount></body></response>"
+    )
+
+
+def _get(item, tag, default=""):
+    child = item.find(tag)
+    return child.text.strip() if child is not None and child.text else default
+
+
+def legacy_parse_sale(root, lawd_cd):
+    """기존 매매 파싱 루프 (필드마다 find, 행마다 strptime/now)"""
+    transactions = []
+    for item in root.findall('.//item'):
+        deal_year = int(_get(item, 'dealYear', '0'))
+        deal_month = int(_get(item, 'dealMonth', '0'))
+        deal_day = int(_get(item, 'dealDay', '0'))
+        deal_date = f"{deal_year}-{deal_month:0>2}-{deal_day:0>2}"
+        if datetime.strptime(deal_date, '%Y-%m-%d') > datetime.now():
+            continue
+        build_year = int(_get(item, 'buildYear', '0'))
+        exclusive_area = float(_get(item, 'excluUseAr', '0'))
+        floor = int(_get(item, 'floor', '0'))
+        deal_amount = parse_amount(_get(item, 'dealAmount'))
+        transaction = {'build_year': build_year, 'deal_amount': deal_amount, 'deal_date': deal_date,
+                       'exclusive_area': exclusive_area, 'floor': floor, 'region_code': lawd_cd}
+        for key, tag in (('apt_dong', 'aptDong'), ('apt_name', 'aptNm'), ('apt_seq', 'aptSeq'), ('bonbun', 'bonbun'),
+                         ('bubun', 'bubun'), ('buyer_gbn', 'buyerGbn'), ('cdeal_type', 'cdealType'),
+                         ('dealing_gbn', 'dealingGbn'), ('estate_agent_sgg_nm', 'estateAgentSggNm'), ('jibun', 'jibun'),
+                         ('road_name', 'roadNm'), ('road_name_bonbun', 'roadNmBonbun'), ('road_name_bubun', 'roadNmBubun'),
+                         ('sgg_cd', 'sggCd'), ('sler_gbn', 'slerGbn'), ('umd_cd', 'umdCd'), ('umd_nm', 'umdNm'),
+                         ('rgs_date', 'rgsDate'), ('cancel_deal_type', 'cancelDealType'),
+                         ('cancel_deal_day', 'cancelDealDay'), ('req_gbn', 'reqGbn'), ('house_type', 'houseType')):
+            transaction[key] = _get(item, tag)
+        if exclusive_area > 0:
+            transaction['price_per_area'] = (deal_amount * 10000) / exclusive_area
+        transactions.append(transaction)
+    return transactions
+
+
+def legacy_parse_rent(root, lawd_cd):
+    """기존 전월세 파싱 루프 (필드마다 find)"""
+    transactions = []
+    for item in root.findall('.//item'):
+        deal_year = int(_get(item, 'dealYear', '0'))
+        deal_month = int(_get(item, 'dealMonth', '0'))
+        deal_day = int(_get(item, 'dealDay', '0'))
+        deposit = _get(item, 'deposit', '0')
+        monthly_rent = _get(item, 'monthlyRent', '0')
+        transaction = {'deal_date': f"{deal_year}-{deal_month:02d}-{deal_day:02d}", 'region_code': lawd_cd,
+                       'build_year': int(_get(item, 'buildYear', '0')),
+                       'exclusive_area': float(_get(item, 'excluUseAr', '0')),
+                       'deposit': safe_int(deposit), 'monthly_rent': safe_int(monthly_rent),
+                       'transaction_type': "전세" if safe_int(monthly_rent) == 0 else "월세",
+                       'deal_amount': safe_int(deposit), 'price_per_area': 0}
+        for key, tag in (('apt_name', 'aptNm'), ('contract_term', 'contractTerm'), ('contract_type', 'contractType'),
+                         ('dong', 'dong'), ('floor', 'floor'), ('pre_deposit', 'preDeposit'),
+                         ('pre_monthly_rent', 'preMonthlyRent'), ('road_name', 'roadNm'),
+                         ('road_name_bonbun', 'roadNmBonbun'), ('road_name_bubun', 'roadNmBubun'), ('umd_nm', 'umdNm'),
+                         ('use_rr_right', 'useRRRight'), ('apt_dong', 'aptDong'), ('jibun', 'jibun'),
+                         ('rgs_date', 'rgsDate'), ('sgg_cd', 'sggCd'), ('umd_cd', 'umdCd')):
+            transaction[key] = _get(item, tag)
+        transactions.append(transaction)
+    return transactions
+
+
+def schema_parse(root, item_parser):
+    """필드 매핑 테이블 기반 단일 순회 파서"""
+    transactions = []
+    for item in root.iter('item'):
+        transaction = item_parser.parse(item)
+        if transaction is not None:
+            transactions.append(transaction)
+    return transactions
+
+
+def measure(label: str, parse, root, rows: int, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(root)
+        best = min(best, time.perf_counter() - start)
+    rate = rows / best
+    print(f"  {label:<10} {best * 1000:8.1f} ms  {rate:12,.0f} rows/sec")
+    return rate
+
+
+def main():
+    logging.disable(logging.WARNING)
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    cases = (
+        ('매매', SALE_ITEM, legacy_parse_sale, lambda: SaleItemParser('11680', '강남구')),
+        ('전월세', RENT_ITEM, legacy_parse_rent, lambda: RentItemParser('11680')),
+    )
+
+    print(f"📊 XML 항목 파싱 벤치마크: {rows:,}행, 최선 {repeat}회 기준")
+    for name, template, legacy_parse, make_parser in cases:
+        root = ET.fromstring(make_response(template, rows))
+        print(f"\n[{name}]")
+        before = measure('기존', lambda r: legacy_parse(r, '11680'), root, rows, repeat)
+        after = measure('스키마', lambda r: schema_parse(r, make_parser()), root, rows, repeat)
+        print(f"  개선 배율: {after / before:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+transaction_data 조회 쿼리 실행 계획 검사
+
+ApartmentDatabase의 주요 조회 쿼리(QUERY_PLAN_CHECKS)가 인덱스를 타는지
+EXPLAIN QUERY PLAN으로 확인합니다. 전체 스캔이나 커버링 인덱스 누락이 있으면
+종료 코드 1로 끝나므로 인덱스/쿼리 변경 후 회귀 확인용으로 사용할 수 있습니다.
+
+사용법:
+    python benchmarks/query_plan_check.py [DB 경로]   (기본: 임시 DB에 스키마만 생성)
+"""
+
+import os
+import sys
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.database import ApartmentDatabase
+
+
+def check(db_path: str) -> bool:
+    db = ApartmentDatabase(db_path)
+    result = db.verify_query_plans()
+    db.close()
+
+    for name, details in result['plans'].items():
+        print(f"\n[{name}]")
+        for detail in details:
+            print(f"  {detail}")
+
+    if result['regressions']:
+        print("\n❌ 실행 계획 회귀:")
+        for regression in result['regressions']:
+            print(f"  - {regression}")
+    elif result['success']:
+        print("\n✅ 모든 쿼리가 인덱스를 사용합니다")
+    else:
+        print(f"\n❌ 검사 실패: {result.get('error')}")
+
+    return result['success']
+
+
+def main():
+    logging.disable(logging.WARNING)
+
+    if len(sys.argv) > 1:
+        ok = check(sys.argv[1])
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ok = check(os.path.join(tmp_dir, 'plan_check.db'))
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+거래 테이블 스키마 비교 벤치마크 (행 크기, 단지 집계 시간)
+
+같은 합성 거래를 이전 비정규화 transaction_data 테이블(단지 정보를 행마다 반복,
+복합 인덱스 포함)과 단지(complexes) + 거래(transactions) 정규화 스키마에 저장한 뒤
+행당 디스크 사용량과 지역별 단지 목록 집계 시간을 비교합니다.
+
+사용법:
+    python benchmarks/schema_benchmark.py [행 수]   (기본: 200000)
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.database import ApartmentDatabase, APARTMENTS_BY_REGION_SQL
+
+REGION_CODES = [str(11000 + i * 10) for i in range(25)]
+
+LEGACY_SCHEMA = (
+    '''
+    CREATE TABLE transaction_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        apt_name TEXT NOT NULL, apt_seq TEXT, region_code TEXT NOT NULL, region_name TEXT NOT NULL,
+        deal_date TEXT NOT NULL, deal_year INTEGER, deal_month INTEGER, deal_day INTEGER,
+        deal_amount INTEGER, exclusive_area REAL, price_per_area REAL, floor INTEGER, build_year INTEGER,
+        road_name TEXT, road_name_bonbun TEXT, road_name_bubun TEXT, umd_nm TEXT,
+        buyer_gbn TEXT, sler_gbn TEXT, dealing_gbn TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        transaction_type TEXT DEFAULT '매매', deposit INTEGER DEFAULT 0, monthly_rent INTEGER DEFAULT 0,
+        apt_name_key TEXT,
+        UNIQUE(apt_name, apt_seq, deal_date, deal_amount)
+    )
+    ''',
+    '''
+    CREATE INDEX idx_transaction_region_apt_date ON transaction_data(
+        region_code, apt_name, deal_date, deal_amount, exclusive_area, price_per_area, floor,
+        region_name, umd_nm, build_year)
+    ''',
+    '''
+    CREATE INDEX idx_transaction_region_dong_apt ON transaction_data(
+        region_code, umd_nm, apt_name, region_name, build_year, price_per_area)
+    ''',
+    'CREATE INDEX idx_transaction_region_name_key ON transaction_data(region_code, apt_name_key, deal_date)',
+)
+
+LEGACY_BY_REGION_SQL = '''
+    SELECT apt_name, region_code, region_name, build_year, umd_nm,
+           COUNT(*) as transaction_count, AVG(price_per_area) as avg_price,
+           MIN(price_per_area) as min_price, MAX(price_per_area) as max_price
+    FROM transaction_data
+    WHERE region_code = ?
+    GROUP BY apt_name, region_code, umd_nm
+    ORDER BY transaction_count DESC, apt_name
+'''
+
+
+def iter_transactions(rows: int, seed: int = 0):
+    """지역 25개 × 단지 200개에 분산된 합성 매매/전월세 거래"""
+    rnd = random.Random(seed)
+    for i in range(rows):
+        complex_no = rnd.randint(0, 199)
+        region_code = REGION_CODES[complex_no % len(REGION_CODES)]
+        year, month, day = rnd.randint(2015, 2024), rnd.randint(1, 12), rnd.randint(1, 28)
+        area = rnd.choice([59.9, 84.97, 114.5])
+        amount = rnd.randint(30000, 300000)
+        yield {
+            'apt_name': f"테스트아파트{complex_no}단지",
+            'apt_seq': f"{region_code}-{complex_no}",
+            'region_code': region_code,
+            'region_name': '서울특별시 강남구',
+            'deal_date': f"{year}-{month:02d}-{day:02d}",
+            'deal_year': year, 'deal_month': month, 'deal_day': day,
+            'deal_amount': amount,
+            'exclusive_area': area,
+            'price_per_area': round(amount / area, 2),
+            'floor': rnd.randint(1, 30),
+            'build_year': 2000 + complex_no % 20,
+            'road_name': '테헤란로',
+            'road_name_bonbun': f"{complex_no:05d}",
+            'road_name_bubun': '00000',
+            'umd_nm': ['대치동', '개포동', '역삼동'][complex_no % 3],
+            'umd_cd': '10100',
+            'buyer_gbn': '개인', 'sler_gbn': '개인', 'dealing_gbn': '중개거래',
+            'transaction_type': '매매' if i % 3 else '전월세',
+        }
+
+
+def file_bytes(path: str) -> int:
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    conn.execute('VACUUM')
+    conn.close()
+    return os.path.getsize(path)
+
+
+def time_queries(path: str, sql: str, repeat: int = 3) -> float:
+    conn = sqlite3.connect(path)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for region_code in REGION_CODES:
+            conn.execute(sql, (region_code,)).fetchall()
+    elapsed = (time.perf_counter() - start) / (repeat * len(REGION_CODES))
+    conn.close()
+    return elapsed
+
+
+def main():
+    logging.disable(logging.WARNING)
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        normalized_path = os.path.join(tmp_dir, 'normalized.db')
+        db = ApartmentDatabase(normalized_path)
+        stored = db.ingest_transactions(iter_transactions(rows))['inserted']
+        db.close()
+
+        legacy_path = os.path.join(tmp_dir, 'legacy.db')
+        conn = sqlite3.connect(legacy_path)
+        for sql in LEGACY_SCHEMA:
+            conn.execute(sql)
+        conn.execute('ATTACH DATABASE ? AS normalized', (normalized_path,))
+        conn.execute('''
+            INSERT INTO main.transaction_data
+            (apt_name, apt_seq, region_code, region_name, deal_date, deal_year, deal_month, deal_day,
+             deal_amount, exclusive_area, price_per_area, floor, build_year, road_name, road_name_bonbun,
+             road_name_bubun, umd_nm, buyer_gbn, sler_gbn, dealing_gbn, transaction_type, deposit,
+             monthly_rent, apt_name_key)
+            SELECT apt_name, apt_seq, region_code, region_name, deal_date, deal_year, deal_month, deal_day,
+                   deal_amount, exclusive_area, price_per_area, floor, build_year, road_name, road_name_bonbun,
+                   road_name_bubun, umd_nm, buyer_gbn, sler_gbn, dealing_gbn, transaction_type, deposit,
+                   monthly_rent, apt_name_key
+            FROM normalized.transaction_data
+        ''')
+        conn.commit()
+        conn.execute('DETACH DATABASE normalized')
+        conn.close()
+
+        legacy_bytes = file_bytes(legacy_path)
+        normalized_bytes = file_bytes(normalized_path)
+        legacy_query = time_queries(legacy_path, LEGACY_BY_REGION_SQL)
+        normalized_query = time_queries(normalized_path, APARTMENTS_BY_REGION_SQL)
+
+    print(f"📊 거래 테이블 스키마 비교: {stored:,}건")
+    print(f"  비정규화 transaction_data : {legacy_bytes / stored:7.1f} bytes/row, 지역별 단지 집계 {legacy_query * 1000:7.2f}ms")
+    print(f"  complexes + transactions  : {normalized_bytes / stored:7.1f} bytes/row, 지역별 단지 집계 {normalized_query * 1000:7.2f}ms")
+    print(f"  행 크기 절감률 {(1 - normalized_bytes / legacy_bytes) * 100:.1f}%, "
+          f"집계 시간 {legacy_query / normalized_query:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+MOLIT XML 스트리밍 파싱 메모리 벤치마크
+
+페이지 크기별로 트리 파싱(ET.fromstring)과 스트리밍 파싱(XMLPullParser)의
+최대 메모리 사용량(tracemalloc peak)을 비교합니다.
+스트리밍 쪽은 레코드를 하나씩 소비만 하므로 페이지 크기와 무관하게 일정해야 합니다.
+
+사용법:
+    python benchmarks/stream_parse_benchmark.py
+"""
+
+import os
+import sys
+import time
+import logging
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.parse_benchmark import SALE_ITEM, make_response
+from src.molit_parser import SaleItemParser, StreamingPageParser
+
+
+def tree_parse(payload: bytes) -> int:
+    """기존 방식: 전체 문자열 디코딩 → 전체 트리 → 레코드 목록"""
+    root = ET.fromstring(payload.decode('utf-8'))
+    item_parser = SaleItemParser('11680', '강남구')
+    records = [item_parser.parse(item) for item in root.iter('item')]
+    return len(records)
+
+
+def stream_parse(payload: bytes, chunk_size: int = 65536) -> int:
+    """스트리밍 방식: 청크 단위 입력 → 레코드를 하나씩 소비"""
+    chunks = (payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size))
+    page_parser = StreamingPageParser(SaleItemParser('11680', '강남구'))
+    count = 0
+    for _ in page_parser.iter_records(chunks):
+        count += 1
+    return count
+
+
+def measure(parse, payload: bytes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = parse(payload)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak, elapsed
+
+
+def main():
+    logging.disable(logging.WARNING)
+
+    print("📊 XML 파싱 최대 메모리 비교 (입력 바이트 제외)")
+    print(f"{'행 수':>8} {'응답 크기':>10} {'트리 peak':>12} {'스트리밍 peak':>14} {'트리 시간':>10} {'스트리밍 시간':>12}")
+
+    for rows in (1000, 5000, 20000, 50000):
+        payload = make_response(SALE_ITEM, rows).encode('utf-8')
+        _, tree_peak, tree_time = measure(tree_parse, payload)
+        _, stream_peak, stream_time = measure(stream_parse, payload)
+        print(f"{rows:>8,} {len(payload) / 1024 / 1024:>8.1f}MB {tree_peak / 1024 / 1024:>10.1f}MB "
+              f"{stream_peak / 1024 / 1024:>12.2f}MB {tree_time * 1000:>8.0f}ms {stream_time * 1000:>10.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+거래 레코드 메모리 벤치마크 (bytes/row)
+
+같은 합성 응답을 파싱해 dict 레코드와 __slots__ 기반 Transaction 레코드로 보관할 때
+파싱 후 남는 메모리(tracemalloc)와 레코드 컨테이너 크기(sys.getsizeof)를 비교합니다.
+
+사용법:
+    python benchmarks/transaction_memory_benchmark.py [행 수]
+"""
+
+import gc
+import os
+import sys
+import logging
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.parse_benchmark import SALE_ITEM, RENT_ITEM, make_response
+from src.molit_parser import SaleItemParser, RentItemParser
+
+
+def parse_records(payload: str, make_parser, as_dict: bool):
+    """응답을 파싱해 레코드 목록만 남기고 트리는 해제"""
+    root = ET.fromstring(payload)
+    item_parser = make_parser()
+    records = []
+    for item in root.iter('item'):
+        record = item_parser.parse(item)
+        if record is not None:
+            records.append(record.to_dict() if as_dict else record)
+    del root
+    return records
+
+
+def retained_bytes(payload: str, make_parser, as_dict: bool):
+    gc.collect()
+    tracemalloc.start()
+    records = parse_records(payload, make_parser, as_dict)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, records
+
+
+def main():
+    logging.disable(logging.WARNING)
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    cases = (
+        ('매매', SALE_ITEM, lambda: SaleItemParser('11680', '강남구')),
+        ('전월세', RENT_ITEM, lambda: RentItemParser('11680')),
+    )
+
+    print(f"📊 거래 레코드 메모리 벤치마크: {rows:,}행")
+    for name, template, make_parser in cases:
+        payload = make_response(template, rows)
+
+        dict_bytes, dict_records = retained_bytes(payload, make_parser, as_dict=True)
+        dict_container = sys.getsizeof(dict_records[0])
+        del dict_records
+
+        slot_bytes, slot_records = retained_bytes(payload, make_parser, as_dict=False)
+        slot_container = sys.getsizeof(slot_records[0])
+        count = len(slot_records)
+        del slot_records
+
+        print(f"\n[{name}] {count:,}건")
+        print(f"  dict        : {dict_bytes / count:8.0f} bytes/row (컨테이너 {dict_container} bytes)")
+        print(f"  Transaction : {slot_bytes / count:8.0f} bytes/row (컨테이너 {slot_container} bytes)")
+        print(f"  절감률      : {(1 - slot_bytes / dict_bytes) * 100:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
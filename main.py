@@ -1,14 +1,48 @@
 #!/usr/bin/env python3
 """
 국토교통부 실거래가 조회 시스템 메인 실행 파일
+
+사용법:
+    python main.py                                   # 웹 애플리케이션 실행
+    python main.py archive [--before-year 연도] [--vacuum]   # 지난 연도 거래를 연도별 보관 DB로 이동
 """
 
 import sys
 import os
+import argparse
 from src.web_app import ApartmentTrackerApp
+from src.database import ApartmentDatabase
+
+def archive(args) -> int:
+    """지난 연도 거래 보관 명령"""
+    db_path = os.getenv('DATABASE_URL', 'sqlite:///apartment_tracker.db').replace('sqlite:///', '')
+    db = ApartmentDatabase(db_path)
+    result = db.archive_closed_years(before_year=args.before_year, vacuum=args.vacuum)
+    db.close()
+
+    if not result['success']:
+        print(f"❌ 보관 실패: {result.get('error')}")
+        return 1
+
+    if not result['years']:
+        print("ℹ️ 보관할 지난 연도 거래가 없습니다.")
+    for year, moved in result['years'].items():
+        print(f"🗄️ {year}년: {moved}건 → {result['archive_dir']}")
+    return 0
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='국토교통부 실거래가 조회 시스템')
+    subparsers = parser.add_subparsers(dest='command')
+    archive_parser = subparsers.add_parser('archive', help='지난 연도 거래를 연도별 보관 DB로 이동')
+    archive_parser.add_argument('--before-year', type=int, default=None,
+                                help='이 연도 이전 거래를 보관 (기본: 최근 DB_HOT_YEARS년 제외)')
+    archive_parser.add_argument('--vacuum', action='store_true', help='보관 후 메인 DB VACUUM')
+    args = parser.parse_args()
+
+    if args.command == 'archive':
+        return archive(args)
+
     print("🏠 국토교통부 실거래가 조회 시스템을 시작합니다.")
     print("📊 관심단지 추적 및 실거래가 분석 도구")
     print("=" * 50)
@@ -18,4 +52,4 @@ def main():
     app.run()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import logging
 
+from .molit_api import FETCH_PLANS
+
 logger = logging.getLogger(__name__)
 
 class APICallEstimator:
@@ -34,26 +36,13 @@ class APICallEstimator:
         force_refresh = search_params.get('force_refresh', False)
         apt_name = search_params.get('apt_name', '')
 
-        # 기본 호출 횟수는 개월 수
+        # 기본 호출 횟수는 개월 수 (엔드포인트당 월 1회)
         base_calls = months
 
-        # 검색 타입에 따른 호출 횟수 계산
-        # 실제 구현에서는 매매와 전월세를 병렬로 수집하므로 둘 다 호출됨
-        if search_type == 'sale':
-            # 매매 데이터만 조회하지만 실제로는 병렬로 매매+전월세 모두 호출
-            api_calls = base_calls * 2  # 매매 + 전월세 병렬 호출
-            api_type = "매매 (병렬 전월세 포함)"
-        elif search_type == 'rent':
-            # 전월세 데이터만 조회하지만 실제로는 병렬로 매매+전월세 모두 호출
-            api_calls = base_calls * 2  # 매매 + 전월세 병렬 호출
-            api_type = "전월세 (병렬 매매 포함)"
-        elif search_type == 'all':
-            # 매매 + 전월세 데이터 모두 조회
-            api_calls = base_calls * 2
-            api_type = "매매 + 전월세"
-        else:
-            api_calls = base_calls * 2  # 기본적으로 병렬 호출
-            api_type = "매매 (병렬 전월세 포함)"
+        # 검색 타입에 필요한 엔드포인트만 호출 (fetch plan)
+        endpoints = FETCH_PLANS.get(search_type, FETCH_PLANS['sale'])
+        api_calls = base_calls * len(endpoints)
+        api_type = self._get_api_type_name(endpoints)
 
         # 상세 정보 생성
         details = {
@@ -62,6 +51,7 @@ class APICallEstimator:
             'months': months,
             'force_refresh': force_refresh,
             'apt_name': apt_name,
+            'endpoints': list(endpoints),
             'base_calls': base_calls,
             'total_calls': api_calls,
             'estimated_time': self._estimate_time(api_calls),
@@ -87,11 +77,13 @@ class APICallEstimator:
         apt_name = refresh_params.get('apt_name', '')
         region_code = refresh_params.get('region_code', '')
 
-        # 새로고침은 일반적으로 매매 데이터만 조회
-        api_calls = months
+        # 새로고침은 매매 데이터만 조회
+        endpoints = FETCH_PLANS['sale']
+        api_calls = months * len(endpoints)
 
         details = {
             'operation': 'refresh',
+            'endpoints': list(endpoints),
             'apt_name': apt_name,
             'region_code': region_code,
             'months': months,
@@ -123,18 +115,9 @@ class APICallEstimator:
         months = 36
         base_calls = months
 
-        if search_type == 'sale':
-            api_calls = base_calls
-            api_type = "매매"
-        elif search_type == 'rent':
-            api_calls = base_calls
-            api_type = "전월세"
-        elif search_type == 'all':
-            api_calls = base_calls * 2
-            api_type = "매매 + 전월세"
-        else:
-            api_calls = base_calls
-            api_type = "매매"
+        endpoints = FETCH_PLANS.get(search_type, FETCH_PLANS['sale'])
+        api_calls = base_calls * len(endpoints)
+        api_type = self._get_api_type_name(endpoints)
 
         details = {
             'operation': 'step1_search',
@@ -142,6 +125,7 @@ class APICallEstimator:
             'district': district,
             'search_type': search_type,
             'api_type': api_type,
+            'endpoints': list(endpoints),
             'months': months,
             'total_calls': api_calls,
             'estimated_time': self._estimate_time(api_calls),
@@ -150,6 +134,11 @@ class APICallEstimator:
 
         return api_calls, details
 
+    def _get_api_type_name(self, endpoints) -> str:
+        """호출 엔드포인트 목록을 표시용 이름으로 변환"""
+        names = {'sale': '매매', 'rent': '전월세'}
+        return " + ".join(names.get(endpoint, endpoint) for endpoint in endpoints)
+
     def _estimate_time(self, api_calls: int) -> Dict:
         """API 호출 시간 예측"""
         # API 딜레이: 기본 0.05초 + 네트워크/처리 시간
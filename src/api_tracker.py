@@ -146,6 +146,11 @@ class APICallTracker:
         # 총 데이터 수
         total_data_from_calls = sum(call['data_count'] for call in tracking_data['api_calls'])
 
+        # 엔드포인트(매매/전월세)별 호출 횟수
+        calls_by_api_type = {}
+        for call in tracking_data['api_calls']:
+            calls_by_api_type[call['api_type']] = calls_by_api_type.get(call['api_type'], 0) + 1
+
         result = {
             'operation_info': {
                 'operation_id': tracking_data['operation_id'],
@@ -169,7 +174,9 @@ class APICallTracker:
                 'successful_calls': successful_calls,
                 'failed_calls': actual_calls - successful_calls,
                 'avg_response_time': avg_response_time,
-                'total_data_received': total_data_from_calls
+                'total_data_received': total_data_from_calls,
+                'calls_by_api_type': calls_by_api_type,
+                'planned_endpoints': tracking_data['details'].get('endpoints', [])
             },
             'api_call_details': tracking_data['api_calls'],
             'accuracy_assessment': self._get_accuracy_assessment(call_accuracy, time_accuracy),
@@ -242,6 +249,13 @@ class APICallTracker:
             else:
                 recommendations.append("예상보다 빠르게 완료되었습니다. 시간 예측 모델을 개선할 수 있습니다.")
 
+        # 호출 계획(fetch plan) 기반 권장사항
+        planned_endpoints = tracking_data['details'].get('endpoints')
+        if planned_endpoints:
+            unplanned = sorted(set(call['api_type'] for call in tracking_data['api_calls']) - set(planned_endpoints))
+            if unplanned:
+                recommendations.append(f"검색 유형에 필요하지 않은 엔드포인트({', '.join(unplanned)})가 호출되었습니다. 호출 계획을 확인하세요.")
+
         # 성공률 기반 권장사항
         successful_calls = sum(1 for call in tracking_data['api_calls'] if call['success'])
         success_rate = (successful_calls / tracking_data['actual_calls'] * 100) if tracking_data['actual_calls'] > 0 else 0
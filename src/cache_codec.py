@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+검색 캐시 데이터 인코딩 모듈
+
+캐시할 거래 목록을 법정동별 묶음으로 나눠 각각 JSON + zlib으로 압축하고, 앞에 작은 헤더 색인
+(전체/법정동별 건수, 묶음 위치, 거래일 범위)을 붙인 하나의 BLOB으로 저장합니다. 읽을 때는 헤더만
+해석한 뒤 필요한 법정동 묶음만 풀기 때문에, 동 하나만 필요한 요청이 지역 전체를 해제하지 않습니다.
+법정동마다 단지별 집계(거래 건수, 가격 합계/최저/최고)도 따로 압축해 두어, 1단계 단지 목록은 거래를
+풀지 않고 집계만 합쳐서 만들 수 있습니다.
+
+BLOB 구조: MAGIC(4바이트) + 헤더 길이(4바이트, big-endian) + 헤더 JSON + 법정동별 압축 묶음/집계
+묶음 내용: [원래 목록에서의 위치 목록, 거래 목록] (전체를 풀 때 원래 순서 복원)
+집계 내용: {단지명: summarize_apartments 항목} (거래에 처음 나온 순서)
+"""
+
+import json
+import zlib
+import struct
+from collections.abc import Iterable
+from typing import Dict, List
+
+from .transaction import transaction_json_default
+
+MAGIC = b'RTC1'
+COMPRESS_LEVEL = 6
+
+_HEADER_LENGTH = struct.Struct('>I')
+_PREFIX_SIZE = len(MAGIC) + _HEADER_LENGTH.size
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, default=transaction_json_default).encode('utf-8')
+
+
+def _is_rent(transaction: Dict) -> bool:
+    """전월세 거래 여부 (전월세 응답에만 있는 필드로 판단)"""
+    return bool(transaction.get('transaction_type') is not None or transaction.get('rentFee')
+                or transaction.get('deposit') or transaction.get('monthlyRent'))
+
+
+def summarize_apartments(transactions: Iterable) -> Dict[str, Dict]:
+    """
+    거래 목록의 단지별 집계 (합칠 수 있는 형태)
+
+    Returns:
+        {단지명: {'region_code', 'region_name', 'build_year', 'transaction_count', 'sale_count',
+                 'rent_count', 'price_sum', 'price_count', 'min_price', 'max_price', 'dong_list'}}
+        - 단지는 거래에 처음 나온 순서, 가격은 deal_amount(전월세는 보증금) 기준
+    """
+    summary: Dict[str, Dict] = {}
+    for transaction in transactions:
+        apt_name = transaction.get('apt_name', '')
+        if not apt_name:
+            continue
+
+        apartment = summary.get(apt_name)
+        if apartment is None:
+            apartment = summary[apt_name] = {
+                'region_code': transaction.get('region_code', ''),
+                'region_name': transaction.get('region_name', ''),
+                'build_year': transaction.get('build_year', 0),
+                'transaction_count': 0,
+                'sale_count': 0,
+                'rent_count': 0,
+                'price_sum': 0,
+                'price_count': 0,
+                'min_price': None,
+                'max_price': 0,
+                'dong_list': [],
+            }
+
+        apartment['transaction_count'] += 1
+        apartment['rent_count' if _is_rent(transaction) else 'sale_count'] += 1
+
+        price = transaction.get('deal_amount', 0) or 0
+        if price > 0:
+            apartment['price_sum'] += price
+            apartment['price_count'] += 1
+            apartment['min_price'] = price if apartment['min_price'] is None else min(apartment['min_price'], price)
+            apartment['max_price'] = max(apartment['max_price'], price)
+
+        dong_name = transaction.get('umd_nm', '')
+        if dong_name and dong_name not in apartment['dong_list']:
+            apartment['dong_list'].append(dong_name)
+
+    return summary
+
+
+def merge_apartment_summaries(summaries: Iterable[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """단지별 집계 합치기 (앞선 집계의 단지 순서와 기본 정보 우선)"""
+    merged: Dict[str, Dict] = {}
+    for summary in summaries:
+        for apt_name, apartment in summary.items():
+            target = merged.get(apt_name)
+            if target is None:
+                merged[apt_name] = dict(apartment, dong_list=list(apartment['dong_list']))
+                continue
+
+            for key in ('transaction_count', 'sale_count', 'rent_count', 'price_sum', 'price_count'):
+                target[key] += apartment[key]
+            if apartment['min_price'] is not None:
+                target['min_price'] = (apartment['min_price'] if target['min_price'] is None
+                                       else min(target['min_price'], apartment['min_price']))
+            target['max_price'] = max(target['max_price'], apartment['max_price'])
+            target['dong_list'].extend(dong for dong in apartment['dong_list'] if dong not in target['dong_list'])
+    return merged
+
+
+def apartment_list_from_summary(summary: Dict[str, Dict]) -> List[Dict]:
+    """단지별 집계 → 1단계 단지 목록 (평균 가격 계산, 거래 건수 내림차순)"""
+    apartment_list = [
+        {
+            'apt_name': apt_name,
+            'region_code': apartment['region_code'],
+            'region_name': apartment['region_name'],
+            'build_year': apartment['build_year'],
+            'transaction_count': apartment['transaction_count'],
+            'sale_count': apartment['sale_count'],
+            'rent_count': apartment['rent_count'],
+            'avg_price': apartment['price_sum'] / apartment['price_count'] if apartment['price_count'] else 0,
+            'min_price': apartment['min_price'] or 0,
+            'max_price': apartment['max_price'],
+            'dong_list': list(apartment['dong_list']),
+        }
+        for apt_name, apartment in summary.items()
+    ]
+    apartment_list.sort(key=lambda apartment: apartment['transaction_count'], reverse=True)
+    return apartment_list
+
+
+def encode_rows(rows: Iterable) -> bytes:
+    """거래 목록을 법정동별 압축 묶음 BLOB으로 인코딩"""
+    groups: Dict[str, tuple] = {}
+    for position, row in enumerate(rows):
+        positions, group = groups.setdefault(row.get('umd_nm') or '', ([], []))
+        positions.append(position)
+        group.append(row)
+
+    parts = []
+    chunks = []
+    offset = 0
+    raw_bytes = 2  # 전체를 JSON 배열 하나로 저장할 때의 크기 (대괄호 + 구분자 포함)
+    for dong, (positions, group) in groups.items():
+        rows_json = _dumps(group)
+        raw_bytes += len(rows_json) - 2 + (2 if parts else 0)
+        compressed = zlib.compress(b'[' + _dumps(positions) + b',' + rows_json + b']', COMPRESS_LEVEL)
+        summary = zlib.compress(_dumps(summarize_apartments(group)), COMPRESS_LEVEL)
+
+        deal_dates = [row.get('deal_date') or '' for row in group]
+        parts.append([dong, len(group), offset, len(compressed), min(deal_dates), max(deal_dates),
+                      group[0].get('umd_cd') or '', offset + len(compressed), len(summary)])
+        chunks.extend((compressed, summary))
+        offset += len(compressed) + len(summary)
+
+    header = {
+        'count': sum(part[1] for part in parts),
+        'raw_bytes': raw_bytes,
+        'date_range': [min((part[4] for part in parts), default=''), max((part[5] for part in parts), default='')],
+        'parts': parts  # [법정동, 건수, 위치, 길이, 최초 거래일, 최근 거래일, 법정동코드, 집계 위치, 집계 길이]
+    }
+    header_json = _dumps(header)
+    return MAGIC + _HEADER_LENGTH.pack(len(header_json)) + header_json + b''.join(chunks)
+
+
+def is_encoded(value) -> bool:
+    """encode_rows로 만든 BLOB인지 여부 (이전 형식은 JSON TEXT)"""
+    return isinstance(value, (bytes, memoryview)) and bytes(value[:len(MAGIC)]) == MAGIC
+
+
+class CacheBlob:
+    """인코딩된 캐시 BLOB (헤더만 먼저 읽고 법정동 묶음은 요청할 때 해제)"""
+
+    def __init__(self, blob: bytes):
+        header_length = _HEADER_LENGTH.unpack_from(blob, len(MAGIC))[0]
+        self.header = json.loads(bytes(blob[_PREFIX_SIZE:_PREFIX_SIZE + header_length]))
+        self._body = memoryview(blob)[_PREFIX_SIZE + header_length:]
+
+    @property
+    def count(self) -> int:
+        return self.header['count']
+
+    @property
+    def raw_bytes(self) -> int:
+        return self.header['raw_bytes']
+
+    @property
+    def date_range(self) -> List[str]:
+        return self.header['date_range']
+
+    def dongs(self) -> Dict[str, int]:
+        """법정동별 거래 건수 (해제 없이 헤더에서)"""
+        return {part[0]: part[1] for part in self.header['parts']}
+
+    def _parts(self, dong: str = None) -> List[list]:
+        """법정동명 또는 법정동코드에 해당하는 묶음 (dong이 없으면 전체)"""
+        return [part for part in self.header['parts']
+                if dong is None or part[0] == dong or (len(part) > 6 and part[6] == dong)]
+
+    def _read_part(self, part: list) -> tuple:
+        offset, length = part[2], part[3]
+        positions, rows = json.loads(zlib.decompress(self._body[offset:offset + length]))
+        return positions, rows
+
+    def count_of(self, dong: str = None) -> int:
+        """법정동 거래 건수 (해제 없이 헤더에서)"""
+        return sum(part[1] for part in self._parts(dong))
+
+    def summary(self, dong: str = None) -> Dict[str, Dict]:
+        """
+        단지별 집계 (summarize_apartments 형식)
+
+        dong을 주면 해당 법정동 집계만 해제합니다. 집계가 없는 이전 BLOB은 거래를 풀어 계산합니다.
+        """
+        summaries = []
+        for part in self._parts(dong):
+            if len(part) > 8:
+                offset, length = part[7], part[8]
+                summaries.append(json.loads(zlib.decompress(self._body[offset:offset + length])))
+            else:
+                summaries.append(summarize_apartments(self._read_part(part)[1]))
+        return summaries[0] if len(summaries) == 1 else merge_apartment_summaries(summaries)
+
+    def rows(self, dong: str = None) -> List[Dict]:
+        """거래 목록 해제 (dong을 주면 해당 법정동 묶음만, 원래 순서 유지)"""
+        parts = self._parts(dong)
+        if len(parts) == 1:
+            return self._read_part(parts[0])[1]
+
+        ordered = [None] * self.count
+        for part in parts:
+            positions, rows = self._read_part(part)
+            for position, row in zip(positions, rows):
+                ordered[position] = row
+        return [row for row in ordered if row is not None] if dong is not None else ordered
+
+
+def decode_rows(value, dong: str = None) -> List[Dict]:
+    """캐시 값(인코딩 BLOB 또는 이전 JSON TEXT)을 거래 목록으로 해제"""
+    if not value:
+        return []
+    if is_encoded(value):
+        return CacheBlob(value).rows(dong)
+
+    rows = json.loads(value)
+    return rows if dong is None else [row for row in rows if dong in (row.get('umd_nm'), row.get('umd_cd'))]
+
+
+def decode_summary(value, dong: str = None) -> tuple:
+    """캐시 값의 단지별 집계와 거래 건수 → (집계, 건수) - 인코딩 BLOB이면 거래를 풀지 않음"""
+    if not value:
+        return {}, 0
+    if is_encoded(value):
+        blob = CacheBlob(value)
+        return blob.summary(dong), blob.count_of(dong)
+
+    rows = decode_rows(value, dong)
+    return summarize_apartments(rows), len(rows)
+
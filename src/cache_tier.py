@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+검색 캐시 메모리 계층 모듈
+
+search_cache 행을 프로세스 메모리에 LRU로 보관해, 방금 다른 사용자가 조회한 지역을 다시 찾을 때
+SQLite 연결/행 조회 없이 바로 돌려줍니다. 행의 raw_data는 인코딩된 BLOB 그대로 보관하므로
+법정동 묶음만 해제하는 지연 해제는 그대로 동작하고, 크기 계산도 정확합니다.
+항목 수와 바이트 합계로 크기를 제한하고, TTL이 지나거나 DB 행의 expires_at이 지나면 버립니다
+(만료됐지만 아직 제공 가능한 구간은 보관하지 않고 SQLite에서 읽습니다).
+"""
+
+import os
+import time
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+# 행마다 더하는 대략적인 고정 크기 (딕셔너리/메타데이터 컬럼)
+ENTRY_OVERHEAD_BYTES = 512
+
+
+class MemoryCacheTier:
+    """바이트/항목 수 제한과 TTL이 있는 스레드 안전 LRU 캐시 (search_cache 행 단위)"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 512, ttl_seconds: int = 300):
+        """
+        Args:
+            max_bytes: 보관할 행 크기 합계 상한 (바이트)
+            max_entries: 보관할 행 개수 상한 (0이면 메모리 계층 사용 안 함)
+            ttl_seconds: 메모리에 보관하는 최대 시간 (초)
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0, int(ttl_seconds))
+
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()  # cache_key → (행, 크기, 보관 만료 시각)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+
+    @classmethod
+    def from_env(cls) -> 'MemoryCacheTier':
+        """환경 변수 설정으로 메모리 계층 생성"""
+        return cls(
+            max_bytes=int(float(os.getenv('CACHE_MEMORY_MAX_MB', '64')) * 1024 * 1024),
+            max_entries=int(os.getenv('CACHE_MEMORY_MAX_ENTRIES', '512')),
+            ttl_seconds=int(os.getenv('CACHE_MEMORY_TTL_SECONDS', '300'))
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def _row_size(row: Dict) -> int:
+        return ENTRY_OVERHEAD_BYTES + sum(len(value) for value in row.values() if isinstance(value, (str, bytes)))
+
+    @staticmethod
+    def row_expired(row: Dict) -> bool:
+        """DB 행 만료 여부 (조회 쿼리의 expires_at > datetime('now')와 같은 UTC 문자열 비교)"""
+        return row['expires_at'] <= datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+
+    def _drop(self, cache_key: str):
+        _, size, _ = self._entries.pop(cache_key)
+        self._bytes -= size
+
+    def get(self, cache_key: str) -> Optional[Dict]:
+        """보관 중인 유효한 행 (없거나 만료됐으면 None)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            row, _, held_until = entry
+            if held_until <= time.monotonic() or self.row_expired(row):
+                self._drop(cache_key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(cache_key)
+            self._stats['hits'] += 1
+            return row
+
+    def put(self, cache_key: str, row: Dict):
+        """행 보관 (상한을 넘으면 가장 오래 쓰이지 않은 행부터 제거)"""
+        if not self.enabled:
+            return
+
+        size = self._row_size(row)
+        if size > self.max_bytes or self.row_expired(row):
+            return
+
+        with self._lock:
+            if cache_key in self._entries:
+                self._drop(cache_key)
+            self._entries[cache_key] = (row, size, time.monotonic() + self.ttl_seconds)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._drop(oldest_key)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, cache_key: str = None, predicate: Callable[[Dict], bool] = None) -> int:
+        """
+        행 무효화
+
+        Args:
+            cache_key: 이 키의 행만 제거
+            predicate: 행을 받아 True를 돌려주는 행만 제거 (cache_key와 predicate가 모두 없으면 전체 제거)
+
+        Returns:
+            제거한 행 수
+        """
+        with self._lock:
+            if cache_key is not None:
+                keys = [cache_key] if cache_key in self._entries else []
+            elif predicate is not None:
+                keys = [key for key, (row, _, _) in self._entries.items() if predicate(row)]
+            else:
+                keys = list(self._entries)
+
+            for key in keys:
+                self._drop(key)
+            self._stats['invalidations'] += len(keys)
+            return len(keys)
+
+    def clear(self) -> int:
+        """모든 행 제거"""
+        return self.invalidate()
+
+    def get_statistics(self) -> Dict:
+        """적중/실패/제거 통계 및 현재 크기"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({'entries': len(self._entries), 'bytes': self._bytes})
+
+        lookups = stats['hits'] + stats['misses']
+        stats.update({
+            'hit_rate': round(stats['hits'] / lookups, 3) if lookups else 0,
+            'enabled': self.enabled,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds
+        })
+        return stats
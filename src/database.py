@@ -5,11 +5,640 @@
 
 import sqlite3
 import os
+import re
+import time
+import hashlib
 import logging
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional
+from collections.abc import Iterable, Mapping
 import json
 
+from .transaction import transaction_json_default
+from .db_connection import SQLiteConnectionManager
+from .db_archive import YearArchive
+from .cache_codec import CacheBlob, encode_rows, decode_rows, decode_summary
+from .cache_tier import MemoryCacheTier
+
+# 단지(complexes) 컬럼: (컬럼명, 레코드 키, 기본값)
+# 단지는 (region_code, umd_nm, apt_name)으로 식별합니다. 전월세 응답에는 aptSeq가 없으므로
+# apt_seq는 매매 거래에서 알게 되면 채우는 속성입니다.
+COMPLEX_COLUMNS = (
+    ('region_code', 'region_code', ''),
+    ('umd_nm', 'umd_nm', ''),
+    ('apt_name', 'apt_name', ''),
+    ('apt_seq', 'apt_seq', ''),
+    ('umd_cd', 'umd_cd', ''),
+    ('region_name', 'region_name', ''),
+    ('road_name', 'road_name', ''),
+    ('road_name_bonbun', 'road_name_bonbun', ''),
+    ('road_name_bubun', 'road_name_bubun', ''),
+    ('build_year', 'build_year', 0),
+)
+
+# 레코드 값이 아니라 저장 시 계산하는 단지 컬럼
+COMPLEX_COMPUTED_COLUMNS = ('apt_name_key', 'road_address')
+
+# 거래(transactions) 컬럼: (컬럼명, 레코드 키, 기본값), 단지 정보는 complex_id로 참조
+TRANSACTION_FACT_COLUMNS = (
+    ('deal_date', 'deal_date', ''),
+    ('deal_amount', 'deal_amount', 0),
+    ('exclusive_area', 'exclusive_area', 0.0),
+    ('price_per_area', 'price_per_area', 0.0),
+    ('floor', 'floor', 0),
+    ('buyer_gbn', 'buyer_gbn', ''),
+    ('sler_gbn', 'sler_gbn', ''),
+    ('dealing_gbn', 'dealing_gbn', ''),
+    ('transaction_type', 'transaction_type', '매매'),
+    ('deposit', 'deposit', 0),
+    ('monthly_rent', 'monthly_rent', 0),
+    ('apt_dong', 'apt_dong', ''),
+    ('cancel_deal_type', 'cancel_deal_type', ''),
+    ('cancel_deal_day', 'cancel_deal_day', ''),
+)
+
+# 거래 자연 키: 단지 자연 키 (region_code, umd_nm, apt_name) 뒤에 붙는 거래 컬럼
+# 같은 날 같은 보증금의 전세 계약도 층/면적/동이 다르면 서로 다른 거래로 구분됩니다.
+ROW_HASH_FACT_COLUMNS = (
+    'transaction_type', 'deal_date', 'floor', 'exclusive_area',
+    'deal_amount', 'deposit', 'monthly_rent', 'apt_dong',
+)
+
+# 같은 거래를 다시 받았을 때 갱신하는 컬럼 (나중에 들어오는 해제 정보 등)
+TRANSACTION_UPDATE_COLUMNS = (
+    'price_per_area', 'buyer_gbn', 'sler_gbn', 'dealing_gbn', 'cancel_deal_type', 'cancel_deal_day',
+)
+
+# 해제된 거래 표시 (국토부 매매 응답 cdealType = 'O'), 가격 집계에서 제외
+CANCELLED_DEAL_TYPE = 'O'
+
+_COMPLEX_INSERT_COLUMNS = [column for column, _, _ in COMPLEX_COLUMNS] + list(COMPLEX_COMPUTED_COLUMNS)
+
+# 같은 단지를 다시 만나면 비어 있던 속성만 채움 (변경이 없으면 UPDATE 자체를 건너뜀)
+COMPLEX_UPSERT_SQL = f'''
+    INSERT INTO complexes ({', '.join(_COMPLEX_INSERT_COLUMNS)})
+    VALUES ({', '.join('?' for _ in _COMPLEX_INSERT_COLUMNS)})
+    ON CONFLICT(region_code, umd_nm, apt_name) DO UPDATE SET
+        apt_seq = COALESCE(NULLIF(complexes.apt_seq, ''), excluded.apt_seq),
+        umd_cd = COALESCE(NULLIF(complexes.umd_cd, ''), excluded.umd_cd),
+        region_name = COALESCE(NULLIF(complexes.region_name, ''), excluded.region_name),
+        road_name = CASE WHEN complexes.road_address = '' THEN excluded.road_name ELSE complexes.road_name END,
+        road_name_bonbun = CASE WHEN complexes.road_address = '' THEN excluded.road_name_bonbun ELSE complexes.road_name_bonbun END,
+        road_name_bubun = CASE WHEN complexes.road_address = '' THEN excluded.road_name_bubun ELSE complexes.road_name_bubun END,
+        road_address = COALESCE(NULLIF(complexes.road_address, ''), excluded.road_address),
+        build_year = COALESCE(NULLIF(complexes.build_year, 0), excluded.build_year)
+    WHERE (complexes.apt_seq = '' AND excluded.apt_seq != '')
+       OR (complexes.umd_cd = '' AND excluded.umd_cd != '')
+       OR (complexes.region_name = '' AND excluded.region_name != '')
+       OR (complexes.road_address = '' AND excluded.road_address != '')
+       OR (COALESCE(complexes.build_year, 0) = 0 AND excluded.build_year > 0)
+'''
+
+COMPLEX_ID_SQL = 'SELECT id FROM complexes WHERE region_code = ? AND umd_nm = ? AND apt_name = ?'
+
+_TRANSACTION_COLUMNS = ['complex_id', 'row_hash'] + [column for column, _, _ in TRANSACTION_FACT_COLUMNS]
+
+_COMPLEX_ROW_KEYS = tuple((key, default) for _, key, default in COMPLEX_COLUMNS)
+_FACT_ROW_KEYS = tuple((key, default) for _, key, default in TRANSACTION_FACT_COLUMNS)
+_ROW_HASH_FACT_POSITIONS = tuple(
+    [column for column, _, _ in TRANSACTION_FACT_COLUMNS].index(column) for column in ROW_HASH_FACT_COLUMNS
+)
+_CANCEL_DEAL_TYPE_POSITION = [column for column, _, _ in TRANSACTION_FACT_COLUMNS].index('cancel_deal_type')
+
+_APT_NAME_STRIP_PATTERN = re.compile(r'[\s\-()]+')
+
+
+def normalize_apt_name(apt_name: str) -> str:
+    """아파트명 검색 키 (공백/하이픈/괄호 제거, 대소문자 무시)"""
+    if not apt_name:
+        return ''
+    return _APT_NAME_STRIP_PATTERN.sub('', apt_name).casefold()
+
+
+def format_road_address(road_name: str, bonbun, bubun) -> str:
+    """도로명 주소 문자열 (예: '테헤란로 123-4', 건물번호 앞자리 0 제거)"""
+    if not road_name:
+        return ''
+    bonbun = str(bonbun or '').lstrip('0')
+    bubun = str(bubun or '').lstrip('0')
+    if not bonbun:
+        return road_name
+    return f"{road_name} {bonbun}-{bubun}" if bubun else f"{road_name} {bonbun}"
+
+
+def _row_hash_number(value) -> str:
+    """행 해시 입력값 (숫자 컬럼, 5 / '5' / 5.0은 같은 값)"""
+    if type(value) is int:
+        return str(value)
+    if value is None or value == '':
+        return ''
+    try:
+        number = round(float(value), 4)
+    except (TypeError, ValueError):
+        return str(value).strip()
+    return '%d' % number if number.is_integer() else repr(number)
+
+
+# 문자열 컬럼은 저장 경로/이관 경로 모두 기본값이 채워진 상태로 들어오므로 str()만 적용
+_ROW_HASH_NUMERIC_COLUMNS = {'floor', 'exclusive_area', 'deal_amount', 'deposit', 'monthly_rent'}
+_ROW_HASH_NORMALIZERS = (str,) * 3 + tuple(
+    _row_hash_number if column in _ROW_HASH_NUMERIC_COLUMNS else str
+    for column in ROW_HASH_FACT_COLUMNS
+)
+
+
+def transaction_row_hash(*key_values) -> int:
+    """
+    거래 자연 키 해시 (부호 있는 64비트 정수)
+
+    Args:
+        key_values: region_code, umd_nm, apt_name, 이어서 ROW_HASH_FACT_COLUMNS 순서의 값
+    """
+    payload = '\x1f'.join([normalize(value) for normalize, value in zip(_ROW_HASH_NORMALIZERS, key_values)])
+    return int.from_bytes(hashlib.blake2b(payload.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+def _transaction_row(tx: Mapping) -> tuple:
+    """거래 레코드 → (단지 파라미터 튜플, (행 해시,) + 거래 파라미터 튜플)"""
+    get = tx.get
+    complex_values = [get(key) or default for key, default in _COMPLEX_ROW_KEYS]
+    complex_values.append(normalize_apt_name(complex_values[2]))  # apt_name_key
+    complex_values.append(format_road_address(*complex_values[6:9]))  # road_address
+    fact_values = []
+    for key, default in _FACT_ROW_KEYS:
+        value = get(key)
+        fact_values.append(default if value is None else value)  # 기본 키 컬럼은 NULL 불가
+    if not fact_values[_CANCEL_DEAL_TYPE_POSITION]:
+        fact_values[_CANCEL_DEAL_TYPE_POSITION] = get('cdeal_type') or ''  # 매매 응답의 해제여부
+    row_hash = transaction_row_hash(
+        *complex_values[:3], *(fact_values[position] for position in _ROW_HASH_FACT_POSITIONS)
+    )
+    return tuple(complex_values), (row_hash,) + tuple(fact_values)
+
+
+def _fact_select_sql(alias: str, available_columns) -> str:
+    """이관용 거래 컬럼 SELECT 목록 (저장 경로와 같은 기본값 적용, 없는 컬럼은 기본값)"""
+    items = []
+    for column, _, default in TRANSACTION_FACT_COLUMNS:
+        literal = f"'{default}'" if isinstance(default, str) else repr(default)
+        if column in available_columns:
+            items.append(f"COALESCE({alias}.{column}, {literal}) AS {column}")
+        else:
+            items.append(f"{literal} AS {column}")
+    return ',\n                    '.join(items)
+
+
+def row_hash_sql(complex_alias: str, fact_alias: str) -> str:
+    """저장된 단지/거래 행으로 transaction_row_hash를 계산하는 SQL 식 (함수 등록 필요)"""
+    complex_keys = [f"{complex_alias}.region_code", f"{complex_alias}.umd_nm", f"{complex_alias}.apt_name"]
+    fact_keys = [f"{fact_alias}.{column}" for column in ROW_HASH_FACT_COLUMNS]
+    return f"transaction_row_hash({', '.join(complex_keys + fact_keys)})"
+
+
+# 기존(비정규화) transaction_data 테이블과 같은 컬럼을 제공하는 호환 뷰
+TRANSACTION_DATA_COLUMNS = '''
+        c.apt_name,
+        c.apt_seq,
+        c.region_code,
+        c.region_name,
+        t.deal_date,
+        CAST(substr(t.deal_date, 1, 4) AS INTEGER) AS deal_year,
+        CAST(substr(t.deal_date, 6, 2) AS INTEGER) AS deal_month,
+        CAST(substr(t.deal_date, 9, 2) AS INTEGER) AS deal_day,
+        t.deal_amount,
+        t.exclusive_area,
+        t.price_per_area,
+        t.floor,
+        c.build_year,
+        c.road_name,
+        c.road_name_bonbun,
+        c.road_name_bubun,
+        c.umd_nm,
+        t.buyer_gbn,
+        t.sler_gbn,
+        t.dealing_gbn,
+        t.transaction_type,
+        t.deposit,
+        t.monthly_rent,
+        t.apt_dong,
+        t.cancel_deal_type,
+        t.cancel_deal_day,
+        c.apt_name_key,
+        c.umd_cd,
+        t.complex_id
+'''
+
+TRANSACTION_DATA_VIEW_SQL = f'''
+    CREATE VIEW transaction_data AS
+    SELECT {TRANSACTION_DATA_COLUMNS}
+    FROM transactions t
+    JOIN complexes c ON c.id = t.complex_id
+'''
+
+# 전용면적 구간 상한 (㎡, 이하): 60 이하 / 60~85 / 85~102 / 102~135 / 135 초과
+AREA_BAND_BOUNDS = (60, 85, 102, 135)
+
+
+def area_band_sql(column: str) -> str:
+    """전용면적 구간 번호 SQL 식 (0 ~ len(AREA_BAND_BOUNDS))"""
+    cases = ' '.join(f"WHEN {column} <= {bound} THEN {band}" for band, bound in enumerate(AREA_BAND_BOUNDS))
+    return f"CASE {cases} ELSE {len(AREA_BAND_BOUNDS)} END"
+
+
+# 단지 × 월 × 거래유형 × 면적 구간별 집계 (거래 저장 묶음마다 증분 갱신, 해제된 거래 제외)
+# 합계/제곱합을 보관하므로 여러 칸을 합쳐도 건수·평균·분산을 정확히 구할 수 있습니다.
+def monthly_stats_upsert_sql(source: str) -> str:
+    """source 테이블(또는 서브쿼리)의 거래를 집계해 monthly_complex_stats에 더하는 SQL"""
+    ppa = 'COALESCE(price_per_area, 0)'
+    return f'''
+        INSERT INTO monthly_complex_stats (
+            complex_id, deal_month, transaction_type, area_band, deal_count,
+            amount_sum, amount_min, amount_max, amount_sq_sum,
+            ppa_sum, ppa_min, ppa_max, ppa_sq_sum
+        )
+        SELECT
+            complex_id,
+            substr(deal_date, 1, 7),
+            COALESCE(transaction_type, '매매'),
+            {area_band_sql('exclusive_area')} AS band,
+            COUNT(*),
+            SUM(deal_amount), MIN(deal_amount), MAX(deal_amount), SUM(deal_amount * deal_amount),
+            SUM({ppa}), MIN({ppa}), MAX({ppa}), SUM({ppa} * {ppa})
+        FROM {source}
+        WHERE COALESCE(cancel_deal_type, '') != '{CANCELLED_DEAL_TYPE}'
+        GROUP BY complex_id, substr(deal_date, 1, 7), COALESCE(transaction_type, '매매'), band
+        ON CONFLICT(complex_id, deal_month, transaction_type, area_band) DO UPDATE SET
+            deal_count = deal_count + excluded.deal_count,
+            amount_sum = amount_sum + excluded.amount_sum,
+            amount_min = MIN(amount_min, excluded.amount_min),
+            amount_max = MAX(amount_max, excluded.amount_max),
+            amount_sq_sum = amount_sq_sum + excluded.amount_sq_sum,
+            ppa_sum = ppa_sum + excluded.ppa_sum,
+            ppa_min = MIN(ppa_min, excluded.ppa_min),
+            ppa_max = MAX(ppa_max, excluded.ppa_max),
+            ppa_sq_sum = ppa_sq_sum + excluded.ppa_sq_sum
+    '''
+
+
+# 거래 테이블은 메인 DB(최근 연도)와 연도별 보관 DB(db_archive.YearArchive)에 나뉘어 저장됩니다.
+# {transactions} 자리 표시자가 있는 쿼리는 partition_sql()로 대상 파일의 거래 테이블을 지정해 실행합니다.
+def partition_sql(sql: str, schema: str = 'main') -> str:
+    """거래 테이블 자리 표시자({transactions})를 schema의 거래 테이블로 바꾼 SQL"""
+    return sql.replace('{transactions}', f'{schema}.transactions')
+
+
+def transactions_table_sql(schema: str = 'main') -> str:
+    """
+    거래 테이블 생성 SQL (단지별로 모여 저장되도록 기본 키 순서 클러스터링)
+
+    row_hash는 거래 자연 키 해시로, 같은 거래를 다시 받으면 새 행 대신 기존 행을 갱신합니다.
+    보관 DB에는 단지 테이블이 없으므로 외래 키 선언은 메인 DB에만 둡니다.
+    """
+    references = ' REFERENCES complexes(id)' if schema == 'main' else ''
+    return f'''
+        CREATE TABLE IF NOT EXISTS {schema}.transactions (
+            complex_id INTEGER NOT NULL{references},
+            row_hash INTEGER NOT NULL,
+            deal_date TEXT NOT NULL,
+            deal_amount INTEGER NOT NULL,
+            exclusive_area REAL,
+            price_per_area REAL,
+            floor INTEGER,
+            buyer_gbn TEXT,
+            sler_gbn TEXT,
+            dealing_gbn TEXT,
+            transaction_type TEXT DEFAULT '매매',
+            deposit INTEGER DEFAULT 0,
+            monthly_rent INTEGER DEFAULT 0,
+            apt_dong TEXT DEFAULT '',
+            cancel_deal_type TEXT DEFAULT '',
+            cancel_deal_day TEXT DEFAULT '',
+            PRIMARY KEY (complex_id, deal_date, row_hash)
+        ) WITHOUT ROWID
+    '''
+
+
+# 저장 묶음 임시 테이블 (연결별 TEMP): 묶음을 한 번에 거래 테이블로 병합하고 집계를 갱신합니다.
+# 행마다 트리거로 집계를 갱신하면 묶음 SAVEPOINT 안에서 문장 저널이 쌓여 저장 속도가 크게 떨어집니다.
+INGEST_STAGE_SQL = '''
+    CREATE TEMP TABLE IF NOT EXISTS ingest_stage (
+        complex_id INTEGER NOT NULL,
+        row_hash INTEGER NOT NULL,
+        deal_date TEXT NOT NULL,
+        deal_amount INTEGER NOT NULL,
+        exclusive_area REAL,
+        price_per_area REAL,
+        floor INTEGER,
+        buyer_gbn TEXT,
+        sler_gbn TEXT,
+        dealing_gbn TEXT,
+        transaction_type TEXT DEFAULT '매매',
+        deposit INTEGER DEFAULT 0,
+        monthly_rent INTEGER DEFAULT 0,
+        apt_dong TEXT DEFAULT '',
+        cancel_deal_type TEXT DEFAULT '',
+        cancel_deal_day TEXT DEFAULT '',
+        is_new INTEGER NOT NULL DEFAULT 1,
+        PRIMARY KEY (complex_id, deal_date, row_hash)
+    ) WITHOUT ROWID
+'''
+
+# 갱신된 거래가 속한 (단지, 월) 집계 칸 (다시 계산 대상)
+INGEST_TOUCHED_SQL = '''
+    CREATE TEMP TABLE IF NOT EXISTS ingest_touched (
+        complex_id INTEGER NOT NULL,
+        deal_month TEXT NOT NULL,
+        PRIMARY KEY (complex_id, deal_month)
+    ) WITHOUT ROWID
+'''
+
+# 보관 연도(메인 DB 경계 연도 이전) 거래: 묶음 저장이 끝난 뒤 연도별 보관 DB에 병합
+INGEST_BACKLOG_SQL = INGEST_STAGE_SQL.replace('ingest_stage', 'ingest_backlog')
+
+# 묶음 안의 같은 거래는 마지막 레코드 기준
+STAGE_INSERT_SQL = (
+    f"INSERT OR REPLACE INTO temp.ingest_stage ({', '.join(_TRANSACTION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _TRANSACTION_COLUMNS)})"
+)
+
+STAGE_DEFER_SQL = 'INSERT OR REPLACE INTO temp.ingest_backlog SELECT * FROM temp.ingest_stage WHERE deal_date < ?'
+
+STAGE_DEFER_DELETE_SQL = 'DELETE FROM temp.ingest_stage WHERE deal_date < ?'
+
+BACKLOG_YEAR_STAGE_SQL = (
+    'INSERT INTO temp.ingest_stage SELECT * FROM temp.ingest_backlog WHERE deal_date >= ? AND deal_date < ?'
+)
+
+STAGE_MARK_EXISTING_SQL = '''
+    UPDATE temp.ingest_stage SET is_new = 0
+    WHERE EXISTS (
+        SELECT 1 FROM {transactions} t
+        WHERE t.complex_id = ingest_stage.complex_id
+          AND t.deal_date = ingest_stage.deal_date
+          AND t.row_hash = ingest_stage.row_hash
+    )
+'''
+
+STAGE_STATS_UPSERT_SQL = monthly_stats_upsert_sql('(SELECT * FROM temp.ingest_stage WHERE is_new)')
+
+# 새 거래는 추가, 같은 거래는 바뀐 속성이 있을 때만 갱신 (재조회한 달은 쓰기 없이 끝남)
+TRANSACTION_UPSERT_SQL = f'''
+    INSERT INTO {{transactions}} ({', '.join(_TRANSACTION_COLUMNS)})
+    SELECT {', '.join(_TRANSACTION_COLUMNS)} FROM temp.ingest_stage
+    WHERE true
+    ON CONFLICT(complex_id, deal_date, row_hash) DO UPDATE SET
+        {', '.join(f"{column} = excluded.{column}" for column in TRANSACTION_UPDATE_COLUMNS)}
+    WHERE {' OR '.join(f"transactions.{column} IS NOT excluded.{column}" for column in TRANSACTION_UPDATE_COLUMNS)}
+'''
+
+STAGE_TOUCHED_SQL = '''
+    INSERT OR IGNORE INTO temp.ingest_touched (complex_id, deal_month)
+    SELECT complex_id, substr(deal_date, 1, 7) FROM temp.ingest_stage WHERE NOT is_new
+'''
+
+TOUCHED_STATS_DELETE_SQL = '''
+    DELETE FROM monthly_complex_stats
+    WHERE (complex_id, deal_month) IN (SELECT complex_id, deal_month FROM temp.ingest_touched)
+'''
+
+TOUCHED_STATS_REBUILD_SQL = monthly_stats_upsert_sql('''(
+    SELECT t.* FROM temp.ingest_touched x
+    CROSS JOIN {transactions} t
+    WHERE t.complex_id = x.complex_id AND t.deal_date > x.deal_month AND t.deal_date < x.deal_month || '-99'
+)''')
+
+# 조회 쿼리 (인덱스 설계 및 실행 계획 검사 기준)
+# 단지 목록 집계와 가격 동향은 월별 집계 테이블을 읽어 거래 건수가 아닌 개월 수에 비례합니다.
+APARTMENTS_BY_DONG_SQL = '''
+    SELECT
+        c.apt_name,
+        c.region_code,
+        c.region_name,
+        c.build_year,
+        SUM(s.deal_count) as transaction_count,
+        SUM(s.ppa_sum) / SUM(s.deal_count) as avg_price,
+        MIN(s.ppa_min) as min_price,
+        MAX(s.ppa_max) as max_price
+    FROM complexes c
+    JOIN monthly_complex_stats s ON s.complex_id = c.id
+    WHERE c.region_code = ? AND c.umd_nm = ?
+    GROUP BY c.region_code, c.umd_nm, c.apt_name
+    ORDER BY transaction_count DESC, c.apt_name
+'''
+
+APARTMENTS_BY_REGION_SQL = '''
+    SELECT
+        c.apt_name,
+        c.region_code,
+        c.region_name,
+        c.build_year,
+        c.umd_nm,
+        SUM(s.deal_count) as transaction_count,
+        SUM(s.ppa_sum) / SUM(s.deal_count) as avg_price,
+        MIN(s.ppa_min) as min_price,
+        MAX(s.ppa_max) as max_price
+    FROM complexes c
+    JOIN monthly_complex_stats s ON s.complex_id = c.id
+    WHERE c.region_code = ?
+    GROUP BY c.region_code, c.umd_nm, c.apt_name
+    ORDER BY transaction_count DESC, c.apt_name
+'''
+
+PRICE_TREND_COLUMNS = '''
+    s.deal_month as month,
+    SUM(s.deal_count) as transaction_count,
+    SUM(s.amount_sum) as amount_sum,
+    MIN(s.amount_min) as min_price,
+    MAX(s.amount_max) as max_price
+'''
+
+PRICE_TREND_BY_REGION_SQL = f'''
+    SELECT {PRICE_TREND_COLUMNS}
+    FROM complexes c
+    JOIN monthly_complex_stats s ON s.complex_id = c.id
+    WHERE c.apt_name = ? AND c.region_code = ? AND s.deal_month >= ?
+    GROUP BY s.deal_month
+    ORDER BY s.deal_month
+'''
+
+PRICE_TREND_SQL = f'''
+    SELECT {PRICE_TREND_COLUMNS}
+    FROM complexes c
+    JOIN monthly_complex_stats s ON s.complex_id = c.id
+    WHERE c.apt_name = ? AND s.deal_month >= ?
+    GROUP BY s.deal_month
+    ORDER BY s.deal_month
+'''
+
+APARTMENT_TRANSACTION_COLUMNS = '''
+    t.deal_date,
+    t.deal_amount,
+    t.exclusive_area,
+    t.price_per_area,
+    t.floor,
+    c.apt_name,
+    c.region_name,
+    c.umd_nm,
+    c.build_year
+'''
+
+APARTMENT_TRANSACTIONS_SQL = f'''
+    SELECT {APARTMENT_TRANSACTION_COLUMNS}
+    FROM complexes c
+    JOIN {{transactions}} t ON t.complex_id = c.id
+    WHERE c.region_code = ? AND c.apt_name = ?
+    ORDER BY t.deal_date DESC
+'''
+
+# 정규화된 아파트명 키의 일치/접두어 검색 (정확한 매칭 실패 시)
+APARTMENT_TRANSACTIONS_BY_KEY_SQL = f'''
+    SELECT {APARTMENT_TRANSACTION_COLUMNS}
+    FROM complexes c
+    JOIN {{transactions}} t ON t.complex_id = c.id
+    WHERE c.region_code = ? AND c.apt_name_key >= ? AND c.apt_name_key < ?
+    ORDER BY t.deal_date DESC
+'''
+
+TRANSACTIONS_SINCE_BY_REGION_SQL = f'''
+    SELECT {TRANSACTION_DATA_COLUMNS}
+    FROM complexes c
+    JOIN {{transactions}} t ON t.complex_id = c.id
+    WHERE c.apt_name = ? AND c.region_code = ? AND t.deal_date >= ?
+    ORDER BY t.deal_date DESC
+'''
+
+TRANSACTIONS_SINCE_SQL = f'''
+    SELECT {TRANSACTION_DATA_COLUMNS}
+    FROM complexes c
+    JOIN {{transactions}} t ON t.complex_id = c.id
+    WHERE c.apt_name = ? AND t.deal_date >= ?
+    ORDER BY t.deal_date DESC
+'''
+
+# 관심단지 대시보드: 관심단지별 최근 거래 상위 N건과 월별 가격 동향을 한 번에 조회
+FAVORITES_LATEST_TRANSACTIONS_SQL = f'''
+    WITH ranked AS (
+        -- 순위는 키 열만으로 계산하고, 상위 N건만 전체 열을 읽음
+        SELECT
+            f.id AS favorite_id,
+            t.complex_id,
+            t.deal_date,
+            t.row_hash,
+            ROW_NUMBER() OVER (
+                PARTITION BY f.id ORDER BY t.deal_date DESC, t.row_hash DESC  -- 단지별 조회의 기본 키 역순과 같은 순서
+            ) AS recent_rank
+        FROM favorite_apartments f
+        CROSS JOIN complexes c  -- CROSS JOIN: 관심단지 → 단지 → 거래 기본 키 범위 순서 고정
+        CROSS JOIN transactions t
+        WHERE f.is_active = 1
+          AND c.apt_name = f.apt_name AND c.region_code = f.region_code
+          AND t.complex_id = c.id AND t.deal_date >= ?
+    )
+    SELECT r.favorite_id, r.recent_rank, {TRANSACTION_DATA_COLUMNS}
+    FROM ranked r
+    CROSS JOIN transactions t
+    CROSS JOIN complexes c
+    WHERE r.recent_rank <= ?
+      AND t.complex_id = r.complex_id AND t.deal_date = r.deal_date AND t.row_hash = r.row_hash
+      AND c.id = t.complex_id
+    ORDER BY r.favorite_id, r.recent_rank
+'''
+
+FAVORITES_PRICE_TREND_SQL = f'''
+    SELECT f.id AS favorite_id, {PRICE_TREND_COLUMNS}
+    FROM favorite_apartments f
+    CROSS JOIN complexes c
+    CROSS JOIN monthly_complex_stats s
+    WHERE f.is_active = 1
+      AND c.apt_name = f.apt_name AND c.region_code = f.region_code
+      AND s.complex_id = c.id AND s.deal_month >= ?
+    GROUP BY f.id, s.deal_month
+    ORDER BY f.id, s.deal_month
+'''
+
+# 단지/거래 인덱스
+# - 거래는 WITHOUT ROWID 테이블의 기본 키 (complex_id, deal_date, row_hash) 순서로 저장되어
+#   단지별 거래 조회·집계가 별도 인덱스 없이 기본 키 범위 검색으로 처리됨
+# - 단지 UNIQUE(region_code, umd_nm, apt_name)가 지역/법정동별 목록을 처리
+COMPLEX_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_complexes_region_name ON complexes(region_code, apt_name)',
+    'CREATE INDEX IF NOT EXISTS idx_complexes_region_name_key ON complexes(region_code, apt_name_key)',
+    'CREATE INDEX IF NOT EXISTS idx_complexes_name ON complexes(apt_name)',
+    'CREATE INDEX IF NOT EXISTS idx_complexes_apt_seq ON complexes(apt_seq)',
+)
+
+# 이전 스키마에서 쓰던 인덱스 (정규화 후 불필요)
+OBSOLETE_INDEXES = (
+    'idx_transaction_apt_name',
+    'idx_transaction_region',
+    'idx_transaction_date',
+    'idx_transaction_region_apt_date',
+    'idx_transaction_region_dong_apt',
+    'idx_transaction_region_name_key',
+    'idx_cache_key',  # UNIQUE(cache_key) 자동 인덱스와 중복
+)
+
+# 단지 FTS5 trigram 색인 동기화 트리거
+COMPLEX_FTS_TRIGGERS = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS complexes_ai AFTER INSERT ON complexes BEGIN
+        INSERT INTO complexes_fts(rowid, apt_name, road_address, umd_nm, region_name)
+        VALUES (new.id, new.apt_name, new.road_address, new.umd_nm, new.region_name);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS complexes_ad AFTER DELETE ON complexes BEGIN
+        INSERT INTO complexes_fts(complexes_fts, rowid, apt_name, road_address, umd_nm, region_name)
+        VALUES ('delete', old.id, old.apt_name, old.road_address, old.umd_nm, old.region_name);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS complexes_au AFTER UPDATE ON complexes BEGIN
+        INSERT INTO complexes_fts(complexes_fts, rowid, apt_name, road_address, umd_nm, region_name)
+        VALUES ('delete', old.id, old.apt_name, old.road_address, old.umd_nm, old.region_name);
+        INSERT INTO complexes_fts(rowid, apt_name, road_address, umd_nm, region_name)
+        VALUES (new.id, new.apt_name, new.road_address, new.umd_nm, new.region_name);
+    END
+    ''',
+)
+
+APARTMENT_SEARCH_COLUMNS = '''
+    c.region_code, c.region_name, c.apt_name, c.umd_nm, c.road_address, c.build_year
+'''
+
+# 단지명 > 도로명 주소 > 법정동 > 지역명 순으로 가중치
+APARTMENT_FTS_SEARCH_SQL = f'''
+    SELECT {APARTMENT_SEARCH_COLUMNS}
+    FROM complexes_fts
+    JOIN complexes c ON c.id = complexes_fts.rowid
+    WHERE complexes_fts MATCH ?
+    ORDER BY bm25(complexes_fts, 10.0, 4.0, 2.0, 1.0), c.apt_name, c.region_code, c.umd_nm
+    LIMIT ?
+'''
+
+# trigram은 3글자 이상 검색어만 색인을 사용하므로 짧은 검색어는 단지 테이블 LIKE 검색
+APARTMENT_LIKE_SEARCH_SQL = f'''
+    SELECT {APARTMENT_SEARCH_COLUMNS}
+    FROM complexes c
+    WHERE c.apt_name LIKE ? OR c.road_address LIKE ?
+    ORDER BY (c.apt_name LIKE ?) DESC, length(c.apt_name), c.apt_name, c.region_code, c.umd_nm
+    LIMIT ?
+'''
+
+# 실행 계획 검사 대상: 이름 → (쿼리, 예시 파라미터, 거래/집계 테이블을 기본 키로만 읽어야 하는지 여부)
+QUERY_PLAN_CHECKS = {
+    'apartments_by_dong': (APARTMENTS_BY_DONG_SQL, ('11680', '대치동'), True),
+    'apartments_by_region': (APARTMENTS_BY_REGION_SQL, ('11680',), True),
+    'apartment_transactions': (APARTMENT_TRANSACTIONS_SQL, ('11680', '은마'), True),
+    'apartment_transactions_by_key': (APARTMENT_TRANSACTIONS_BY_KEY_SQL, ('11680', '은마', '은마\U0010ffff'), True),
+    'transactions_since_by_region': (TRANSACTIONS_SINCE_BY_REGION_SQL, ('은마', '11680', '2024-01-01'), True),
+    'transactions_since': (TRANSACTIONS_SINCE_SQL, ('은마', '2024-01-01'), True),
+    'price_trend_by_region': (PRICE_TREND_BY_REGION_SQL, ('은마', '11680', '2024-01'), True),
+    'price_trend': (PRICE_TREND_SQL, ('은마', '2024-01'), True),
+}
+
+
 class ApartmentDatabase:
     """아파트 실거래가 데이터베이스 관리 클래스"""
 
@@ -20,12 +649,69 @@ class ApartmentDatabase:
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        self.connections = SQLiteConnectionManager.from_env(db_path)
+        self.ingest_chunk_size = int(os.getenv('DB_INGEST_CHUNK_SIZE', '5000'))
+        self.archive = YearArchive.from_env(db_path)
+        self._decode_lock = threading.Lock()
+        self._decode_stats = {'decodes': 0, 'rows': 0, 'summaries': 0, 'seconds': 0.0}
+        self.memory_cache = MemoryCacheTier.from_env()
         self.init_database()
 
+    def _connect(self):
+        """재사용 연결 컨텍스트 (정상 종료 시 커밋, 예외 시 롤백)"""
+        return self.connections.connection()
+
+    def close(self):
+        """유휴 연결 모두 닫기"""
+        self.connections.close_all()
+
+    def get_connection_statistics(self) -> Dict:
+        """연결 재사용 통계 조회"""
+        return self.connections.get_statistics()
+
+    def get_memory_cache_statistics(self) -> Dict:
+        """검색 캐시 메모리 계층 통계 조회 (적중/실패/제거)"""
+        return self.memory_cache.get_statistics()
+
+    def verify_query_plans(self) -> Dict:
+        """
+        주요 조회 쿼리의 실행 계획 검사 (EXPLAIN QUERY PLAN)
+
+        단지/거래 테이블 전체 스캔(SCAN)으로 바뀌었거나, 거래(t)/월별 집계(s) 테이블을 기본 키
+        또는 커버링 인덱스만으로 읽어야 하는 쿼리가 다른 경로를 쓰게 된 경우 regressions에 기록합니다.
+        """
+        plans = {}
+        regressions = []
+
+        try:
+            with self._connect() as conn:
+                for name, (sql, params, needs_covering) in QUERY_PLAN_CHECKS.items():
+                    details = [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {partition_sql(sql)}', params)]
+                    plans[name] = details
+
+                    scans = [detail for detail in details
+                             if detail.startswith('SCAN') and 'VIRTUAL TABLE' not in detail]
+                    fact_steps = [detail for detail in details
+                                  if detail.startswith(('SEARCH t ', 'SCAN t ', 'SEARCH s ', 'SCAN s '))]
+                    if scans:
+                        regressions.append(f"{name}: 전체 스캔 ({'; '.join(scans)})")
+                    elif needs_covering and not all('PRIMARY KEY' in detail or 'COVERING INDEX' in detail
+                                                    for detail in fact_steps):
+                        regressions.append(f"{name}: 거래/집계 테이블 기본 키/커버링 인덱스 미사용 ({'; '.join(fact_steps)})")
+
+            for regression in regressions:
+                self.logger.warning(f"⚠️ 실행 계획 회귀: {regression}")
+
+            return {'success': not regressions, 'plans': plans, 'regressions': regressions}
+
+        except Exception as e:
+            self.logger.error(f"실행 계획 검사 실패: {e}")
+            return {'success': False, 'plans': plans, 'regressions': regressions, 'error': str(e)}
+
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # 관심단지 테이블
@@ -50,50 +736,8 @@ class ApartmentDatabase:
                     )
                 ''')
                 
-                # 실거래가 데이터 테이블
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS transaction_data (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        apt_name TEXT NOT NULL,
-                        apt_seq TEXT,
-                        region_code TEXT NOT NULL,
-                        region_name TEXT NOT NULL,
-                        deal_date TEXT NOT NULL,
-                        deal_year INTEGER,
-                        deal_month INTEGER,
-                        deal_day INTEGER,
-                        deal_amount INTEGER,
-                        exclusive_area REAL,
-                        price_per_area REAL,
-                        floor INTEGER,
-                        build_year INTEGER,
-                        road_name TEXT,
-                        road_name_bonbun TEXT,
-                        road_name_bubun TEXT,
-                        umd_nm TEXT,
-                        buyer_gbn TEXT,
-                        sler_gbn TEXT,
-                        dealing_gbn TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(apt_name, apt_seq, deal_date, deal_amount)
-                    )
-                ''')
-
-                # 전월세 관련 컬럼 추가 (기존 테이블에 없는 경우에만)
-                try:
-                    cursor.execute("ALTER TABLE transaction_data ADD COLUMN transaction_type TEXT DEFAULT '매매'")
-                except sqlite3.OperationalError:
-                    pass  # 컬럼이 이미 존재함
-
-                try:
-                    cursor.execute("ALTER TABLE transaction_data ADD COLUMN deposit INTEGER DEFAULT 0")
-                except sqlite3.OperationalError:
-                    pass  # 컬럼이 이미 존재함
-
-                try:
-                    cursor.execute("ALTER TABLE transaction_data ADD COLUMN monthly_rent INTEGER DEFAULT 0")
-                except sqlite3.OperationalError:
-                    pass  # 컬럼이 이미 존재함
+                # 실거래가 데이터 (단지 + 거래 정규화 스키마)
+                self._init_transaction_schema(conn)
 
                 # 가격 변동 알림 테이블
                 cursor.execute('''
@@ -122,22 +766,34 @@ class ApartmentDatabase:
                         search_date TEXT NOT NULL,
                         total_count INTEGER NOT NULL,
                         classified_data TEXT NOT NULL, -- JSON 형태로 저장
-                        raw_data TEXT, -- JSON 형태로 저장 (선택적)
+                        raw_data BLOB, -- 법정동별 압축 묶음 (cache_codec, 이전 캐시는 JSON TEXT)
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         expires_at TIMESTAMP NOT NULL,
-                        is_valid BOOLEAN DEFAULT 1
+                        is_valid BOOLEAN DEFAULT 1,
+                        segment_type TEXT, -- 구간 캐시: 엔드포인트 (sale/rent)
+                        deal_ymd TEXT, -- 구간 캐시: 계약년월 (YYYYMM)
+                        raw_bytes INTEGER -- raw_data를 JSON으로 저장했을 때의 크기
                     )
                 ''')
+
+                # 구간 캐시/압축 크기 컬럼 추가 (이전 DB)
+                cache_columns = {row[1] for row in cursor.execute("PRAGMA table_info(search_cache)")}
+                for column, column_type in (('segment_type', 'TEXT'), ('deal_ymd', 'TEXT'), ('raw_bytes', 'INTEGER')):
+                    if column not in cache_columns:
+                        cursor.execute(f'ALTER TABLE search_cache ADD COLUMN {column} {column_type}')
                 
+                # 전국 단지 검색 색인
+                self._init_complex_search(conn)
+
                 # 인덱스 생성
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_favorite_apt_name ON favorite_apartments(apt_name)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_favorite_region ON favorite_apartments(region_code)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_transaction_apt_name ON transaction_data(apt_name)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_transaction_region ON transaction_data(region_code)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_transaction_date ON transaction_data(deal_date)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_key ON search_cache(cache_key)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_region ON search_cache(region_code)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_expires ON search_cache(expires_at)')
+
+                # 이전 스키마 인덱스 제거
+                for index_name in OBSOLETE_INDEXES:
+                    cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
                 
                 conn.commit()
                 self.logger.info("데이터베이스 초기화 완료")
@@ -146,10 +802,231 @@ class ApartmentDatabase:
             self.logger.error(f"데이터베이스 초기화 실패: {e}")
             raise
 
+    def _init_transaction_schema(self, conn: sqlite3.Connection):
+        """단지(complexes)/거래(transactions) 테이블 및 transaction_data 호환 뷰 생성"""
+        cursor = conn.cursor()
+        legacy_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'transaction_data'"
+        ).fetchone() is not None
+        transaction_columns = [row[1] for row in cursor.execute("PRAGMA table_info(transactions)")]
+        if transaction_columns and 'row_hash' not in transaction_columns:
+            # 행 해시 이전 거래 테이블 (기본 키 complex_id, deal_date, deal_amount): 새 테이블로 옮김
+            cursor.execute('DROP VIEW IF EXISTS transaction_data')
+            cursor.execute('ALTER TABLE transactions RENAME TO transactions_v1')
+
+        conn.create_function('normalize_apt_name', 1, normalize_apt_name, deterministic=True)
+        conn.create_function('format_road_address', 3, format_road_address, deterministic=True)
+        conn.create_function('transaction_row_hash', 3 + len(ROW_HASH_FACT_COLUMNS), transaction_row_hash,
+                             deterministic=True)
+
+        # 단지 테이블 (단지 정보는 여기에만 저장)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS complexes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                region_code TEXT NOT NULL,
+                umd_nm TEXT NOT NULL DEFAULT '',
+                apt_name TEXT NOT NULL,
+                apt_seq TEXT NOT NULL DEFAULT '',
+                umd_cd TEXT NOT NULL DEFAULT '',
+                region_name TEXT NOT NULL DEFAULT '',
+                road_name TEXT NOT NULL DEFAULT '',
+                road_name_bonbun TEXT NOT NULL DEFAULT '',
+                road_name_bubun TEXT NOT NULL DEFAULT '',
+                build_year INTEGER DEFAULT 0,
+                apt_name_key TEXT NOT NULL DEFAULT '',
+                road_address TEXT NOT NULL DEFAULT '',
+                UNIQUE(region_code, umd_nm, apt_name)
+            )
+        ''')
+
+        # 거래 테이블 (최근 연도분, 이전 연도는 보관 DB)
+        cursor.execute(transactions_table_sql())
+
+        for index_sql in COMPLEX_INDEXES:
+            cursor.execute(index_sql)
+
+        # 단지 × 월 × 거래유형 × 면적 구간별 집계 테이블
+        stats_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'monthly_complex_stats'"
+        ).fetchone() is not None
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS monthly_complex_stats (
+                complex_id INTEGER NOT NULL,
+                deal_month TEXT NOT NULL, -- YYYY-MM
+                transaction_type TEXT NOT NULL,
+                area_band INTEGER NOT NULL, -- AREA_BAND_BOUNDS 구간 번호
+                deal_count INTEGER NOT NULL,
+                amount_sum INTEGER NOT NULL,
+                amount_min INTEGER,
+                amount_max INTEGER,
+                amount_sq_sum REAL NOT NULL,
+                ppa_sum REAL NOT NULL,
+                ppa_min REAL,
+                ppa_max REAL,
+                ppa_sq_sum REAL NOT NULL,
+                PRIMARY KEY (complex_id, deal_month, transaction_type, area_band)
+            ) WITHOUT ROWID
+        ''')
+
+        if legacy_exists:
+            self._migrate_legacy_transaction_data(conn)
+        if transaction_columns and 'row_hash' not in transaction_columns:
+            self._migrate_transactions_v1(conn)
+
+        if not stats_exists:
+            cursor.execute(monthly_stats_upsert_sql('transactions'))
+            if cursor.rowcount > 0:
+                self.logger.info(f"월별 단지 집계 채우기 완료: {cursor.rowcount}개 구간")
+
+        cursor.execute('DROP VIEW IF EXISTS transaction_data')
+        cursor.execute(TRANSACTION_DATA_VIEW_SQL)
+
+    def _migrate_legacy_transaction_data(self, conn: sqlite3.Connection):
+        """이전 버전의 비정규화 transaction_data 테이블을 단지/거래 테이블로 이관 후 삭제"""
+        cursor = conn.cursor()
+        self.logger.info("🔄 transaction_data → complexes/transactions 이관 시작")
+
+        legacy_columns = {row[1] for row in cursor.execute("PRAGMA table_info(transaction_data)")}
+
+        cursor.execute(f'''
+            INSERT OR IGNORE INTO complexes ({', '.join(_COMPLEX_INSERT_COLUMNS)})
+            SELECT
+                region_code,
+                COALESCE(umd_nm, ''),
+                apt_name,
+                COALESCE(MAX(NULLIF(apt_seq, '')), ''),
+                '',
+                COALESCE(MAX(NULLIF(region_name, '')), ''),
+                COALESCE(MAX(road_name), ''),
+                COALESCE(MAX(road_name_bonbun), ''),
+                COALESCE(MAX(road_name_bubun), ''),
+                COALESCE(MAX(build_year), 0),
+                normalize_apt_name(apt_name),
+                format_road_address(MAX(road_name), MAX(road_name_bonbun), MAX(road_name_bubun))
+            FROM transaction_data
+            GROUP BY region_code, COALESCE(umd_nm, ''), apt_name
+        ''')
+        complex_count = cursor.rowcount
+
+        cursor.execute(f'''
+            INSERT OR IGNORE INTO transactions ({', '.join(_TRANSACTION_COLUMNS)})
+            SELECT src.complex_id, {row_hash_sql('src', 'src')}, {', '.join(f"src.{column}" for column in _TRANSACTION_COLUMNS[2:])}
+            FROM (
+                SELECT
+                    c.id AS complex_id, c.region_code, c.umd_nm, c.apt_name,
+                    {_fact_select_sql('t', legacy_columns)}
+                FROM transaction_data t
+                JOIN complexes c
+                  ON c.region_code = t.region_code AND c.umd_nm = COALESCE(t.umd_nm, '') AND c.apt_name = t.apt_name
+            ) src
+        ''')
+        transaction_count = cursor.rowcount
+
+        cursor.execute('DROP TABLE transaction_data')
+
+        # 단지 테이블로 대체된 이전 검색 디렉토리
+        cursor.execute('DROP TABLE IF EXISTS apartment_directory_fts')
+        cursor.execute('DROP TABLE IF EXISTS apartment_directory')
+
+        conn.commit()
+        self.logger.info(f"✅ 이관 완료: 단지 {complex_count}개, 거래 {transaction_count}건")
+
+    def _migrate_transactions_v1(self, conn: sqlite3.Connection):
+        """행 해시 이전 거래 테이블(transactions_v1)을 행 해시 기본 키 테이블로 옮긴 후 삭제"""
+        cursor = conn.cursor()
+        self.logger.info("🔄 거래 테이블 행 해시 키 전환 시작")
+
+        v1_columns = {row[1] for row in cursor.execute("PRAGMA table_info(transactions_v1)")}
+        cursor.execute(f'''
+            INSERT OR IGNORE INTO transactions ({', '.join(_TRANSACTION_COLUMNS)})
+            SELECT src.complex_id, {row_hash_sql('src', 'src')}, {', '.join(f"src.{column}" for column in _TRANSACTION_COLUMNS[2:])}
+            FROM (
+                SELECT
+                    c.id AS complex_id, c.region_code, c.umd_nm, c.apt_name,
+                    {_fact_select_sql('t', v1_columns)}
+                FROM transactions_v1 t
+                JOIN complexes c ON c.id = t.complex_id
+            ) src
+        ''')
+        transaction_count = cursor.rowcount
+
+        cursor.execute('DROP TABLE transactions_v1')
+        conn.commit()
+        self.logger.info(f"✅ 거래 테이블 전환 완료: {transaction_count}건")
+
+    def _init_complex_search(self, conn: sqlite3.Connection):
+        """단지 FTS5 trigram 색인 생성 (trigram 미지원 SQLite는 LIKE 검색으로 대체)"""
+        cursor = conn.cursor()
+        fts_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'complexes_fts'"
+        ).fetchone() is not None
+
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS complexes_fts USING fts5(
+                    apt_name, road_address, umd_nm, region_name,
+                    content='complexes', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            for trigger_sql in COMPLEX_FTS_TRIGGERS:
+                cursor.execute(trigger_sql)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            self.fts_enabled = False
+            self.logger.warning(f"FTS5 trigram 미지원 - 단지 검색은 LIKE로 동작합니다: {e}")
+            return
+
+        # 색인이 새로 만들어진 경우 기존 단지로 채우기
+        if not fts_exists:
+            cursor.execute("INSERT INTO complexes_fts(complexes_fts) VALUES ('rebuild')")
+
+    def _resolve_complex_ids(self, conn: sqlite3.Connection, rows: List[tuple], complex_ids: Dict) -> List[tuple]:
+        """묶음의 단지를 upsert하고 거래 행에 complex_id를 붙여 반환 (트리거로 FTS 색인 동기화)"""
+        conn.executemany(COMPLEX_UPSERT_SQL, {complex_values for complex_values, _ in rows})
+
+        fact_rows = []
+        for complex_values, fact_values in rows:
+            key = complex_values[:3]  # (region_code, umd_nm, apt_name)
+            complex_id = complex_ids.get(key)
+            if complex_id is None:
+                complex_id = conn.execute(COMPLEX_ID_SQL, key).fetchone()[0]
+                complex_ids[key] = complex_id
+            fact_rows.append((complex_id,) + fact_values)
+        return fact_rows
+
+    def search_apartments(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        전국 단지 검색 (단지명/도로명 주소, 로컬 데이터만 사용)
+
+        3글자 이상 검색어는 FTS5 trigram 색인에서 bm25 순위로, 그보다 짧은 검색어는
+        단지 디렉토리 LIKE 검색으로 조회합니다. FTS 검색에서 띄어쓴 단어는 모두 포함되어야 합니다.
+        """
+        terms = query.split() if query else []
+        if not terms:
+            return []
+
+        try:
+            with self._connect() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+
+                if self.fts_enabled and all(len(term) >= 3 for term in terms):
+                    match = ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+                    cursor.execute(APARTMENT_FTS_SEARCH_SQL, (match, limit))
+                else:
+                    phrase = f"%{' '.join(terms)}%"
+                    cursor.execute(APARTMENT_LIKE_SEARCH_SQL, (phrase, phrase, f"{terms[0]}%", limit))
+
+                return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            self.logger.error(f"단지 검색 실패: {e}")
+            return []
+
     def add_favorite_apartment(self, apt_data: Dict) -> bool:
         """관심단지 추가"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -184,7 +1061,7 @@ class ApartmentDatabase:
     def check_favorite_exists(self, apt_name: str, region_code: str) -> bool:
         """관심단지 중복 확인"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -202,7 +1079,7 @@ class ApartmentDatabase:
     def get_favorite_apartments(self) -> List[Dict]:
         """관심단지 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -222,7 +1099,7 @@ class ApartmentDatabase:
     def remove_favorite_apartment(self, apt_name: str, region_code: str) -> bool:
         """관심단지 제거"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -240,94 +1117,244 @@ class ApartmentDatabase:
             return False
 
     def save_transaction_data(self, transactions) -> int:
-        """실거래가 데이터 저장"""
-        saved_count = 0
-
-        # 단일 딕셔너리인 경우 리스트로 변환
-        if isinstance(transactions, dict):
+        """실거래가 데이터 저장 (새로 추가된 건수 반환, 중복은 제외)"""
+        # 단일 거래 레코드(dict 또는 Transaction)인 경우 리스트로 변환
+        if isinstance(transactions, Mapping):
             transactions = [transactions]
-        elif not isinstance(transactions, list):
+        elif isinstance(transactions, (str, bytes)) or not isinstance(transactions, Iterable):
             self.logger.error(f"잘못된 데이터 타입: {type(transactions)}")
             return 0
 
+        return self.ingest_transactions(transactions)['inserted']
+
+    def ingest_transactions(self, transactions: Iterable, chunk_size: int = None) -> Dict:
+        """
+        거래 데이터 일괄 저장
+
+        레코드를 chunk_size 단위로 묶어 executemany로 넣고, 전체를 하나의 트랜잭션으로
+        커밋합니다. 리스트뿐 아니라 제너레이터도 받을 수 있어 전체를 메모리에 모을 필요가 없습니다.
+        거래는 행 해시(거래 자연 키) 기준 INSERT ... ON CONFLICT DO UPDATE로 병합하므로 같은 달을
+        다시 받아도 행이 늘지 않고, 나중에 들어온 해제 정보 등 바뀐 속성만 갱신(updated)됩니다.
+        바뀐 것이 없는 거래는 duplicates로 집계됩니다.
+
+        Returns:
+            {'success', 'total', 'inserted', 'updated', 'duplicates', 'failed'}
+        """
+        chunk_size = max(1, chunk_size or self.ingest_chunk_size)
+        result = {'success': True, 'total': 0, 'inserted': 0, 'updated': 0, 'duplicates': 0, 'failed': 0}
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._connect() as conn:
+                conn.execute(INGEST_STAGE_SQL)
+                conn.execute(INGEST_TOUCHED_SQL)
+                conn.execute(INGEST_BACKLOG_SQL)
+                owns_transaction = not conn.in_transaction
+                if owns_transaction:
+                    conn.execute('BEGIN IMMEDIATE')  # 쓰기 잠금을 먼저 잡아 중간 잠금 승격 실패 방지
+
+                # 보관 DB가 있으면 경계 연도 이전 거래는 보관 DB로 (바깥 트랜잭션 안에서는 ATTACH할 수 없어 메인 DB에 저장)
+                boundary_year = self.archive.boundary_year() if owns_transaction else None
+                defer_before = str(boundary_year) if boundary_year else None
 
+                chunk = []
+                deferred = 0
+                complex_ids = {}  # (region_code, umd_nm, apt_name) → complexes.id
                 for tx in transactions:
+                    result['total'] += 1
                     try:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO transaction_data
-                            (apt_name, apt_seq, region_code, region_name, deal_date,
-                             deal_year, deal_month, deal_day, deal_amount, exclusive_area,
-                             price_per_area, floor, build_year, road_name, road_name_bonbun,
-                             road_name_bubun, umd_nm, buyer_gbn, sler_gbn, dealing_gbn,
-                             transaction_type, deposit, monthly_rent)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            tx.get('apt_name', ''),
-                            tx.get('apt_seq', ''),
-                            tx.get('region_code', ''),
-                            tx.get('region_name', ''),
-                            tx.get('deal_date', ''),
-                            tx.get('deal_year', 0),
-                            tx.get('deal_month', 0),
-                            tx.get('deal_day', 0),
-                            tx.get('deal_amount', 0),
-                            tx.get('exclusive_area', 0.0),
-                            tx.get('price_per_area', 0.0),
-                            tx.get('floor', 0),
-                            tx.get('build_year', 0),
-                            tx.get('road_name', ''),
-                            tx.get('road_name_bonbun', ''),
-                            tx.get('road_name_bubun', ''),
-                            tx.get('umd_nm', ''),
-                            tx.get('buyer_gbn', ''),
-                            tx.get('sler_gbn', ''),
-                            tx.get('dealing_gbn', ''),
-                            tx.get('transaction_type', '매매'),
-                            tx.get('deposit', 0),
-                            tx.get('monthly_rent', 0)
-                        ))
-                        saved_count += 1
-                        
+                        chunk.append(_transaction_row(tx))
                     except Exception as e:
-                        self.logger.warning(f"거래 데이터 저장 실패: {tx.get('apt_name')} - {e}")
+                        result['failed'] += 1
+                        self.logger.warning(f"거래 데이터 변환 실패: {type(tx).__name__} - {e}")
                         continue
-                
-                conn.commit()
-                self.logger.info(f"{saved_count}건의 거래 데이터 저장 완료")
-                
+
+                    if len(chunk) >= chunk_size:
+                        deferred += self._insert_transaction_chunk(conn, chunk, result, complex_ids, defer_before)
+                        chunk = []
+
+                if chunk:
+                    deferred += self._insert_transaction_chunk(conn, chunk, result, complex_ids, defer_before)
+
+                if deferred:
+                    self._merge_backlog(conn, deferred, result)
+
+            self.logger.info(
+                f"{result['inserted']}건의 거래 데이터 저장 완료 "
+                f"(전체 {result['total']}건, 갱신 {result['updated']}건, 중복 {result['duplicates']}건, "
+                f"실패 {result['failed']}건)"
+            )
+
         except Exception as e:
             self.logger.error(f"거래 데이터 저장 실패: {e}")
-            
-        return saved_count
+            result.update({'success': False, 'inserted': 0, 'updated': 0, 'error': str(e)})
+
+        return result
+
+    def _insert_transaction_chunk(self, conn: sqlite3.Connection, rows: List[tuple], result: Dict, complex_ids: Dict,
+                                  defer_before: str = None) -> int:
+        """한 묶음 저장 (실패 시 해당 묶음만 되돌리고 한 건씩 재시도, 보관 연도로 미룬 건수 반환)"""
+        fact_rows = self._resolve_complex_ids(conn, rows, complex_ids)
+
+        failed = 0
+        conn.execute('SAVEPOINT ingest_chunk')
+        try:
+            inserted, updated, deferred = self._merge_fact_rows(conn, fact_rows, defer_before)
+            conn.execute('RELEASE SAVEPOINT ingest_chunk')
+        except sqlite3.Error as e:
+            conn.execute('ROLLBACK TO SAVEPOINT ingest_chunk')
+            conn.execute('RELEASE SAVEPOINT ingest_chunk')
+            self.logger.warning(f"일괄 저장 실패, 건별 재시도: {e}")
+            inserted = updated = deferred = 0
+            for (complex_values, _), fact_row in zip(rows, fact_rows):
+                conn.execute('SAVEPOINT ingest_row')
+                try:
+                    row_inserted, row_updated, row_deferred = self._merge_fact_rows(conn, [fact_row], defer_before)
+                    conn.execute('RELEASE SAVEPOINT ingest_row')
+                    inserted += row_inserted
+                    updated += row_updated
+                    deferred += row_deferred
+                except sqlite3.Error as row_error:
+                    conn.execute('ROLLBACK TO SAVEPOINT ingest_row')
+                    conn.execute('RELEASE SAVEPOINT ingest_row')
+                    failed += 1
+                    self.logger.warning(f"거래 데이터 저장 실패: {complex_values[2]} - {row_error}")
+
+        result['inserted'] += inserted
+        result['updated'] += updated
+        result['duplicates'] += len(rows) - inserted - updated - deferred - failed
+        result['failed'] += failed
+        return deferred
+
+    def _merge_fact_rows(self, conn: sqlite3.Connection, fact_rows: List[tuple], defer_before: str = None) -> tuple:
+        """
+        임시 테이블을 거쳐 거래를 메인 DB에 병합 (추가, 갱신, 보관 연도로 미룬 건수 반환)
+
+        defer_before(YYYY) 이전 거래는 temp.ingest_backlog로 옮겨 두었다가 묶음 저장이 끝난 뒤
+        _merge_backlog에서 연도별 보관 DB에 병합합니다.
+        """
+        try:
+            conn.executemany(STAGE_INSERT_SQL, fact_rows)
+            deferred = 0
+            if defer_before:
+                conn.execute(STAGE_DEFER_SQL, (defer_before,))
+                deferred = conn.execute(STAGE_DEFER_DELETE_SQL, (defer_before,)).rowcount
+
+            inserted, updated = self._merge_staged(conn)
+            return inserted, updated, deferred
+        finally:
+            conn.execute('DELETE FROM temp.ingest_stage')
+            conn.execute('DELETE FROM temp.ingest_touched')
+
+    def _merge_staged(self, conn: sqlite3.Connection, schema: str = 'main') -> tuple:
+        """
+        temp.ingest_stage의 거래를 schema의 거래 테이블에 병합하고 월별 집계 갱신 (추가 건수, 갱신 건수 반환)
+
+        새 거래는 집계에 바로 더하고, 이미 있던 거래가 갱신된 경우에만 해당 (단지, 월) 집계를
+        거래 테이블에서 다시 계산합니다 (해제된 거래는 최솟값/최댓값에서도 빠져야 하므로).
+        한 달의 거래는 항상 같은 파일에 있으므로 다시 계산할 때 schema의 거래 테이블만 읽습니다.
+        """
+        existing = conn.execute(partition_sql(STAGE_MARK_EXISTING_SQL, schema)).rowcount
+        staged = conn.execute('SELECT COUNT(*) FROM temp.ingest_stage').fetchone()[0]
+
+        conn.execute(STAGE_STATS_UPSERT_SQL)
+        changed = conn.execute(partition_sql(TRANSACTION_UPSERT_SQL, schema)).rowcount
+        inserted = staged - existing
+        updated = changed - inserted
+
+        if updated:
+            conn.execute(STAGE_TOUCHED_SQL)
+            conn.execute(TOUCHED_STATS_DELETE_SQL)
+            conn.execute(partition_sql(TOUCHED_STATS_REBUILD_SQL, schema))
+        return inserted, updated
+
+    def _merge_backlog(self, conn: sqlite3.Connection, deferred: int, result: Dict):
+        """
+        보관 연도 거래를 연도별 보관 DB에 병합
+
+        ATTACH는 트랜잭션 밖에서만 가능하므로 메인 DB 저장분을 먼저 커밋하고, 보관 연도마다
+        보관 DB와 월별 집계를 한 트랜잭션으로 커밋합니다. 실패한 연도의 거래는 failed로 집계됩니다.
+        """
+        conn.commit()
+        years = sorted(
+            (int(row[0]) for row in conn.execute('SELECT DISTINCT substr(deal_date, 1, 4) FROM temp.ingest_backlog')),
+            reverse=True
+        )
+
+        handled = 0
+        for year in years:
+            staged = 0
+            try:
+                with self.archive.attached(conn, year, create=True) as schema:
+                    conn.execute(transactions_table_sql(schema))
+                    conn.execute('BEGIN IMMEDIATE')
+                    staged = conn.execute(BACKLOG_YEAR_STAGE_SQL, (str(year), str(year + 1))).rowcount
+                    inserted, updated = self._merge_staged(conn, schema)
+                    conn.execute('DELETE FROM temp.ingest_stage')
+                    conn.execute('DELETE FROM temp.ingest_touched')
+                    conn.commit()
+
+                result['inserted'] += inserted
+                result['updated'] += updated
+                handled += inserted + updated
+                self.logger.info(f"🗄️ {year}년 보관 DB 저장: 추가 {inserted}건, 갱신 {updated}건")
+
+            except (sqlite3.Error, OSError) as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                if not staged:
+                    staged = conn.execute(
+                        'SELECT COUNT(*) FROM temp.ingest_backlog WHERE deal_date >= ? AND deal_date < ?',
+                        (str(year), str(year + 1))
+                    ).fetchone()[0]
+                result['failed'] += staged
+                handled += staged
+                self.logger.warning(f"{year}년 보관 DB 저장 실패: {e}")
+
+        result['duplicates'] += deferred - handled
+        conn.execute('DELETE FROM temp.ingest_backlog')
+
+    def _query_partitions(self, conn: sqlite3.Connection, sql: str, params: tuple,
+                          start_date: str = None, end_date: str = None) -> List:
+        """
+        거래 테이블 자리 표시자 쿼리를 메인 DB와 조회 기간에 걸치는 보관 DB에서 실행해 결과 합치기
+
+        보관 DB는 기간(YYYY-MM-DD, 양 끝 포함)에 해당하는 연도 파일만 하나씩 ATTACH했다가 바로
+        DETACH합니다. 쿼리는 deal_date 내림차순이어야 하며 합친 결과도 같은 순서(sqlite3.Row 행)로 반환합니다.
+        """
+        rows = conn.execute(partition_sql(sql), params).fetchall()
+        years = self.archive.years_in_range(start_date, end_date)
+        if not years:
+            return rows
+        if conn.in_transaction:
+            self.logger.warning("트랜잭션 중에는 보관 DB를 ATTACH할 수 없어 메인 DB만 조회합니다")
+            return rows
+
+        for year in years:
+            with self.archive.attached(conn, year) as schema:
+                rows.extend(conn.execute(partition_sql(sql, schema), params).fetchall())
+
+        # 보관 DB는 메인 DB보다 이전 연도라 대개 이미 정렬되어 있음 (안정 정렬로 같은 날짜 순서 유지)
+        rows.sort(key=lambda row: row['deal_date'], reverse=True)
+        return rows
 
     def get_apartment_transactions_old(self, apt_name: str, region_code: str = None, months: int = 12) -> List[Dict]:
         """특정 아파트의 거래 내역 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
                 
                 # 날짜 조건 계산
                 from datetime import datetime, timedelta
                 start_date = (datetime.now() - timedelta(days=30 * months)).strftime('%Y-%m-%d')
                 
+                # 시작일이 속한 연도 이후의 보관 DB만 조회
                 if region_code:
-                    cursor.execute('''
-                        SELECT * FROM transaction_data 
-                        WHERE apt_name = ? AND region_code = ? AND deal_date >= ?
-                        ORDER BY deal_date DESC
-                    ''', (apt_name, region_code, start_date))
+                    rows = self._query_partitions(conn, TRANSACTIONS_SINCE_BY_REGION_SQL,
+                                                  (apt_name, region_code, start_date), start_date=start_date)
                 else:
-                    cursor.execute('''
-                        SELECT * FROM transaction_data 
-                        WHERE apt_name = ? AND deal_date >= ?
-                        ORDER BY deal_date DESC
-                    ''', (apt_name, start_date))
-                
-                rows = cursor.fetchall()
+                    rows = self._query_partitions(conn, TRANSACTIONS_SINCE_SQL, (apt_name, start_date),
+                                                  start_date=start_date)
+
                 return [dict(row) for row in rows]
                 
         except Exception as e:
@@ -335,86 +1362,120 @@ class ApartmentDatabase:
             return []
 
     def get_price_trend(self, apt_name: str, region_code: str = None, months: int = 12) -> Dict:
-        """아파트 가격 동향 분석"""
-        transactions = self.get_apartment_transactions_old(apt_name, region_code, months)
-        
-        if not transactions:
+        """아파트 가격 동향 분석 (월별 단지 집계 테이블 기준)"""
+        try:
+            with self._connect() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+
+                # 시작 월 계산 (집계 단위가 월이므로 시작 월 전체 포함)
+                from datetime import datetime, timedelta
+                start_month = (datetime.now() - timedelta(days=30 * months)).strftime('%Y-%m')
+
+                if region_code:
+                    cursor.execute(PRICE_TREND_BY_REGION_SQL, (apt_name, region_code, start_month))
+                else:
+                    cursor.execute(PRICE_TREND_SQL, (apt_name, start_month))
+                monthly_rows = cursor.fetchall()
+
+        except Exception as e:
+            self.logger.error(f"가격 동향 조회 실패: {e}")
+            monthly_rows = []
+
+        return self._build_price_trend(monthly_rows)
+
+    @staticmethod
+    def _build_price_trend(monthly_rows: List) -> Dict:
+        """월별 집계 행(month, transaction_count, amount_sum, min_price, max_price)으로 동향/요약 생성"""
+        if not monthly_rows:
             return {'trend': [], 'summary': {}}
-        
-        # 월별 평균 가격 계산 (deal_amount 기준, 만원 단위)
-        monthly_data = {}
-        for tx in transactions:
-            month_key = f"{tx['deal_year']}-{tx['deal_month']:02d}"
-            if month_key not in monthly_data:
-                monthly_data[month_key] = []
-            monthly_data[month_key].append(tx['deal_amount'])
-        
-        # 월별 통계 계산
+
+        # 월별 통계 (deal_amount 기준, 만원 단위)
         trend_data = []
-        for month, prices in sorted(monthly_data.items()):
+        for row in monthly_rows:
             trend_data.append({
-                'month': month,
-                'avg_price': sum(prices) / len(prices),
-                'min_price': min(prices),
-                'max_price': max(prices),
-                'transaction_count': len(prices)
+                'month': row['month'],
+                'avg_price': row['amount_sum'] / row['transaction_count'],
+                'min_price': row['min_price'],
+                'max_price': row['max_price'],
+                'transaction_count': row['transaction_count']
             })
-        
+
         # 요약 통계 (deal_amount 기준, 만원 단위)
-        all_prices = [tx['deal_amount'] for tx in transactions]
+        total_count = sum(row['transaction_count'] for row in monthly_rows)
         summary = {
-            'total_transactions': len(transactions),
-            'avg_price': sum(all_prices) / len(all_prices),
-            'min_price': min(all_prices),
-            'max_price': max(all_prices),
+            'total_transactions': total_count,
+            'avg_price': sum(row['amount_sum'] for row in monthly_rows) / total_count,
+            'min_price': min(row['min_price'] for row in monthly_rows),
+            'max_price': max(row['max_price'] for row in monthly_rows),
             'price_change': 0
         }
-        
+
         # 가격 변동률 계산
         if len(trend_data) >= 2:
             first_price = trend_data[0]['avg_price']
             last_price = trend_data[-1]['avg_price']
             summary['price_change'] = ((last_price - first_price) / first_price) * 100
-        
+
         return {
             'trend': trend_data,
             'summary': summary
         }
 
-    def get_favorite_apartments_with_latest_data(self) -> List[Dict]:
-        """관심단지와 최신 거래 데이터 조회"""
-        favorites = self.get_favorite_apartments()
+    def get_favorite_apartments_with_latest_data(self, recent_limit: int = 5) -> List[Dict]:
+        """
+        관심단지와 최신 거래 데이터 조회
+
+        관심단지 수와 관계없이 한 연결에서 세 번의 조회로 끝납니다.
+        최근 3개월 거래 상위 recent_limit건은 윈도 함수(ROW_NUMBER)로, 6개월 가격 동향은
+        월별 단지 집계를 관심단지별로 묶어 가져옵니다.
+        """
+        from datetime import datetime, timedelta
+        now = datetime.now()
+        recent_since = (now - timedelta(days=30 * 3)).strftime('%Y-%m-%d')
+        trend_since = (now - timedelta(days=30 * 6)).strftime('%Y-%m')
+
+        favorites = []
+        latest_by_favorite = {}
+        trend_rows_by_favorite = {}
+        try:
+            with self._connect() as conn:
+                favorites = self.get_favorite_apartments()  # 같은 연결 재사용
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+
+                cursor.execute(FAVORITES_LATEST_TRANSACTIONS_SQL, (recent_since, recent_limit))
+                for row in cursor.fetchall():
+                    tx = dict(row)
+                    favorite_id = tx.pop('favorite_id')
+                    tx.pop('recent_rank')
+                    latest_by_favorite.setdefault(favorite_id, []).append(tx)
+
+                cursor.execute(FAVORITES_PRICE_TREND_SQL, (trend_since,))
+                for row in cursor.fetchall():
+                    trend_rows_by_favorite.setdefault(row['favorite_id'], []).append(row)
+
+        except Exception as e:
+            self.logger.error(f"관심단지 거래 데이터 조회 실패: {e}")
+
         result = []
-        
         for fav in favorites:
-            # 최신 거래 데이터 조회
-            latest_transactions = self.get_apartment_transactions_old(
-                fav['apt_name'], 
-                fav['region_code'], 
-                months=3
-            )
-            
-            # 가격 동향 분석
-            price_trend = self.get_price_trend(
-                fav['apt_name'], 
-                fav['region_code'], 
-                months=6
-            )
-            
+            latest_transactions = latest_by_favorite.get(fav['id'], [])
+
             fav_data = dict(fav)
-            fav_data['latest_transactions'] = latest_transactions[:5]  # 최근 5건
-            fav_data['price_trend'] = price_trend
+            fav_data['latest_transactions'] = latest_transactions
+            fav_data['price_trend'] = self._build_price_trend(trend_rows_by_favorite.get(fav['id'], []))
             fav_data['has_recent_data'] = len(latest_transactions) > 0
-            
+
             result.append(fav_data)
-        
+
         return result
 
     def add_price_alert(self, apt_name: str, region_code: str, alert_type: str, 
                        threshold_value: float, notes: str = "") -> bool:
         """가격 알림 설정"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -434,7 +1495,7 @@ class ApartmentDatabase:
     def get_active_alerts(self) -> List[Dict]:
         """활성 알림 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -460,20 +1521,21 @@ class ApartmentDatabase:
                          raw_data: List[Dict] = None, cache_hours: int = 24) -> bool:
         """검색 결과 캐시 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cache_key = self.generate_cache_key(region_code, months, search_date)
                 
-                # 만료 시간 계산
+                # 만료 시간 계산 (조회 쿼리의 datetime('now')와 같은 UTC 기준)
                 from datetime import datetime, timedelta
-                expires_at = (datetime.now() + timedelta(hours=cache_hours)).strftime('%Y-%m-%d %H:%M:%S')
+                expires_at = (datetime.utcnow() + timedelta(hours=cache_hours)).strftime('%Y-%m-%d %H:%M:%S')
+                encoded = self._encode_cache_rows(raw_data) if raw_data else None
                 
                 cursor.execute('''
                     INSERT OR REPLACE INTO search_cache 
                     (cache_key, region_code, region_name, months, search_date, 
-                     total_count, classified_data, raw_data, expires_at, is_valid)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                     total_count, classified_data, raw_data, expires_at, is_valid, raw_bytes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?)
                 ''', (
                     cache_key,
                     region_code,
@@ -481,12 +1543,14 @@ class ApartmentDatabase:
                     months,
                     search_date,
                     total_count,
-                    json.dumps(classified_data, ensure_ascii=False),
-                    json.dumps(raw_data, ensure_ascii=False) if raw_data else None,
-                    expires_at
+                    json.dumps(classified_data, ensure_ascii=False, default=transaction_json_default),
+                    encoded[0] if encoded else None,
+                    expires_at,
+                    encoded[1] if encoded else None
                 ))
                 
                 conn.commit()
+                self.memory_cache.invalidate(cache_key)
                 self.logger.info(f"검색 결과 캐시 저장: {cache_key}")
                 return True
                 
@@ -494,45 +1558,193 @@ class ApartmentDatabase:
             self.logger.error(f"검색 결과 캐시 저장 실패: {e}")
             return False
 
-    def get_search_cache(self, region_code: str, months: int, search_date: str) -> Optional[Dict]:
-        """검색 결과 캐시 조회"""
+    def get_search_cache(self, region_code: str, months: int, search_date: str,
+                         dong: str = None) -> Optional[Dict]:
+        """
+        검색 결과 캐시 조회 (dong을 주면 raw_data는 해당 법정동 묶음만 해제)
+
+        메모리 계층(memory_cache)에 있는 행은 SQLite를 거치지 않고 바로 해제합니다.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cache_key = self.generate_cache_key(region_code, months, search_date)
-                
-                cursor.execute('''
-                    SELECT * FROM search_cache 
-                    WHERE cache_key = ? AND is_valid = 1 AND expires_at > datetime('now')
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                ''', (cache_key,))
-                
-                row = cursor.fetchone()
-                if row:
-                    cache_data = dict(row)
-                    cache_data['classified_data'] = json.loads(cache_data['classified_data'])
-                    if cache_data['raw_data']:
-                        cache_data['raw_data'] = json.loads(cache_data['raw_data'])
-                    else:
-                        cache_data['raw_data'] = []
-                    
-                    self.logger.info(f"검색 결과 캐시 조회 성공: {cache_key}")
-                    return cache_data
-                else:
-                    self.logger.info(f"검색 결과 캐시 없음: {cache_key}")
-                    return None
+            cache_key = self.generate_cache_key(region_code, months, search_date)
+            row = self.memory_cache.get(cache_key)
+
+            if row is None:
+                with self._connect() as conn:
+                    conn.row_factory = sqlite3.Row
+                    cursor = conn.cursor()
+
+                    cursor.execute('''
+                        SELECT * FROM search_cache 
+                        WHERE cache_key = ? AND is_valid = 1 AND expires_at > datetime('now')
+                        ORDER BY created_at DESC
+                        LIMIT 1
+                    ''', (cache_key,))
+
+                    row = cursor.fetchone()
+                    if row:
+                        row = dict(row)
+                        self.memory_cache.put(cache_key, row)
+
+            if row:
+                cache_data = dict(row)
+                cache_data['classified_data'] = json.loads(cache_data['classified_data'])
+                cache_data['raw_data'] = self._decode_cache_rows(cache_data['raw_data'], dong)
+
+                self.logger.info(f"검색 결과 캐시 조회 성공: {cache_key}")
+                return cache_data
+            else:
+                self.logger.info(f"검색 결과 캐시 없음: {cache_key}")
+                return None
                 
         except Exception as e:
             self.logger.error(f"검색 결과 캐시 조회 실패: {e}")
             return None
 
+    def generate_segment_cache_key(self, region_code: str, segment_type: str, deal_ymd: str) -> str:
+        """구간 캐시 키 생성 (지역 × 엔드포인트 × 계약년월)"""
+        return f"{region_code}_{segment_type}_{deal_ymd}"
+
+    def save_search_segments(self, region_code: str, region_name: str, segments: List[tuple]) -> int:
+        """
+        검색 구간 캐시 저장
+
+        Args:
+            segments: (segment_type, deal_ymd, 거래 목록, cache_hours) 목록 - 거래가 없는 달도 빈 목록으로 저장
+
+        Returns:
+            저장한 구간 수
+        """
+        try:
+            with self._connect() as conn:
+                from datetime import datetime, timedelta
+                search_date = datetime.now().strftime('%Y-%m-%d')
+                # 만료 시각은 조회 쿼리의 datetime('now')/메모리 계층과 같은 UTC 기준
+                now = datetime.utcnow()
+
+                conn.executemany('''
+                    INSERT OR REPLACE INTO search_cache
+                    (cache_key, region_code, region_name, months, search_date, total_count,
+                     classified_data, raw_data, expires_at, is_valid, segment_type, deal_ymd, raw_bytes)
+                    VALUES (?, ?, ?, 1, ?, ?, '{}', ?, ?, 1, ?, ?, ?)
+                ''', [
+                    (
+                        self.generate_segment_cache_key(region_code, segment_type, deal_ymd),
+                        region_code,
+                        region_name,
+                        search_date,
+                        len(data),
+                        encoded,
+                        (now + timedelta(hours=cache_hours)).strftime('%Y-%m-%d %H:%M:%S'),
+                        segment_type,
+                        deal_ymd,
+                        raw_bytes
+                    )
+                    for segment_type, deal_ymd, data, cache_hours in segments
+                    for encoded, raw_bytes in [self._encode_cache_rows(data)]
+                ])
+
+            for segment_type, deal_ymd, _, _ in segments:
+                self.memory_cache.invalidate(self.generate_segment_cache_key(region_code, segment_type, deal_ymd))
+            self.logger.info(f"검색 구간 캐시 저장: {region_code} {len(segments)}개 구간")
+            return len(segments)
+
+        except Exception as e:
+            self.logger.error(f"검색 구간 캐시 저장 실패: {e}")
+            return 0
+
+    def get_search_segments(self, region_code: str, segment_keys: List[tuple],
+                            dong: str = None, summary: bool = False,
+                            max_stale_hours: float = 0) -> Dict[tuple, Dict]:
+        """
+        유효한 검색 구간 캐시 조회
+
+        Args:
+            segment_keys: (segment_type, deal_ymd) 목록
+            dong: 법정동명 또는 법정동코드 - 주면 각 구간에서 해당 법정동 묶음만 해제
+            summary: True면 거래 목록 대신 단지별 집계만 해제 ('data' 대신 'apartments', 'count')
+            max_stale_hours: 만료된 지 이 시간 이내인 구간도 포함 ('stale': True로 표시)
+
+        Returns:
+            {(segment_type, deal_ymd): {'data': 거래 목록, 'total_count': 구간 전체 건수, 'created_at', 'stale'}}
+            - 캐시에 있는 구간만 포함
+        """
+        if not segment_keys:
+            return {}
+
+        try:
+            keys = [self.generate_segment_cache_key(region_code, segment_type, deal_ymd)
+                    for segment_type, deal_ymd in segment_keys]
+
+            # 메모리 계층에 없는 구간만 SQLite에서 조회
+            rows = [row for row in map(self.memory_cache.get, keys) if row is not None]
+            held = {row['cache_key'] for row in rows}
+            missing = [key for key in keys if key not in held]
+            if missing:
+                with self._connect() as conn:
+                    conn.row_factory = sqlite3.Row
+                    stored = conn.execute(f'''
+                        SELECT cache_key, region_code, segment_type, deal_ymd, raw_data, total_count,
+                               created_at, expires_at
+                        FROM search_cache
+                        WHERE cache_key IN ({', '.join('?' for _ in missing)})
+                          AND is_valid = 1 AND expires_at > datetime('now', ?)
+                    ''', missing + [f'-{max(0, max_stale_hours)} hours']).fetchall()
+
+                for row in map(dict, stored):
+                    self.memory_cache.put(row['cache_key'], row)
+                    rows.append(row)
+
+            segments = {}
+            for row in rows:
+                segment = {
+                    'total_count': row['total_count'],
+                    'created_at': row['created_at'],
+                    'stale': MemoryCacheTier.row_expired(row)
+                }
+                if summary:
+                    segment['apartments'], segment['count'] = self._decode_cache_summary(row['raw_data'], dong)
+                else:
+                    segment['data'] = self._decode_cache_rows(row['raw_data'], dong)
+                segments[(row['segment_type'], row['deal_ymd'])] = segment
+            self.logger.info(f"검색 구간 캐시 조회: {region_code} {len(segments)}/{len(keys)}개 구간"
+                             + (f" ({dong})" if dong else ""))
+            return segments
+
+        except Exception as e:
+            self.logger.error(f"검색 구간 캐시 조회 실패: {e}")
+            return {}
+
+    def _encode_cache_rows(self, rows: List[Dict]) -> tuple:
+        """캐시 거래 목록 인코딩 → (법정동별 압축 BLOB, JSON으로 저장했을 때의 크기)"""
+        encoded = encode_rows(rows or [])
+        return encoded, CacheBlob(encoded).raw_bytes
+
+    def _decode_cache_rows(self, raw_data, dong: str = None) -> List[Dict]:
+        """캐시 거래 목록 해제 (해제 횟수/건수/시간 누적)"""
+        started = time.perf_counter()
+        rows = decode_rows(raw_data, dong)
+        self._record_decode(len(rows), time.perf_counter() - started)
+        return rows
+
+    def _decode_cache_summary(self, raw_data, dong: str = None) -> tuple:
+        """캐시 단지별 집계 해제 → (집계, 법정동 거래 건수)"""
+        started = time.perf_counter()
+        apartments, count = decode_summary(raw_data, dong)
+        self._record_decode(0, time.perf_counter() - started, summaries=1)
+        return apartments, count
+
+    def _record_decode(self, rows: int, seconds: float, summaries: int = 0):
+        with self._decode_lock:
+            self._decode_stats['decodes'] += 1
+            self._decode_stats['rows'] += rows
+            self._decode_stats['summaries'] += summaries
+            self._decode_stats['seconds'] += seconds
+
     def invalidate_search_cache(self, region_code: str = None) -> int:
         """검색 결과 캐시 무효화"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 if region_code:
@@ -542,6 +1754,7 @@ class ApartmentDatabase:
                         WHERE region_code = ?
                     ''', (region_code,))
                     affected_rows = cursor.rowcount
+                    self.memory_cache.invalidate(predicate=lambda row: row['region_code'] == region_code)
                     self.logger.info(f"지역별 캐시 무효화: {region_code} ({affected_rows}건)")
                 else:
                     cursor.execute('''
@@ -550,6 +1763,7 @@ class ApartmentDatabase:
                         WHERE expires_at < datetime('now')
                     ''')
                     affected_rows = cursor.rowcount
+                    self.memory_cache.invalidate(predicate=MemoryCacheTier.row_expired)
                     self.logger.info(f"만료된 캐시 무효화: {affected_rows}건")
                 
                 conn.commit()
@@ -562,7 +1776,7 @@ class ApartmentDatabase:
     def get_cache_statistics(self) -> Dict:
         """캐시 통계 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -577,6 +1791,32 @@ class ApartmentDatabase:
                     WHERE is_valid = 1 AND expires_at < datetime('now')
                 ''')
                 expired_cache = cursor.fetchone()['expired']
+
+                # 구간 캐시 개수 (지역 × 엔드포인트 × 계약년월)
+                cursor.execute('''
+                    SELECT COUNT(*) as segments
+                    FROM search_cache
+                    WHERE is_valid = 1 AND segment_type IS NOT NULL
+                ''')
+                segment_cache = cursor.fetchone()['segments']
+
+                # 압축 저장 크기 (raw_bytes: JSON TEXT로 저장했을 때의 크기, 이전 형식 캐시는 제외)
+                cursor.execute('''
+                    SELECT COUNT(*) as entries,
+                           COALESCE(SUM(length(raw_data)), 0) as stored_bytes,
+                           COALESCE(SUM(raw_bytes), 0) as raw_bytes
+                    FROM search_cache
+                    WHERE raw_bytes IS NOT NULL
+                ''')
+                storage = dict(cursor.fetchone())
+                storage['bytes_saved'] = storage['raw_bytes'] - storage['stored_bytes']
+                storage['compression_ratio'] = (round(storage['stored_bytes'] / storage['raw_bytes'], 3)
+                                                if storage['raw_bytes'] else None)
+
+                with self._decode_lock:
+                    decode = dict(self._decode_stats)
+                decode['total_ms'] = round(decode.pop('seconds') * 1000, 2)
+                decode['avg_ms'] = round(decode['total_ms'] / decode['decodes'], 3) if decode['decodes'] else 0
                 
                 # 지역별 캐시 개수
                 cursor.execute('''
@@ -593,6 +1833,9 @@ class ApartmentDatabase:
                     'total_cache': total_cache,
                     'expired_cache': expired_cache,
                     'valid_cache': total_cache - expired_cache,
+                    'segment_cache': segment_cache,
+                    'storage': storage,
+                    'decode': decode,
                     'region_stats': region_stats
                 }
                 
@@ -603,25 +1846,11 @@ class ApartmentDatabase:
     def get_apartments_by_dong(self, region_code: str, dong_name: str) -> List[Dict]:
         """특정 법정동의 아파트 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT DISTINCT 
-                        apt_name,
-                        region_code,
-                        region_name,
-                        build_year,
-                        COUNT(*) as transaction_count,
-                        AVG(price_per_area) as avg_price,
-                        MIN(price_per_area) as min_price,
-                        MAX(price_per_area) as max_price
-                    FROM transaction_data 
-                    WHERE region_code = ? AND umd_nm = ?
-                    GROUP BY apt_name, region_code
-                    ORDER BY transaction_count DESC, apt_name
-                ''', (region_code, dong_name))
+                cursor.execute(APARTMENTS_BY_DONG_SQL, (region_code, dong_name))
                 
                 apartments = []
                 for row in cursor.fetchall():
@@ -645,52 +1874,19 @@ class ApartmentDatabase:
     def get_apartment_transactions(self, region_code: str, apt_name: str) -> List[Dict]:
         """특정 아파트의 거래기록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
 
-                # 정확한 매칭 시도
-                cursor.execute('''
-                    SELECT
-                        deal_date,
-                        deal_amount,
-                        exclusive_area,
-                        price_per_area,
-                        floor,
-                        apt_name,
-                        region_name,
-                        umd_nm,
-                        build_year
-                    FROM transaction_data
-                    WHERE region_code = ? AND apt_name = ?
-                    ORDER BY deal_date DESC
-                ''', (region_code, apt_name))
-
-                rows = cursor.fetchall()
+                # 정확한 매칭 시도 (전체 기간이므로 모든 보관 DB 포함)
+                rows = self._query_partitions(conn, APARTMENT_TRANSACTIONS_SQL, (region_code, apt_name))
 
                 # 정확한 매칭이 실패한 경우 유사한 이름으로 검색
                 if not rows:
-                    # 공백과 특수문자를 제거한 후 LIKE 검색
-                    cleaned_apt_name = apt_name.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
-                    cursor.execute('''
-                        SELECT
-                            deal_date,
-                            deal_amount,
-                            exclusive_area,
-                            price_per_area,
-                            floor,
-                            apt_name,
-                            region_name,
-                            umd_nm,
-                            build_year
-                        FROM transaction_data
-                        WHERE region_code = ? AND (
-                            apt_name LIKE ? OR
-                            REPLACE(REPLACE(REPLACE(REPLACE(apt_name, ' ', ''), '-', ''), '(', ''), ')', '') LIKE ?
-                        )
-                        ORDER BY deal_date DESC
-                    ''', (region_code, f'%{apt_name}%', f'%{cleaned_apt_name}%'))
-                    rows = cursor.fetchall()
+                    # 공백과 특수문자를 제거한 정규화 키의 일치/접두어 검색 (인덱스 범위 검색)
+                    apt_name_key = normalize_apt_name(apt_name)
+                    if apt_name_key:
+                        rows = self._query_partitions(conn, APARTMENT_TRANSACTIONS_BY_KEY_SQL,
+                                                      (region_code, apt_name_key, apt_name_key + '\U0010ffff'))
                 
                 transactions = []
                 for row in rows:
@@ -715,26 +1911,11 @@ class ApartmentDatabase:
     def get_apartments_by_region(self, region_code: str) -> List[Dict]:
         """특정 지역의 모든 아파트 목록 조회 (1단계용)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
-                cursor.execute('''
-                    SELECT DISTINCT
-                        apt_name,
-                        region_code,
-                        region_name,
-                        build_year,
-                        umd_nm,
-                        COUNT(*) as transaction_count,
-                        AVG(price_per_area) as avg_price,
-                        MIN(price_per_area) as min_price,
-                        MAX(price_per_area) as max_price
-                    FROM transaction_data
-                    WHERE region_code = ?
-                    GROUP BY apt_name, region_code, umd_nm
-                    ORDER BY transaction_count DESC, apt_name
-                ''', (region_code,))
+                cursor.execute(APARTMENTS_BY_REGION_SQL, (region_code,))
 
                 apartments = []
                 for row in cursor.fetchall():
@@ -756,15 +1937,93 @@ class ApartmentDatabase:
             self.logger.error(f"지역별 아파트 목록 조회 실패: {e}")
             return []
 
+    def archive_closed_years(self, before_year: int = None, vacuum: bool = False) -> Dict:
+        """
+        지난 연도 거래를 연도별 보관 DB로 옮기기
+
+        before_year 이전 연도(기본: 최근 DB_HOT_YEARS년을 제외한 연도)의 거래를 연도마다 보관 DB에
+        복사한 뒤 메인 DB에서 삭제합니다. 월별 집계는 메인 DB에 그대로 남아 전체 기간을 계속 포함합니다.
+        연도마다 따로 커밋하며, 중간에 실패해도 다시 실행하면 남은 연도부터 이어서 옮깁니다.
+
+        Returns:
+            {'success', 'years': {연도: 옮긴 건수}, 'archive_dir'}
+        """
+        hot_start_year = self.archive.hot_start_year()
+        cutoff = int(before_year or hot_start_year)
+        result = {'success': True, 'years': {}, 'archive_dir': self.archive.archive_dir}
+
+        if cutoff > hot_start_year:
+            # 관심단지 최근 거래 등 최근 기간 조회는 메인 DB만 읽으므로 최근 연도는 남겨 둠
+            self.logger.error(f"보관 기준 연도는 {hot_start_year}년 이하여야 합니다: {cutoff}")
+            result.update({'success': False, 'error': f"before_year must be <= {hot_start_year}"})
+            return result
+
+        columns = ', '.join(_TRANSACTION_COLUMNS)
+        try:
+            with self._connect() as conn:
+                if conn.in_transaction:
+                    raise sqlite3.OperationalError("트랜잭션 중에는 보관 DB를 ATTACH할 수 없습니다")
+
+                years = [int(row[0]) for row in conn.execute(
+                    'SELECT DISTINCT substr(deal_date, 1, 4) FROM main.transactions WHERE deal_date < ? ORDER BY 1',
+                    (str(cutoff),)
+                )]
+
+                for year in years:
+                    period = (str(year), str(year + 1))
+                    with self.archive.attached(conn, year, create=True) as schema:
+                        conn.execute(transactions_table_sql(schema))
+                        conn.execute('BEGIN IMMEDIATE')
+                        moved = conn.execute(
+                            f"INSERT OR REPLACE INTO {schema}.transactions ({columns}) "
+                            f"SELECT {columns} FROM main.transactions WHERE deal_date >= ? AND deal_date < ?",
+                            period
+                        ).rowcount
+                        conn.execute('DELETE FROM main.transactions WHERE deal_date >= ? AND deal_date < ?', period)
+                        conn.commit()
+
+                    result['years'][year] = moved
+                    self.logger.info(f"🗄️ {year}년 거래 {moved}건 보관 완료: {self.archive.path(year)}")
+
+                if vacuum and years:
+                    conn.execute('VACUUM')
+                    self.logger.info("메인 DB VACUUM 완료")
+
+            return result
+
+        except Exception as e:
+            self.logger.error(f"연도별 보관 실패: {e}")
+            result.update({'success': False, 'error': str(e)})
+            return result
+
+    def get_archive_statistics(self) -> Dict:
+        """연도별 보관 DB 현황 (연도, 파일 크기)"""
+        files = []
+        for year in self.archive.years():
+            try:
+                size_bytes = os.path.getsize(self.archive.path(year))
+            except OSError:
+                size_bytes = 0
+            files.append({'year': year, 'size_bytes': size_bytes})
+
+        return {
+            'archive_dir': self.archive.archive_dir,
+            'hot_years': self.archive.hot_years,
+            'boundary_year': self.archive.boundary_year(),
+            'files': files
+        }
+
     def clear_database(self) -> bool:
         """데이터베이스 초기화 (모든 데이터 삭제)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # 모든 테이블의 데이터 삭제
                 tables = [
-                    'transaction_data',
+                    'transactions',
+                    'monthly_complex_stats',
+                    'complexes',
                     'search_cache',
                     'price_alerts'
                 ]
@@ -778,8 +2037,16 @@ class ApartmentDatabase:
                 self.logger.info("관심단지 데이터 비활성화 완료")
 
                 conn.commit()
-                self.logger.info("데이터베이스 초기화 완료")
-                return True
+
+            self.memory_cache.clear()
+
+            # 연도별 보관 DB 파일 삭제
+            removed = self.archive.remove_all()
+            if removed:
+                self.logger.info(f"보관 DB {removed}개 파일 삭제 완료")
+
+            self.logger.info("데이터베이스 초기화 완료")
+            return True
 
         except Exception as e:
             self.logger.error(f"데이터베이스 초기화 실패: {e}")
@@ -788,7 +2055,7 @@ class ApartmentDatabase:
     def clear_cache_only(self) -> bool:
         """캐시 데이터만 삭제"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # 캐시 테이블만 삭제
@@ -796,6 +2063,7 @@ class ApartmentDatabase:
                 affected_rows = cursor.rowcount
 
                 conn.commit()
+                self.memory_cache.clear()
                 self.logger.info(f"캐시 데이터 삭제 완료: {affected_rows}건")
                 return True
 
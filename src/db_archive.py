@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+연도별 거래 보관 DB 관리 모듈
+
+최근 몇 년(기본 3년)의 거래만 메인 DB 파일에 두고, 그 이전 연도는 연도별 파일
+(archive/transactions_2015.db 등)로 옮겨 보관합니다. 보관 파일은 조회 기간에 해당하는
+연도만 그때그때 ATTACH하므로 메인 DB의 인덱스와 페이지 캐시는 보관된 이력의 양과
+관계없이 작게 유지됩니다.
+"""
+
+import os
+import re
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import date
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE_PATTERN = re.compile(r'^transactions_(\d{4})\.db$')
+
+
+class YearArchive:
+    """연도별 보관 DB 파일 목록 및 ATTACH/DETACH 관리"""
+
+    def __init__(self, archive_dir: str, hot_years: int = 3):
+        """
+        Args:
+            archive_dir: 보관 파일 디렉토리
+            hot_years: 메인 DB에 남길 최근 연도 수 (올해 포함, 최소 2)
+        """
+        self.archive_dir = archive_dir
+        self.hot_years = max(2, int(hot_years))  # 최근 12개월 조회가 항상 메인 DB 안에 있도록
+
+    @classmethod
+    def from_env(cls, db_path: str) -> 'YearArchive':
+        """환경 변수 설정으로 생성 (기본 보관 디렉토리: DB 파일 옆 archive/)"""
+        default_dir = os.path.join(os.path.dirname(os.path.abspath(db_path)), 'archive')
+        return cls(
+            os.getenv('DB_ARCHIVE_DIR') or default_dir,
+            hot_years=int(os.getenv('DB_HOT_YEARS', '3'))
+        )
+
+    @staticmethod
+    def schema(year: int) -> str:
+        """ATTACH 스키마 이름"""
+        return f"archive_{int(year)}"
+
+    def path(self, year: int) -> str:
+        """연도별 보관 파일 경로"""
+        return os.path.join(self.archive_dir, f"transactions_{int(year)}.db")
+
+    def years(self) -> List[int]:
+        """보관 파일이 있는 연도 (최신순)"""
+        try:
+            names = os.listdir(self.archive_dir)
+        except FileNotFoundError:
+            return []
+
+        years = []
+        for name in names:
+            match = ARCHIVE_FILE_PATTERN.match(name)
+            if match:
+                years.append(int(match.group(1)))
+        return sorted(years, reverse=True)
+
+    def boundary_year(self) -> Optional[int]:
+        """메인 DB에 남는 가장 이른 연도 (이보다 이전 거래는 보관 파일에 저장, 보관 파일이 없으면 None)"""
+        years = self.years()
+        return years[0] + 1 if years else None
+
+    def hot_start_year(self, today: date = None) -> int:
+        """보관 명령의 기본 기준 연도 (이 연도부터 메인 DB에 유지)"""
+        today = today or date.today()
+        return today.year - self.hot_years + 1
+
+    def years_in_range(self, start_date: str = None, end_date: str = None) -> List[int]:
+        """조회 기간(YYYY-MM-DD, 양 끝 포함)과 겹치는 보관 연도 (최신순)"""
+        start_year = int(start_date[:4]) if start_date else None
+        end_year = int(end_date[:4]) if end_date else None
+        return [
+            year for year in self.years()
+            if (start_year is None or year >= start_year) and (end_year is None or year <= end_year)
+        ]
+
+    @contextmanager
+    def attached(self, conn: sqlite3.Connection, year: int, create: bool = False) -> Iterator[str]:
+        """
+        보관 파일을 ATTACH한 동안 스키마 이름을 돌려주고, 끝나면 DETACH
+
+        ATTACH/DETACH는 트랜잭션 밖에서만 가능하므로 연결이 트랜잭션 중이 아니어야 합니다.
+        create=False이고 파일이 없으면 FileNotFoundError가 발생합니다.
+        """
+        path = self.path(year)
+        if create:
+            os.makedirs(self.archive_dir, exist_ok=True)
+        elif not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        schema = self.schema(year)
+        conn.execute('ATTACH DATABASE ? AS ' + schema, (path,))
+        try:
+            yield schema
+        finally:
+            if conn.in_transaction:
+                conn.rollback()  # 커밋되지 않은 변경이 남아 있으면 DETACH 불가
+            conn.execute('DETACH DATABASE ' + schema)
+
+    def remove_all(self) -> int:
+        """보관 파일 모두 삭제 (삭제한 파일 수 반환)"""
+        removed = 0
+        for year in self.years():
+            try:
+                os.remove(self.path(year))
+                removed += 1
+            except OSError as e:
+                logger.warning(f"보관 파일 삭제 실패: {self.path(year)} - {e}")
+        return removed
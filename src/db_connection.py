@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+SQLite 연결 관리 모듈
+
+메서드 호출마다 sqlite3.connect()/close()를 반복하지 않도록 연결을 재사용합니다.
+WAL 저널 모드에서는 백그라운드 검색 스레드가 쓰는 동안에도 페이지 요청의 읽기가
+막히지 않습니다. PRAGMA 값은 환경 변수로 조정할 수 있습니다.
+"""
+
+import os
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+class SQLiteConnectionManager:
+    """
+    스레드 로컬 + 유휴 풀 기반 SQLite 연결 관리자
+
+    한 스레드는 작업 중 하나의 연결만 사용하고(중첩 호출 시 같은 연결 재사용),
+    작업이 끝난 연결은 유휴 풀로 돌아가 다른 스레드가 재사용합니다.
+    Flask 개발 서버처럼 요청마다 새 스레드를 만드는 환경에서도 연결을 새로 열지 않습니다.
+    """
+
+    def __init__(self, db_path: str, journal_mode: str = 'WAL', synchronous: str = 'NORMAL',
+                 cache_size: int = -20000, mmap_size: int = 268435456, temp_store: str = 'MEMORY',
+                 busy_timeout_ms: int = 5000, pool_size: int = 8):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            journal_mode: PRAGMA journal_mode (WAL 권장)
+            synchronous: PRAGMA synchronous (WAL에서는 NORMAL로 충분)
+            cache_size: PRAGMA cache_size (음수는 KiB 단위, -20000 = 약 20MB)
+            mmap_size: PRAGMA mmap_size (바이트, 0이면 사용 안 함)
+            temp_store: PRAGMA temp_store (DEFAULT/FILE/MEMORY)
+            busy_timeout_ms: 잠금 대기 시간 (밀리초)
+            pool_size: 유지할 유휴 연결 최대 개수
+        """
+        self.db_path = db_path
+        self.journal_mode = journal_mode.upper()
+        self.synchronous = synchronous.upper()
+        self.cache_size = int(cache_size)
+        self.mmap_size = int(mmap_size)
+        self.temp_store = temp_store.upper()
+        self.busy_timeout_ms = int(busy_timeout_ms)
+        self.pool_size = max(1, int(pool_size))
+
+        self._idle = queue.LifoQueue(maxsize=self.pool_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'closed': 0,
+            'in_use': 0
+        }
+        self._active_journal_mode = None
+
+    @classmethod
+    def from_env(cls, db_path: str) -> 'SQLiteConnectionManager':
+        """환경 변수 설정으로 연결 관리자 생성"""
+        return cls(
+            db_path,
+            journal_mode=os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+            synchronous=os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+            cache_size=int(os.getenv('SQLITE_CACHE_SIZE', '-20000')),
+            mmap_size=int(os.getenv('SQLITE_MMAP_SIZE', '268435456')),
+            temp_store=os.getenv('SQLITE_TEMP_STORE', 'MEMORY'),
+            busy_timeout_ms=int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000')),
+            pool_size=int(os.getenv('SQLITE_POOL_SIZE', '8'))
+        )
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """새 연결 생성 및 PRAGMA 적용"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False  # 풀을 통해 스레드 간 이동 (동시에 두 스레드가 쓰지는 않음)
+        )
+        cursor = conn.cursor()
+        journal_mode = cursor.execute(f'PRAGMA journal_mode = {self.journal_mode}').fetchone()[0]
+        cursor.execute(f'PRAGMA synchronous = {self.synchronous}')
+        cursor.execute(f'PRAGMA cache_size = {self.cache_size}')
+        cursor.execute(f'PRAGMA mmap_size = {self.mmap_size}')
+        cursor.execute(f'PRAGMA temp_store = {self.temp_store}')
+        cursor.close()
+
+        with self._lock:
+            self._stats['created'] += 1
+            if self._active_journal_mode != journal_mode:
+                self._active_journal_mode = journal_mode
+                logger.info(f"🗄️ SQLite 연결 설정: journal_mode={journal_mode}, synchronous={self.synchronous}, "
+                            f"cache_size={self.cache_size}, mmap_size={self.mmap_size}, temp_store={self.temp_store}")
+
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        """유휴 풀에서 연결을 꺼내거나 새로 생성"""
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self._stats['reused'] += 1
+        except queue.Empty:
+            conn = self._create_connection()
+
+        with self._lock:
+            self._stats['in_use'] += 1
+        return conn
+
+    def _checkin(self, conn: sqlite3.Connection):
+        """연결을 유휴 풀로 반환 (풀이 가득 찼거나 종료된 경우 닫음)"""
+        with self._lock:
+            self._stats['in_use'] -= 1
+
+        if not self._closed:
+            try:
+                self._idle.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+
+        self._close_connection(conn)
+
+    def _close_connection(self, conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"SQLite 연결 종료 실패: {e}")
+        with self._lock:
+            self._stats['closed'] += 1
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        연결 사용 컨텍스트 (sqlite3.connect()의 with 블록과 같은 커밋/롤백 동작)
+
+        블록이 정상 종료되면 커밋, 예외가 발생하면 롤백합니다.
+        같은 스레드에서 중첩 호출하면 바깥 블록의 연결을 그대로 사용합니다.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._checkout()
+        conn.row_factory = None  # 이전 사용자가 설정한 row_factory 초기화
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._checkin(conn)
+
+    def close_all(self):
+        """유휴 연결을 모두 닫고 이후 반환되는 연결도 닫도록 설정"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._close_connection(conn)
+
+    def get_statistics(self) -> Dict:
+        """연결 재사용 통계 및 적용된 설정 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update({
+            'idle': self._idle.qsize(),
+            'pool_size': self.pool_size,
+            'journal_mode': self._active_journal_mode or self.journal_mode.lower(),
+            'synchronous': self.synchronous,
+            'cache_size': self.cache_size,
+            'mmap_size': self.mmap_size,
+            'temp_store': self.temp_store
+        })
+        return stats
@@ -9,18 +9,38 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import time
+import math
 import os
+import threading
 from functools import wraps
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .rate_limiter import get_shared_rate_limiter
+from .response_store import RawResponseStore
+from .region_index import get_region_index, build_hierarchy_code_map
+from .molit_parser import (
+    SaleItemParser, RentItemParser, StreamingPageParser,
+    read_header
+)
+
+# 검색 유형별로 호출해야 하는 엔드포인트 (fetch plan)
+FETCH_PLANS = {
+    'sale': ('sale',),
+    'rent': ('rent',),
+    'all': ('sale', 'rent'),
+}
+
 class MolitRealEstateAPI:
     """국토교통부 부동산 실거래가 API 클래스"""
 
-    def __init__(self, service_key: str = None, api_tracker=None):
+    def __init__(self, service_key: str = None, api_tracker=None, rate_limiter=None, response_store=None):
         """
         Args:
             service_key: 국토교통부 공공데이터포털에서 발급받은 서비스키
                         https://www.data.go.kr/ 에서 신청 가능
+            api_tracker: API 호출 추적기 (선택)
+            rate_limiter: 호출 속도 제한기 (기본값: 프로세스 전역 토큰 버킷)
+            response_store: 원본 응답 저장소 (기본값: 환경 변수 설정으로 생성)
         """
         if not service_key:
             raise ValueError("MOLIT API 서비스키가 필요합니다. .env 파일에 MOLIT_API_KEY를 설정해주세요.")
@@ -38,6 +58,21 @@ class MolitRealEstateAPI:
         self.request_delay = float(os.getenv('API_REQUEST_DELAY', '0.05'))
         self.timeout = int(os.getenv('API_TIMEOUT', '15'))
         self.max_retries = int(os.getenv('API_MAX_RETRIES', '3'))
+        self.month_workers = int(os.getenv('API_MONTH_WORKERS', '4'))  # 월 단위 동시 조회 수
+        self.page_workers = int(os.getenv('API_PAGE_WORKERS', '4'))  # 페이지 단위 동시 조회 수
+        self.streaming_parse = os.getenv('API_STREAMING_PARSE', 'false').lower() == 'true'  # 응답 스트리밍 파싱
+        self.stream_chunk_size = int(os.getenv('API_STREAM_CHUNK_SIZE', '65536'))
+
+        # 모든 인스턴스/스레드가 공유하는 호출 속도 제한기
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+
+        # 마감된 월의 원본 응답을 재사용하는 로컬 저장소 (RAW_STORE_ENABLED=false 이면 비활성)
+        self.response_store = response_store if response_store is not None else RawResponseStore.from_env()
+
+        # 최근 월 재조회 전 numOfRows=1 변경 감지 프로브
+        self.change_probe_enabled = os.getenv('API_CHANGE_PROBE_ENABLED', 'true').lower() == 'true'
+        self._probe_lock = threading.Lock()
+        self._probe_stats = {'hits': 0, 'misses': 0, 'errors': 0}
 
         # 로깅 설정 - 전역 설정을 덮어쓰지 않도록 수정
         self.logger = logging.getLogger(__name__)
@@ -393,6 +428,9 @@ class MolitRealEstateAPI:
                         else:
                             self.region_codes[sub_code] = f"{city} {district} {sub_district}"
 
+        # (시/도, 군/구 이름) → 지역코드 역색인
+        self.region_code_map = build_hierarchy_code_map(self.region_hierarchy)
+
         # HTTP 세션 초기화 (재사용을 위해)
         self._init_http_session()
 
@@ -424,12 +462,9 @@ class MolitRealEstateAPI:
             context.set_ciphers('DEFAULT@SECLEVEL=1')  # 보안 레벨을 낮춰서 호환성 향상
             context.minimum_version = ssl.TLSVersion.TLSv1_2  # TLS 1.2 이상 사용
 
-            retry_strategy = Retry(
-                total=self.max_retries,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "OPTIONS"],
-                backoff_factor=1
-            )
+            # 재시도는 _fetch_page_with_retry가 페이지 단위로 담당 (매 시도가 호출 속도 제한기를 거치도록
+            # 어댑터 수준 재시도는 끔 - 겹치면 시도 횟수가 곱해지고 제한기 밖에서 호출 한도를 소모함)
+            retry_strategy = Retry(total=0, raise_on_status=False)
 
             # SSL 컨텍스트를 사용하는 HTTPAdapter 생성
             class SSLAdapter(HTTPAdapter):
@@ -449,7 +484,27 @@ class MolitRealEstateAPI:
         """지역코드로 지역명 조회"""
         return self.region_codes.get(region_code, f"지역코드 {region_code}")
 
-    def get_apt_trade_data(self, lawd_cd: str, deal_ymd: str, page_no: int = 1, num_of_rows: int = 1000) -> Dict:
+    def _http_get(self, url: str, stream: bool = False):
+        """세션 GET 요청 (SSL 검증으로 먼저 시도하고, 인증서 오류 시에만 검증 비활성화로 재시도)"""
+        try:
+            return self.session.get(url, timeout=self.timeout, stream=stream)
+        except requests.exceptions.SSLError as ssl_error:
+            self.logger.warning(f"SSL 인증서 오류 발생, 인증서 검증 비활성화로 재시도: {ssl_error}")
+            # SSL 오류 시에만 이 요청에 한해 검증 비활성화 (공유 세션 설정은 바꾸지 않음 - 다른 스레드 요청에 영향 없음)
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return self.session.get(url, timeout=self.timeout, stream=stream, verify=False)
+        except requests.exceptions.ConnectionError as conn_error:
+            self.logger.error(f"연결 오류: {conn_error}")
+            raise
+
+    def _build_request_url(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int) -> str:
+        """엔드포인트별 API 요청 URL 구성"""
+        base_url = self.base_url if endpoint == 'sale' else self.rent_base_url
+        return f"{base_url}?serviceKey={self.service_key}&LAWD_CD={lawd_cd}&DEAL_YMD={deal_ymd}&pageNo={page_no}&numOfRows={num_of_rows}"
+
+    def get_apt_trade_data(self, lawd_cd: str, deal_ymd: str, page_no: int = 1, num_of_rows: int = 1000, use_store: bool = True,
+                           refresh: bool = False) -> Dict:
         """
         아파트 실거래가 데이터 조회
 
@@ -458,16 +513,24 @@ class MolitRealEstateAPI:
             deal_ymd: 거래년월 (예: 202506)
             page_no: 페이지 번호 (기본값: 1)
             num_of_rows: 한 페이지 결과 수 (기본값: 100)
+            use_store: 원본 응답 저장소 사용 여부 (변경 감지 프로브는 False)
+            refresh: 저장된 응답을 재사용하지 않고 API 호출 (받은 응답은 저장소에 저장 - 강제 새로고침용)
 
         Returns:
             실거래 데이터 딕셔너리
         """
         try:
+            # 재사용 가능한 원본 응답이 저장되어 있으면 네트워크 호출 생략
+            if use_store and not refresh:
+                stored_result = self._load_stored_response('sale', lawd_cd, deal_ymd, page_no, num_of_rows, self._parse_xml_response)
+                if stored_result is not None:
+                    return stored_result
+
             # Rate Limiting 적용
             self._rate_limit()
 
             # API URL 구성
-            url = f"{self.base_url}?serviceKey={self.service_key}&LAWD_CD={lawd_cd}&DEAL_YMD={deal_ymd}&pageNo={page_no}&numOfRows={num_of_rows}"
+            url = self._build_request_url('sale', lawd_cd, deal_ymd, page_no, num_of_rows)
 
             self.logger.info(f"🏢 국토교통부 API 호출: 지역={lawd_cd}({self.get_region_name(lawd_cd)}), 기간={deal_ymd}")
             self.logger.info(f"📊 요청 파라미터: 페이지={page_no}, 조회건수={num_of_rows}")
@@ -476,25 +539,8 @@ class MolitRealEstateAPI:
             # API 호출 시작 시간 기록
             start_time = time.time()
 
-            # 재사용 가능한 세션 사용
-            # SSL 검증으로 먼저 시도
-            try:
-                response = self.session.get(url, timeout=self.timeout)
-            except requests.exceptions.SSLError as ssl_error:
-                self.logger.warning(f"SSL 인증서 오류 발생, 인증서 검증 비활성화로 재시도: {ssl_error}")
-                # SSL 오류 시에만 검증 비활성화
-                import urllib3
-                original_verify = self.session.verify
-                self.session.verify = False
-                try:
-                    with urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning):
-                        response = self.session.get(url, timeout=self.timeout)
-                finally:
-                    # 원래 설정 복원
-                    self.session.verify = original_verify
-            except requests.exceptions.ConnectionError as conn_error:
-                self.logger.error(f"연결 오류: {conn_error}")
-                raise
+            # 재사용 가능한 세션 사용 (스트리밍 파싱 모드에서는 본문을 청크 단위로 수신)
+            response = self._http_get(url, stream=self.streaming_parse)
 
             # 응답 상태 확인
             self.logger.info(f"HTTP 상태코드: {response.status_code}")
@@ -503,7 +549,15 @@ class MolitRealEstateAPI:
             response_time = time.time() - start_time
 
             if response.status_code == 200:
-                result = self._parse_xml_response(response.text, lawd_cd, deal_ymd)
+                if self.streaming_parse:
+                    # 스트리밍 모드는 받은 청크를 바로 저장소에 기록 (응답 전체를 메모리에 모으지 않음)
+                    result = self._parse_response_stream('sale', response, lawd_cd, deal_ymd, page_no, num_of_rows,
+                                                         save=use_store)
+                else:
+                    xml_text = response.text
+                    result = self._parse_xml_response(xml_text, lawd_cd, deal_ymd)
+                    if use_store:
+                        self._save_response('sale', lawd_cd, deal_ymd, page_no, num_of_rows, xml_text, result)
 
                 # API 호출 추적 기록
                 if self.api_tracker and self.current_operation_id:
@@ -563,193 +617,23 @@ class MolitRealEstateAPI:
         """XML 응답 파싱"""
         try:
             root = ET.fromstring(xml_content)
-            
-            # 결과 코드 확인
-            result_code = root.find('.//resultCode')
-            result_msg = root.find('.//resultMsg')
-
-            # API 호출 한도 초과 에러 체크
-            err_msg = root.find('.//errMsg')
-            return_auth_msg = root.find('.//returnAuthMsg')
-            return_reason_code = root.find('.//returnReasonCode')
-
-            if return_reason_code is not None and return_reason_code.text == '22':
-                error_msg = "API 호출 한도 초과 - 매매 데이터를 가져올 수 없습니다. 내일 다시 시도해주세요."
-                self.logger.warning(f"매매 API 호출 한도 초과: {return_auth_msg.text if return_auth_msg is not None else ''}")
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'data': [],
-                    'total_count': 0,
-                    'quota_exceeded': True
-                }
 
-            # resultCode가 없거나 '000'이 아닌 경우에만 오류 처리
-            if result_code is not None and result_code.text and result_code.text != '000':
-                error_msg = result_msg.text if result_msg is not None else '알 수 없는 오류'
-                self.logger.error(f"API 오류: {error_msg}")
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'data': [],
-                    'total_count': 0
-                }
-            
-            # resultMsg가 'OK'인 경우는 정상 응답으로 처리
-            if result_msg is not None and result_msg.text == 'OK':
-                self.logger.info("API 정상 응답: OK")
+            # 결과 코드 및 API 호출 한도 초과 확인
+            header = read_header(root)
+            error_result = self._check_response_header(header, 'sale')
+            if error_result:
+                return error_result
 
-            # 데이터 파싱
-            items = root.findall('.//item')
+            # 데이터 파싱 (필드 매핑 테이블 기반 단일 순회)
+            item_parser = self._create_item_parser('sale', lawd_cd)
             transactions = []
-            
-            for item in items:
-                # 거래일 생성 및 유효성 검사 - 예외 처리 추가
-                try:
-                    deal_year = int(self._get_xml_text(item, 'dealYear', '0'))
-                    deal_month = int(self._get_xml_text(item, 'dealMonth', '0'))
-                    deal_day = int(self._get_xml_text(item, 'dealDay', '0'))
-
-                    # 유효한 날짜 범위 검사
-                    if not (1900 <= deal_year <= 2100):
-                        self.logger.warning(f"유효하지 않은 연도: {deal_year}")
-                        continue
-                    if not (1 <= deal_month <= 12):
-                        self.logger.warning(f"유효하지 않은 월: {deal_month}")
-                        continue
-                    if not (1 <= deal_day <= 31):
-                        self.logger.warning(f"유효하지 않은 일: {deal_day}")
-                        continue
-
-                    deal_date = f"{deal_year}-{deal_month:0>2}-{deal_day:0>2}"
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(f"날짜 파싱 오류: {e}, 해당 거래 건너뜀")
-                    continue
-                
-                # 미래 거래일 필터링
-                from datetime import datetime
-                try:
-                    deal_datetime = datetime.strptime(deal_date, '%Y-%m-%d')
-                    if deal_datetime > datetime.now():
-                        self.logger.warning(f"미래 거래일 필터링: {deal_date}")
-                        continue
-                except:
-                    self.logger.warning(f"잘못된 거래일 형식: {deal_date}")
-                    continue
-                
-                # 숫자 필드들에 안전한 파싱 적용
-                try:
-                    build_year = int(self._get_xml_text(item, 'buildYear', '0'))
-                    exclusive_area = float(self._get_xml_text(item, 'excluUseAr', '0'))
-                    floor = int(self._get_xml_text(item, 'floor', '0'))
-                    deal_amount = self._parse_amount(self._get_xml_text(item, 'dealAmount'))
-
-                    # 데이터 유효성 검사
-                    if build_year < 1900 or build_year > 2100:
-                        self.logger.warning(f"유효하지 않은 건축년도: {build_year}")
-                        build_year = 0
-                    if exclusive_area < 0 or exclusive_area > 1000:  # 1000㎡ 이상은 비정상적
-                        self.logger.warning(f"유효하지 않은 전용면적: {exclusive_area}")
-                        exclusive_area = 0
-                    if floor < 0 or floor > 200:  # 200층 이상은 비정상적
-                        self.logger.warning(f"유효하지 않은 층수: {floor}")
-                        floor = 0
-
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(f"숫자 필드 파싱 오류: {e}, 기본값 사용")
-                    build_year = 0
-                    exclusive_area = 0
-                    floor = 0
-                    deal_amount = 0
 
-                transaction = {
-                    'apt_dong': self._get_xml_text(item, 'aptDong'),
-                    'apt_name': self._get_xml_text(item, 'aptNm'),
-                    'apt_seq': self._get_xml_text(item, 'aptSeq'),
-                    'bonbun': self._get_xml_text(item, 'bonbun'),
-                    'bubun': self._get_xml_text(item, 'bubun'),
-                    'build_year': build_year,
-                    'buyer_gbn': self._get_xml_text(item, 'buyerGbn'),
-                    'cdeal_type': self._get_xml_text(item, 'cdealType'),
-                    'deal_amount': deal_amount,
-                    'deal_day': deal_day,
-                    'deal_month': deal_month,
-                    'deal_year': deal_year,
-                    'dealing_gbn': self._get_xml_text(item, 'dealingGbn'),
-                    'estate_agent_sgg_nm': self._get_xml_text(item, 'estateAgentSggNm'),
-                    'exclusive_area': exclusive_area,
-                    'floor': floor,
-                    'jibun': self._get_xml_text(item, 'jibun'),
-                    'road_name': self._get_xml_text(item, 'roadNm'),
-                    'road_name_bonbun': self._get_xml_text(item, 'roadNmBonbun'),
-                    'road_name_bubun': self._get_xml_text(item, 'roadNmBubun'),
-                    'sgg_cd': self._get_xml_text(item, 'sggCd'),
-                    'sler_gbn': self._get_xml_text(item, 'slerGbn'),
-                    'umd_cd': self._get_xml_text(item, 'umdCd'),
-                    'umd_nm': self._get_xml_text(item, 'umdNm'),
-                    'region_code': lawd_cd,
-                    'region_name': self.get_region_name(lawd_cd),
-                    'deal_date': deal_date,
-                    'price_per_area': 0,  # 계산해서 추가
-                    # 추가 필드들 - 빈 값이어도 파싱
-                    'rgs_date': self._get_xml_text(item, 'rgsDate'),  # 등기일자
-                    'cancel_deal_type': self._get_xml_text(item, 'cancelDealType'),  # 해제여부
-                    'cancel_deal_day': self._get_xml_text(item, 'cancelDealDay'),  # 해제사유발생일
-                    'req_gbn': self._get_xml_text(item, 'reqGbn'),  # 거래유형
-                    'house_type': self._get_xml_text(item, 'houseType'),  # 주택유형
-                }
-                
-                # 평당 가격 계산
-                if transaction['exclusive_area'] > 0:
-                    transaction['price_per_area'] = (transaction['deal_amount'] * 10000) / transaction['exclusive_area']
-                
-                transactions.append(transaction)
-
-            # 총 개수 확인
-            total_count = root.find('.//totalCount')
-            total_count_value = int(total_count.text) if total_count is not None else len(transactions)
-
-            if len(transactions) == 0:
-                self.logger.info(f"해당 기간({deal_ymd})에 거래 데이터가 없습니다.")
-                return {
-                    'success': True,
-                    'data': [],
-                    'total_count': 0,
-                    'region_code': lawd_cd,
-                    'region_name': self.get_region_name(lawd_cd),
-                    'deal_ymd': deal_ymd,
-                    'message': '해당 기간에 거래 데이터가 없습니다.'
-                }
-            else:
-                self.logger.info(f"✅ {len(transactions)}건의 실거래 데이터 수집완료 (API 총 {total_count_value}건)")
-
-                # totalCount와 파싱된 데이터 개수 차이 로깅
-                if total_count_value > len(transactions):
-                    self.logger.warning(f"⚠️ totalCount({total_count_value})와 파싱된 데이터({len(transactions)})에 차이가 있습니다.")
-                    self.logger.warning("일부 데이터가 파싱 중 스킵되었을 수 있습니다.")
-
-                if transactions:
-                    # 거래 데이터 요약 정보 표시
-                    apt_names = list(set([tx.get('apt_name', '') for tx in transactions if tx.get('apt_name')]))
-                    self.logger.info(f"📍 포함된 아파트 단지: {len(apt_names)}개 ({', '.join(apt_names[:3])}{'...' if len(apt_names) > 3 else ''})")
-
-                    # 가격 범위 정보
-                    prices = [tx.get('deal_amount', 0) for tx in transactions if tx.get('deal_amount')]
-                    if prices:
-                        min_price = min(prices) / 10000  # 만원 단위
-                        max_price = max(prices) / 10000
-                        avg_price = sum(prices) / len(prices) / 10000
-                        self.logger.info(f"💰 거래가격 범위: {min_price:,.0f}만원 ~ {max_price:,.0f}만원 (평균: {avg_price:,.0f}만원)")
+            for item in root.iter('item'):
+                transaction = item_parser.parse(item)
+                if transaction is not None:
+                    transactions.append(transaction)
 
-                return {
-                    'success': True,
-                    'data': transactions,
-                    'total_count': total_count_value,
-                    'parsed_count': len(transactions),  # 실제 파싱된 개수 추가
-                    'region_code': lawd_cd,
-                    'region_name': self.get_region_name(lawd_cd),
-                    'deal_ymd': deal_ymd
-                }
+            return self._build_sale_result(transactions, header, lawd_cd, deal_ymd)
 
         except ET.ParseError as e:
             self.logger.error(f"XML 파싱 오류: {e}")
@@ -760,7 +644,54 @@ class MolitRealEstateAPI:
                 'total_count': 0
             }
 
-    def get_all_apt_trade_data(self, lawd_cd: str, deal_ymd: str, num_of_rows: int = 1000) -> Dict:
+    def _build_sale_result(self, transactions: List[Dict], header: Dict, lawd_cd: str, deal_ymd: str) -> Dict:
+        """파싱된 매매 거래로 페이지 결과 구성"""
+        # 총 개수 확인
+        total_count_value = int(header['totalCount']) if header.get('totalCount') else len(transactions)
+
+        if len(transactions) == 0:
+            self.logger.info(f"해당 기간({deal_ymd})에 거래 데이터가 없습니다.")
+            return {
+                'success': True,
+                'data': [],
+                'total_count': 0,
+                'region_code': lawd_cd,
+                'region_name': self.get_region_name(lawd_cd),
+                'deal_ymd': deal_ymd,
+                'message': '해당 기간에 거래 데이터가 없습니다.'
+            }
+        else:
+            self.logger.info(f"✅ {len(transactions)}건의 실거래 데이터 수집완료 (API 총 {total_count_value}건)")
+
+            # totalCount와 파싱된 데이터 개수 차이 로깅
+            if total_count_value > len(transactions):
+                self.logger.warning(f"⚠️ totalCount({total_count_value})와 파싱된 데이터({len(transactions)})에 차이가 있습니다.")
+                self.logger.warning("일부 데이터가 파싱 중 스킵되었을 수 있습니다.")
+
+            if transactions:
+                # 거래 데이터 요약 정보 표시
+                apt_names = list(set([tx.get('apt_name', '') for tx in transactions if tx.get('apt_name')]))
+                self.logger.info(f"📍 포함된 아파트 단지: {len(apt_names)}개 ({', '.join(apt_names[:3])}{'...' if len(apt_names) > 3 else ''})")
+
+                # 가격 범위 정보
+                prices = [tx.get('deal_amount', 0) for tx in transactions if tx.get('deal_amount')]
+                if prices:
+                    min_price = min(prices) / 10000  # 만원 단위
+                    max_price = max(prices) / 10000
+                    avg_price = sum(prices) / len(prices) / 10000
+                    self.logger.info(f"💰 거래가격 범위: {min_price:,.0f}만원 ~ {max_price:,.0f}만원 (평균: {avg_price:,.0f}만원)")
+
+            return {
+                'success': True,
+                'data': transactions,
+                'total_count': total_count_value,
+                'parsed_count': len(transactions),  # 실제 파싱된 개수 추가
+                'region_code': lawd_cd,
+                'region_name': self.get_region_name(lawd_cd),
+                'deal_ymd': deal_ymd
+            }
+
+    def get_all_apt_trade_data(self, lawd_cd: str, deal_ymd: str, num_of_rows: int = 1000, refresh: bool = False) -> Dict:
         """
         아파트 매매 전체 데이터 조회 (모든 페이지)
 
@@ -768,52 +699,21 @@ class MolitRealEstateAPI:
             lawd_cd: 지역코드
             deal_ymd: 거래년월
             num_of_rows: 페이지당 조회 건수 (최대 1000)
+            refresh: 저장된 응답을 재사용하지 않고 모든 페이지를 API로 다시 조회
 
         Returns:
             전체 매매 데이터 딕셔너리
         """
-        all_transactions = []
-        page_no = 1
-        total_count_from_api = 0
-
-        while True:
-            # 페이지별 데이터 조회
-            result = self.get_apt_trade_data(lawd_cd, deal_ymd, page_no, num_of_rows)
+        if not refresh:
+            self._revalidate_stored_month('sale', lawd_cd, deal_ymd, num_of_rows)
 
-            if not result.get('success'):
-                self.logger.error(f"매매 데이터 조회 실패 (페이지 {page_no}): {result.get('error')}")
-                break
-
-            transactions = result.get('data', [])
-            if not transactions:
-                # 더 이상 데이터가 없으면 종료
-                break
-
-            all_transactions.extend(transactions)
-
-            # 첫 페이지에서 전체 건수 확인
-            if page_no == 1:
-                total_count_from_api = result.get('total_count', 0)
-                self.logger.info(f"📊 매매 데이터 전체 건수: {total_count_from_api}건, 페이지당 {num_of_rows}건씩 수집")
-
-            # 수집된 데이터가 전체 건수와 같거나 페이지당 데이터가 num_of_rows보다 적으면 종료
-            if len(all_transactions) >= total_count_from_api or len(transactions) < num_of_rows:
-                break
+        return self._fetch_all_pages(
+            lambda page_no: self.get_apt_trade_data(lawd_cd, deal_ymd, page_no, num_of_rows, refresh=refresh),
+            '매매',
+            num_of_rows
+        )
 
-            page_no += 1
-            self.logger.info(f"📄 매매 데이터 페이지 {page_no} 수집 중... (현재까지 {len(all_transactions)}건)")
-
-        self.logger.info(f"✅ 매매 데이터 전체 수집 완료: {len(all_transactions)}건 (API 총 {total_count_from_api}건)")
-
-        return {
-            'success': True,
-            'data': all_transactions,
-            'total_count': len(all_transactions),
-            'api_total_count': total_count_from_api,
-            'pages_fetched': page_no
-        }
-
-    def get_all_apt_rent_data(self, lawd_cd: str, deal_ymd: str, num_of_rows: int = 1000) -> Dict:
+    def get_all_apt_rent_data(self, lawd_cd: str, deal_ymd: str, num_of_rows: int = 1000, refresh: bool = False) -> Dict:
         """
         아파트 전월세 전체 데이터 조회 (모든 페이지)
 
@@ -821,76 +721,209 @@ class MolitRealEstateAPI:
             lawd_cd: 지역코드
             deal_ymd: 거래년월
             num_of_rows: 페이지당 조회 건수 (최대 1000)
+            refresh: 저장된 응답을 재사용하지 않고 모든 페이지를 API로 다시 조회
 
         Returns:
             전체 전월세 데이터 딕셔너리
         """
-        all_transactions = []
-        page_no = 1
-        total_count_from_api = 0
+        if not refresh:
+            self._revalidate_stored_month('rent', lawd_cd, deal_ymd, num_of_rows)
 
-        while True:
-            # 페이지별 데이터 조회
-            result = self.get_apt_rent_data(lawd_cd, deal_ymd, page_no, num_of_rows)
+        return self._fetch_all_pages(
+            lambda page_no: self.get_apt_rent_data(lawd_cd, deal_ymd, page_no, num_of_rows, refresh=refresh),
+            '전월세',
+            num_of_rows
+        )
 
-            if not result.get('success'):
-                self.logger.error(f"전월세 데이터 조회 실패 (페이지 {page_no}): {result.get('error')}")
-                break
+    def _revalidate_stored_month(self, endpoint: str, lawd_cd: str, deal_ymd: str, num_of_rows: int) -> Optional[bool]:
+        """
+        TTL이 지난 최근 월에 대해 numOfRows=1 프로브로 totalCount 변경 여부 확인
 
-            transactions = result.get('data', [])
-            if not transactions:
-                # 더 이상 데이터가 없으면 종료
-                break
+        건수가 지난번 저장 시점과 같으면 저장된 페이지들의 검증 시각을 갱신하여
+        이어지는 전체 페이지 조회가 저장소에서 처리되도록 합니다.
+        (건수 변화 없이 기존 거래가 수정/해제된 경우는 다음 TTL 만료 전까지 반영되지 않음)
+
+        Returns:
+            True: 변경 없음(프로브 적중), False: 변경됨/확인 실패, None: 프로브 불필요
+        """
+        if not (self.response_store and self.change_probe_enabled):
+            return None
+
+        entry = self.response_store.lookup(endpoint, lawd_cd, deal_ymd, 1, num_of_rows)
+        if entry is None or entry['fresh']:
+            return None
+
+        fetch = self.get_apt_trade_data if endpoint == 'sale' else self.get_apt_rent_data
+        probe = fetch(lawd_cd, deal_ymd, page_no=1, num_of_rows=1, use_store=False)
+
+        if not probe.get('success') or self._is_demo_result(probe):
+            self._count_probe('errors')
+            self.logger.warning(f"⚠️ 변경 감지 프로브 실패, 전체 재조회: {endpoint} {lawd_cd} {deal_ymd}")
+            return False
 
-            all_transactions.extend(transactions)
+        stored_total = int(entry.get('total_count', 0))
+        current_total = int(probe.get('total_count', 0))
 
-            # 첫 페이지에서 전체 건수 확인
-            if page_no == 1:
-                total_count_from_api = result.get('total_count', 0)
-                self.logger.info(f"📊 전월세 데이터 전체 건수: {total_count_from_api}건, 페이지당 {num_of_rows}건씩 수집")
+        if current_total != stored_total:
+            self._count_probe('misses')
+            self.logger.info(f"🔄 {deal_ymd} {endpoint} 건수 변경 ({stored_total} → {current_total}), 전체 재조회")
+            return False
 
-            # 수집된 데이터가 전체 건수와 같거나 페이지당 데이터가 num_of_rows보다 적으면 종료
-            if len(all_transactions) >= total_count_from_api or len(transactions) < num_of_rows:
+        total_pages = max(1, math.ceil(stored_total / num_of_rows))
+        for page_no in range(1, total_pages + 1):
+            self.response_store.touch(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows)
+
+        self._count_probe('hits')
+        self.logger.info(f"✅ {deal_ymd} {endpoint} 변경 없음 ({current_total}건), 저장된 응답 재사용")
+        return True
+
+    def _count_probe(self, stat: str):
+        with self._probe_lock:
+            self._probe_stats[stat] += 1
+
+    @staticmethod
+    def _is_demo_result(result: Dict) -> bool:
+        """API 호출 실패로 데모 데이터가 대체된 결과인지 여부"""
+        return bool(result.get('is_demo') or result.get('demo'))
+
+    def _fetch_page_with_retry(self, fetch_page, page_no: int, data_name: str) -> Dict:
+        """
+        페이지 단위 조회 (실패한 페이지만 개별 재시도, 호출 한도 초과 시 재시도 안 함)
+
+        네트워크 오류로 데모 데이터가 대체된 페이지도 실패로 보고 재시도합니다.
+        """
+        result = {'success': False, 'error': '조회되지 않음', 'data': []}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                time.sleep(min(0.5 * (2 ** (attempt - 1)), 4))
+                self.logger.info(f"🔁 {data_name} 데이터 페이지 {page_no} 재시도 ({attempt}/{self.max_retries})")
+
+            try:
+                result = fetch_page(page_no)
+            except Exception as e:
+                result = {'success': False, 'error': str(e), 'data': []}
+
+            if (result.get('success') and not self._is_demo_result(result)) or result.get('quota_exceeded'):
                 break
 
-            page_no += 1
-            self.logger.info(f"📄 전월세 데이터 페이지 {page_no} 수집 중... (현재까지 {len(all_transactions)}건)")
+        return result
 
-        self.logger.info(f"✅ 전월세 데이터 전체 수집 완료: {len(all_transactions)}건 (API 총 {total_count_from_api}건)")
+    def _fetch_all_pages(self, fetch_page, data_name: str, num_of_rows: int) -> Dict:
+        """
+        전체 페이지 조회 - 1페이지에서 전체 건수를 확인한 뒤 나머지 페이지를 병렬 조회
+
+        Args:
+            fetch_page: page_no를 받아 페이지 조회 결과를 반환하는 함수
+            data_name: 로그용 데이터 이름 ('매매', '전월세')
+            num_of_rows: 페이지당 조회 건수
+
+        Returns:
+            페이지 순서대로 합쳐진 전체 데이터 딕셔너리
+        """
+        first_page = self._fetch_page_with_retry(fetch_page, 1, data_name)
+
+        if self._is_demo_result(first_page):
+            # 첫 페이지부터 API 조회에 실패한 경우 데모 데이터만 반환 (실패 페이지로 표시해 캐시/저장 제외)
+            self.logger.error(f"{data_name} 데이터 조회 실패 (페이지 1), 데모 데이터로 대체")
+            return {
+                'success': True,
+                'data': first_page.get('data', []),
+                'total_count': len(first_page.get('data', [])),
+                'api_total_count': 0,
+                'pages_fetched': 0,
+                'failed_pages': [1],
+                'quota_exceeded': False,
+                'is_demo': True
+            }
+
+        if not first_page.get('success'):
+            self.logger.error(f"{data_name} 데이터 조회 실패 (페이지 1): {first_page.get('error')}")
+            return {
+                'success': True,
+                'data': [],
+                'total_count': 0,
+                'api_total_count': 0,
+                'pages_fetched': 1,
+                'failed_pages': [1],
+                'quota_exceeded': first_page.get('quota_exceeded', False)
+            }
+
+        page_data = {1: first_page.get('data', [])}
+        total_count_from_api = first_page.get('total_count', 0)
+        self.logger.info(f"📊 {data_name} 데이터 전체 건수: {total_count_from_api}건, 페이지당 {num_of_rows}건씩 수집")
+
+        # 1페이지로 전체 건수가 확인되면 나머지 페이지를 한 번에 병렬 요청
+        # (파싱 중 스킵된 행이 있어도 페이지 수는 API의 totalCount 기준으로 계산)
+        total_pages = 1
+        if num_of_rows > 0 and total_count_from_api > num_of_rows:
+            total_pages = -(-total_count_from_api // num_of_rows)
+
+        failed_pages = []
+        quota_exceeded = False
+        is_demo = False
+
+        if total_pages > 1:
+            remaining_pages = list(range(2, total_pages + 1))
+            workers = max(1, min(self.page_workers, len(remaining_pages)))
+            self.logger.info(f"📄 {data_name} 데이터 페이지 2~{total_pages} 병렬 수집 중... (동시 {workers}페이지)")
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                future_to_page = {
+                    executor.submit(self._fetch_page_with_retry, fetch_page, page_no, data_name): page_no
+                    for page_no in remaining_pages
+                }
+
+                for future in as_completed(future_to_page):
+                    page_no = future_to_page[future]
+                    result = future.result()
+
+                    if result.get('success') and not self._is_demo_result(result):
+                        page_data[page_no] = result.get('data', [])
+                    elif self._is_demo_result(result):
+                        # 재시도 후에도 데모 데이터로 대체된 페이지는 실패 처리 (데모 행은 합치지 않음)
+                        failed_pages.append(page_no)
+                        is_demo = True
+                        self.logger.error(f"{data_name} 데이터 조회 실패 (페이지 {page_no}): 데모 데이터로 대체되어 제외")
+                    else:
+                        failed_pages.append(page_no)
+                        quota_exceeded = quota_exceeded or result.get('quota_exceeded', False)
+                        self.logger.error(f"{data_name} 데이터 조회 실패 (페이지 {page_no}): {result.get('error')}")
+
+        # 페이지 순서대로 재조립
+        all_transactions = []
+        for page_no in sorted(page_data):
+            all_transactions.extend(page_data[page_no])
+
+        if failed_pages:
+            self.logger.warning(f"⚠️ {data_name} 데이터 일부 페이지 수집 실패: {sorted(failed_pages)}")
+
+        self.logger.info(f"✅ {data_name} 데이터 전체 수집 완료: {len(all_transactions)}건 (API 총 {total_count_from_api}건)")
 
         return {
             'success': True,
             'data': all_transactions,
             'total_count': len(all_transactions),
             'api_total_count': total_count_from_api,
-            'pages_fetched': page_no
+            'pages_fetched': len(page_data),
+            'failed_pages': sorted(failed_pages),
+            'quota_exceeded': quota_exceeded,
+            'is_demo': is_demo  # 데모 데이터로 대체된 페이지가 있었던 경우 (해당 페이지 행은 제외됨)
         }
 
-    def get_multiple_months_data(self, lawd_cd: str, months: int = 6, start_date: str = None, end_date: str = None, progress_callback=None) -> List[Dict]:
-        """여러 개월 실거래 데이터 조회"""
-        all_transactions = []
-        
+    def _get_target_months(self, months: int = 6, start_date: str = None, end_date: str = None) -> List[datetime]:
+        """조회 대상 월 목록 생성 (각 월의 첫째 날, 조회 순서대로)"""
+        target_months = []
+
         if start_date and end_date:
             # 날짜 범위로 조회
             start = datetime.strptime(start_date, "%Y-%m-%d")
             end = datetime.strptime(end_date, "%Y-%m-%d")
-            
+
             current = start.replace(day=1)  # 월의 첫째 날로 설정
             while current <= end:
-                deal_ymd = current.strftime("%Y%m")
-                result = self.get_combined_apt_data(lawd_cd, deal_ymd)
-                if result['success']:
-                    # 날짜 범위 + 매매 데이터 필터링
-                    filtered_data = [
-                        tx for tx in result['data']
-                        if (start <= datetime.strptime(tx['deal_date'], "%Y-%m-%d") <= end and
-                            not tx.get('rentFee') and not tx.get('deposit') and not tx.get('monthlyRent'))
-                    ]
-                    all_transactions.extend(filtered_data)
-                    self.logger.info(f"{deal_ymd} 통합 데이터 {len(result['data'])}건 수집 → 매매 데이터 {len(filtered_data)}건 필터링 (날짜 범위)")
-                else:
-                    self.logger.warning(f"{deal_ymd} 통합 데이터 수집 실패: {result.get('error', '알 수 없는 오류')}")
-                
+                target_months.append(current)
+
                 # 다음 달로 이동
                 if current.month == 12:
                     current = current.replace(year=current.year + 1, month=1)
@@ -909,100 +942,192 @@ class MolitRealEstateAPI:
                     month += 12
                     year -= 1
 
-                target_date = datetime(year, month, 1)
-                deal_ymd = target_date.strftime("%Y%m")
+                target_months.append(datetime(year, month, 1))
 
-                # 진행률 콜백 호출 (시작)
-                if progress_callback:
-                    progress_callback(i, months, f"{year}년 {month}월", len(all_transactions), f"{year}년 {month}월 데이터 조회 중...")
-
-                result = self.get_combined_apt_data(lawd_cd, deal_ymd)
-                if result['success']:
-                    # 매매 데이터만 필터링 (거래유형이 없거나 전월세 관련 필드가 없는 데이터)
-                    sale_data = [
-                        tx for tx in result['data']
-                        if not tx.get('rentFee') and not tx.get('deposit') and not tx.get('monthlyRent')
-                    ]
-                    all_transactions.extend(sale_data)
-                    self.logger.info(f"{deal_ymd} 통합 데이터 {len(result['data'])}건 수집 → 매매 데이터 {len(sale_data)}건 필터링")
-
-                    # 진행률 콜백 호출 (완료)
-                    if progress_callback:
-                        progress_callback(i + 1, months, f"{year}년 {month}월", len(all_transactions), f"{year}년 {month}월 데이터 수집 완료")
+        return target_months
+
+    def _fetch_months_concurrently(self, target_months: List[datetime], fetch_month, progress_callback=None,
+                                   data_label: str = '', max_workers: int = None) -> List[List[Dict]]:
+        """
+        월 단위 요청을 병렬로 수행하고 월 순서대로 결과 반환
+
+        Args:
+            target_months: 조회 대상 월 목록 (결과 순서 기준)
+            fetch_month: deal_ymd를 받아 {'success', 'data', 'error'} 딕셔너리를 반환하는 함수
+            progress_callback: 진행률 콜백 (월이 완료될 때마다 호출)
+            data_label: 진행률 메시지용 데이터 구분 (예: '전월세 ')
+            max_workers: 동시 조회 월 수 (기본값: API_MONTH_WORKERS)
+
+        Returns:
+            월별 거래 데이터 목록 (target_months 순서)
+        """
+        total_months = len(target_months)
+        monthly_results = [[] for _ in range(total_months)]
+        if total_months == 0:
+            return monthly_results
+
+        workers = max(1, min(max_workers or self.month_workers, total_months))
+        completed = 0
+        collected = 0
+
+        # 진행률 콜백 호출 (시작)
+        if progress_callback:
+            first = target_months[0]
+            progress_callback(0, total_months, f"{first.year}년 {first.month}월", 0,
+                              f"{first.year}년 {first.month}월 {data_label}데이터 조회 중...")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_index = {
+                executor.submit(fetch_month, target.strftime("%Y%m")): index
+                for index, target in enumerate(target_months)
+            }
+
+            for future in as_completed(future_to_index):
+                if future.cancelled():
+                    continue
+
+                index = future_to_index[future]
+                target = target_months[index]
+                month_label = f"{target.year}년 {target.month}월"
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'success': False, 'error': str(e), 'data': []}
+
+                completed += 1
+                if result.get('success'):
+                    monthly_results[index] = result.get('data', [])
+                    collected += len(monthly_results[index])
+                    message = f"{month_label} {data_label}데이터 수집 완료"
                 else:
-                    self.logger.warning(f"{deal_ymd} 통합 데이터 수집 실패: {result.get('error', '알 수 없는 오류')}")
+                    self.logger.warning(f"{target.strftime('%Y%m')} {data_label}데이터 수집 실패: {result.get('error', '알 수 없는 오류')}")
+                    message = f"{month_label} {data_label}데이터 수집 실패"
 
-                    # 진행률 콜백 호출 (실패)
-                    if progress_callback:
-                        progress_callback(i + 1, months, f"{year}년 {month}월", len(all_transactions), f"{year}년 {month}월 데이터 수집 실패")
+                # 진행률 콜백 호출 (완료/실패)
+                if progress_callback:
+                    progress_callback(completed, total_months, month_label, collected, message)
 
-        return all_transactions
+                # 호출 한도 초과 시 아직 시작하지 않은 월은 요청하지 않음
+                if result.get('quota_exceeded'):
+                    cancelled = sum(1 for pending in future_to_index if pending.cancel())
+                    if cancelled:
+                        self.logger.warning(f"API 호출 한도 초과 - 남은 {cancelled}개월 조회를 중단합니다.")
 
-    def get_multiple_months_rent_data(self, lawd_cd: str, months: int = 6, start_date: str = None, end_date: str = None, progress_callback=None) -> List[Dict]:
-        """여러 개월 전월세 데이터 조회"""
-        all_transactions = []
+        return monthly_results
 
+    def get_multiple_months_by_plan(self, lawd_cd: str, search_type: str = 'sale', months: int = 6, start_date: str = None, end_date: str = None, progress_callback=None, max_workers: int = None,
+                                    refresh: bool = False) -> List[Dict]:
+        """
+        검색 유형별 여러 개월 데이터 조회 (월 단위 병렬 수집, 월 순서 유지)
+
+        Args:
+            lawd_cd: 지역코드
+            search_type: 검색 유형 ('sale', 'rent', 'all') - 필요한 엔드포인트만 호출
+            months: 조회 개월 수 (start_date/end_date가 없을 때)
+            start_date: 조회 시작일 (YYYY-MM-DD)
+            end_date: 조회 종료일 (YYYY-MM-DD)
+            progress_callback: 진행률 콜백
+            max_workers: 동시 조회 월 수 (기본값: API_MONTH_WORKERS)
+            refresh: 저장된 원본 응답을 재사용하지 않고 API로 다시 조회 (강제 새로고침)
+
+        Returns:
+            거래 데이터 목록
+        """
+        data_name = {'sale': '매매', 'rent': '전월세'}.get(search_type, '통합')
+        data_label = '전월세 ' if search_type == 'rent' else ''
+
+        date_range = None
         if start_date and end_date:
-            # 날짜 범위로 조회
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            date_range = (datetime.strptime(start_date, "%Y-%m-%d"), datetime.strptime(end_date, "%Y-%m-%d"))
 
-            current = start.replace(day=1)  # 월의 첫째 날로 설정
-            while current <= end:
-                deal_ymd = current.strftime("%Y%m")
-                result = self.get_apt_rent_data(lawd_cd, deal_ymd)
-                if result['success']:
-                    # 날짜 범위에 맞는 데이터만 필터링
-                    filtered_data = [
-                        tx for tx in result['data']
-                        if start <= datetime.strptime(tx['deal_date'], "%Y-%m-%d") <= end
-                    ]
-                    all_transactions.extend(filtered_data)
-                    self.logger.info(f"{deal_ymd} 전월세 데이터 {len(filtered_data)}건 수집 (날짜 범위 필터링)")
-                else:
-                    self.logger.warning(f"{deal_ymd} 전월세 데이터 수집 실패: {result.get('error', '알 수 없는 오류')}")
+        def fetch_month(deal_ymd: str) -> Dict:
+            result = self.get_combined_apt_data(lawd_cd, deal_ymd, num_of_rows=1000, search_type=search_type,
+                                                refresh=refresh)
+            if not result['success']:
+                return result
 
-                # 다음 달로 이동
-                if current.month == 12:
-                    current = current.replace(year=current.year + 1, month=1)
-                else:
-                    current = current.replace(month=current.month + 1)
-        else:
-            # 기존 방식: 개월 수로 조회 - 정확한 월별 계산
-            current_date = datetime.now()
-            for i in range(months):
-                # 현재월부터 과거로 정확히 월 단위로 거슬러 올라감
-                year = current_date.year
-                month = current_date.month - i
+            month_data = result['data']
+            if date_range:
+                # 날짜 범위에 맞는 데이터만 필터링
+                start, end = date_range
+                month_data = [tx for tx in month_data if start <= datetime.strptime(tx['deal_date'], "%Y-%m-%d") <= end]
+                self.logger.info(f"{deal_ymd} {data_name} 데이터 {len(month_data)}건 수집 (날짜 범위 필터링)")
+            else:
+                self.logger.info(f"{deal_ymd} {data_name} 데이터 {len(month_data)}건 수집")
 
-                # 월이 0 이하가 되면 이전 연도로 이동
-                while month <= 0:
-                    month += 12
-                    year -= 1
+            return {'success': True, 'data': month_data, 'quota_exceeded': result.get('quota_exceeded', False)}
 
-                target_date = datetime(year, month, 1)
-                deal_ymd = target_date.strftime("%Y%m")
+        monthly_results = self._fetch_months_concurrently(
+            self._get_target_months(months, start_date, end_date),
+            fetch_month,
+            progress_callback=progress_callback,
+            data_label=data_label,
+            max_workers=max_workers
+        )
 
-                # 진행률 콜백 호출 (시작)
-                if progress_callback:
-                    progress_callback(i, months, f"{year}년 {month}월", len(all_transactions), f"{year}년 {month}월 전월세 데이터 조회 중...")
+        return [tx for month_data in monthly_results for tx in month_data]
 
-                result = self.get_apt_rent_data(lawd_cd, deal_ymd)
-                if result['success']:
-                    all_transactions.extend(result['data'])
-                    self.logger.info(f"{deal_ymd} 전월세 데이터 {len(result['data'])}건 수집")
+    def get_month_segments(self, lawd_cd: str, month_plans: Dict[str, str], progress_callback=None,
+                           max_workers: int = None, refresh: bool = False) -> Dict[tuple, Dict]:
+        """
+        월마다 필요한 엔드포인트만 조회해 (계약년월, 엔드포인트) 구간 단위로 반환 (검색 구간 캐시 채우기용)
 
-                    # 진행률 콜백 호출 (완료)
-                    if progress_callback:
-                        progress_callback(i + 1, months, f"{year}년 {month}월", len(all_transactions), f"{year}년 {month}월 전월세 데이터 수집 완료")
-                else:
-                    self.logger.warning(f"{deal_ymd} 전월세 데이터 수집 실패: {result.get('error', '알 수 없는 오류')}")
+        Args:
+            lawd_cd: 지역코드
+            month_plans: {deal_ymd: 검색 유형} - 월마다 조회할 엔드포인트 ('sale', 'rent', 'all')
+            progress_callback: 진행률 콜백
+            max_workers: 동시 조회 월 수 (기본값: API_MONTH_WORKERS)
+            refresh: 저장된 원본 응답을 재사용하지 않고 API로 다시 조회 (강제 새로고침)
 
-                    # 진행률 콜백 호출 (실패)
-                    if progress_callback:
-                        progress_callback(i + 1, months, f"{year}년 {month}월", len(all_transactions), f"{year}년 {month}월 전월세 데이터 수집 실패")
+        Returns:
+            {(deal_ymd, 엔드포인트): {'data': 거래 목록(거래일 내림차순), 'complete': 캐시해도 되는지,
+                                   'is_demo': 데모 데이터 대체 여부}}
+            실패 페이지가 있거나 데모 데이터로 대체된 구간은 complete=False이고, 데모 구간의 거래에는
+            is_demo=True를 붙입니다 (캐시/DB 저장 제외용).
+        """
+        segments = {}
 
-        return all_transactions
+        def fetch_month(deal_ymd: str) -> Dict:
+            search_type = month_plans[deal_ymd]
+            result = self.get_combined_apt_data(lawd_cd, deal_ymd, num_of_rows=1000, search_type=search_type,
+                                                refresh=refresh)
+            if not result['success']:
+                return result
+
+            # 통합 결과는 거래일 내림차순이므로 엔드포인트별로 나눠도 같은 순서 유지
+            month_segments = {endpoint: [] for endpoint in FETCH_PLANS.get(search_type, FETCH_PLANS['all'])}
+            for tx in result['data']:
+                month_segments['sale' if tx.get('transaction_type') == '매매' else 'rent'].append(tx)
+
+            for endpoint, data in month_segments.items():
+                endpoint_result = result[f'{endpoint}_data']
+                is_demo = self._is_demo_result(endpoint_result)
+                if is_demo:
+                    for tx in data:
+                        tx['is_demo'] = True
+                complete = (endpoint_result.get('success', False) and not endpoint_result.get('failed_pages')
+                            and not is_demo)
+                segments[(deal_ymd, endpoint)] = {'data': data, 'complete': complete, 'is_demo': is_demo}
+
+            self.logger.info(f"{deal_ymd} 구간 데이터 {len(result['data'])}건 수집 ({'/'.join(month_segments)})")
+            return result
+
+        self._fetch_months_concurrently(
+            [datetime.strptime(deal_ymd, "%Y%m") for deal_ymd in month_plans],
+            fetch_month,
+            progress_callback=progress_callback,
+            max_workers=max_workers
+        )
+        return segments
+
+    def get_multiple_months_data(self, lawd_cd: str, months: int = 6, start_date: str = None, end_date: str = None, progress_callback=None, max_workers: int = None) -> List[Dict]:
+        """여러 개월 실거래(매매) 데이터 조회 - 매매 엔드포인트만 호출"""
+        return self.get_multiple_months_by_plan(lawd_cd, 'sale', months, start_date, end_date, progress_callback, max_workers)
+
+    def get_multiple_months_rent_data(self, lawd_cd: str, months: int = 6, start_date: str = None, end_date: str = None, progress_callback=None, max_workers: int = None) -> List[Dict]:
+        """여러 개월 전월세 데이터 조회 - 전월세 엔드포인트만 호출"""
+        return self.get_multiple_months_by_plan(lawd_cd, 'rent', months, start_date, end_date, progress_callback, max_workers)
 
     def _get_demo_transaction_data(self, lawd_cd: str, deal_ymd: str) -> Dict:
         """데모용 실거래 데이터 생성"""
@@ -1099,9 +1224,9 @@ class MolitRealEstateAPI:
             'is_demo': True
         }
 
-    def search_apartments_by_name(self, lawd_cd: str, apt_name: str, months: int = 12) -> List[Dict]:
-        """단지명으로 아파트 검색"""
-        all_data = self.get_multiple_months_data(lawd_cd, months)
+    def search_apartments_by_name(self, lawd_cd: str, apt_name: str, months: int = 12, refresh: bool = False) -> List[Dict]:
+        """단지명으로 아파트 검색 (refresh면 저장된 원본 응답을 재사용하지 않고 API로 다시 조회)"""
+        all_data = self.get_multiple_months_by_plan(lawd_cd, 'sale', months, refresh=refresh)
         
         # 단지명으로 필터링 (부분 일치)
         filtered_data = [
@@ -1111,101 +1236,64 @@ class MolitRealEstateAPI:
         
         return filtered_data
 
-    def _get_xml_text(self, element, tag: str, default: str = "") -> str:
-        """XML 요소에서 텍스트 추출"""
-        child = element.find(tag)
-        return child.text.strip() if child is not None and child.text else default
-
-    def _parse_amount(self, amount_str: str) -> int:
-        """거래금액 파싱 (쉼표 제거 후 정수 변환, 만원 단위)"""
-        try:
-            # MOLIT API의 dealAmount는 만원 단위로 제공됨
-            # 예: "154,500" -> 154,500만원 (15억 4천 5백만원)
-            return int(amount_str.replace(',', '').strip())
-        except:
-            return 0
-
-    def _safe_int(self, value_str: str) -> int:
-        """안전한 정수 변환 (쉼표 제거)"""
-        try:
-            return int(value_str.replace(',', '').strip()) if value_str else 0
-        except:
-            return 0
-
     def _rate_limit(self):
-        """API 호출 간격 제어"""
-        if self.request_delay > 0:
-            time.sleep(self.request_delay)
+        """API 호출 속도 제어 (공유 토큰 버킷에서 토큰 획득)"""
+        wait_time = self.rate_limiter.acquire()
+        if wait_time > 0:
+            self.logger.debug(f"⏳ 호출 속도 제한 대기: {wait_time:.3f}초")
+
+    def _load_stored_response(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int, parse) -> Optional[Dict]:
+        """저장소에 재사용 가능한 원본 응답이 있으면 파싱 결과 반환"""
+        if not self.response_store:
+            return None
+
+        xml_text = self.response_store.get(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows)
+        if xml_text is None:
+            return None
+
+        result = parse(xml_text, lawd_cd, deal_ymd)
+        if not result.get('success'):
+            return None
+
+        self.logger.info(f"💾 저장된 원본 응답 사용: {endpoint} {lawd_cd} {deal_ymd} 페이지 {page_no} ({len(result.get('data', []))}건)")
+        result['from_store'] = True
+        return result
+
+    def _save_response(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int, xml_text: str, result: Dict):
+        """정상 파싱된 원본 응답만 저장 (오류/한도 초과 응답은 저장하지 않음)"""
+        if self.response_store and result.get('success'):
+            self.response_store.put(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows, xml_text, result.get('total_count', 0))
+
+    def get_fetch_statistics(self) -> Dict:
+        """API 수집 관련 통계 반환"""
+        return {
+            'rate_limiter': self.rate_limiter.get_metrics(),
+            'response_store': self.response_store.get_statistics() if self.response_store else None,
+            'change_probe': self._get_probe_statistics()
+        }
 
-    def get_cities(self) -> List[str]:
-        """시/도 목록 반환"""
-        return list(self.region_hierarchy.keys())
+    def _get_probe_statistics(self) -> Dict:
+        """변경 감지 프로브 적중/미적중 통계"""
+        with self._probe_lock:
+            stats = dict(self._probe_stats)
 
-    def get_districts(self, city: str) -> List[Dict]:
-        """특정 시/도의 군/구 목록 반환 (dong_code_active.txt에서 파싱)"""
-        districts = []
+        probes = stats['hits'] + stats['misses'] + stats['errors']
+        stats['enabled'] = self.change_probe_enabled
+        stats['probes'] = probes
+        stats['hit_rate'] = round(stats['hits'] / probes * 100, 1) if probes else 0.0
+        return stats
 
-        # dong_code_active.txt에서 해당 시/도의 군/구 목록을 찾기
+    def get_districts(self, city: str) -> List[Dict]:
+        """특정 시/도의 군/구 목록 반환 (dong_code_active.txt 색인 사용)"""
         try:
-            with open('dong_code_active.txt', 'r', encoding='utf-8') as f:
-                lines = f.readlines()[1:]  # 헤더 제외
-
-            # 첫 번째 패스: 모든 군/구 정보 수집 및 하위 구를 가진 시 식별
-            all_districts = []
-            parent_cities_with_sub_districts = set()
-
-            for line in lines:
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    code = parts[0]
-                    name = parts[1]
-
-                    # 시/도 매칭 확인 (3단계 데이터에서 군/구 추출)
-                    if name.startswith(city + ' '):
-                        # 3단계 데이터에서 군/구 추출 (예: "서울특별시 종로구 청운동" -> "종로구")
-                        name_parts = name.split(' ')
-                        if len(name_parts) >= 3:  # 시/도 + 군/구 + 동
-                            district_name = name_parts[1]  # 군/구 부분
-                            district_code = code[:5] + '00000'  # 군/구 코드 생성
-
-                            # 중복 방지를 위한 키
-                            district_key = f"{city}_{district_name}"
-                            if district_key not in [d.get('key') for d in all_districts]:
-                                all_districts.append({
-                                    'name': district_name,
-                                    'code': district_code,
-                                    'full_name': f'{city} {district_name}',
-                                    'key': district_key
-                                })
-
-                                # 하위 구가 있는 상위 시 식별 (예: "고양시 덕양구"에서 "고양시" 추출)
-                                if ' ' in district_name:
-                                    parent_city = district_name.split(' ')[0]
-                                    parent_cities_with_sub_districts.add(parent_city)
-
-            # 두 번째 패스: 하위 구가 있는 상위 시는 제외하고 최종 목록 생성
-            seen_districts = set()
-            for district in all_districts:
-                district_name = district['name']
-
-                # 하위 구가 있는 상위 시는 제외
-                if district_name in parent_cities_with_sub_districts:
-                    self.logger.info(f"🚫 하위 구가 있는 상위 시 제외: {district_name}")
-                    continue
-
-                # 중복 제거
-                if district_name not in seen_districts:
-                    districts.append(district)
-                    seen_districts.add(district_name)
-                    self.logger.debug(f"✅ 군/구 추가: {district_name} (코드: {district['code']})")
-
-            self.logger.info(f"📍 {city} 최종 군/구 목록: {len(districts)}개 (제외된 상위 시: {parent_cities_with_sub_districts})")
-            return sorted(districts, key=lambda x: x['name'])
+            districts = get_region_index().districts(city)
+            self.logger.info(f"📍 {city} 최종 군/구 목록: {len(districts)}개")
+            return districts
 
         except FileNotFoundError:
             # 파일이 없으면 기존 방식 사용 (하위 구가 있는 상위 시 제외)
+            districts = []
             if city in self.region_hierarchy:
-                districts = []
                 for district, code_or_dict in self.region_hierarchy[city].items():
                     if isinstance(code_or_dict, str):
                         # 단순 시/군/구
@@ -1228,154 +1316,41 @@ class MolitRealEstateAPI:
 
                         self.logger.info(f"🚫 하위 구가 있는 상위 시 제외: {district}")
             return sorted(districts, key=lambda x: x['name'])
-        return []
 
     def get_cities(self) -> List[Dict]:
-        """dong_code_active.txt에서 시/도 목록 반환"""
-        cities = []
-        seen_cities = set()
-
+        """dong_code_active.txt 색인에서 시/도 목록 반환"""
         try:
-            with open('dong_code_active.txt', 'r', encoding='utf-8') as f:
-                lines = f.readlines()[1:]  # 헤더 제외
-
-            for line in lines:
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    name = parts[1]
-                    name_parts = name.split(' ')
-
-                    if len(name_parts) >= 3:  # 시/도 + 군/구 + 동 형태
-                        city_name = name_parts[0]  # 첫 번째가 시/도
-
-                        if city_name not in seen_cities:
-                            cities.append({
-                                'name': city_name,
-                                'full_name': city_name
-                            })
-                            seen_cities.add(city_name)
-
-            return sorted(cities, key=lambda x: x['name'])
+            return get_region_index().cities()
         except Exception as e:
             self.logger.error(f"시/도 목록 조회 오류: {e}")
             return []
 
     def get_towns(self, city: str, district: str) -> List[Dict]:
-        """dong_code_active.txt에서 특정 시/도, 군/구의 읍/면/동 목록 반환 (3단계 계층)"""
-        towns = []
-        seen_towns = set()
-
+        """dong_code_active.txt 색인에서 특정 시/도, 군/구의 읍/면/동 목록 반환 (3단계 계층)"""
         try:
-            with open('dong_code_active.txt', 'r', encoding='utf-8') as f:
-                lines = f.readlines()[1:]  # 헤더 제외
-
-            target_prefix = f"{city} {district}"
-
-            for line in lines:
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    code = parts[0]
-                    name = parts[1]
-                    name_parts = name.split(' ')
-
-                    # 해당 시/도, 군/구에 속하는지 확인
-                    if name.startswith(target_prefix):
-                        if len(name_parts) >= 3:  # 최소 시/도 + 군/구 + 읍/면/동
-                            town_name = name_parts[2]  # 세 번째가 읍/면/동
-
-                            # 4단계(리) 데이터가 있는 경우도 포함
-                            if len(name_parts) >= 4:
-                                # "산성면 백학리" 형태
-                                full_town_name = f"{town_name} {name_parts[3]}"
-
-                                if full_town_name not in seen_towns:
-                                    towns.append({
-                                        'name': full_town_name,
-                                        'code': code[:8],  # 읍/면/동 + 리 코드
-                                        'full_name': name,
-                                        'level': 4  # 리 단위
-                                    })
-                                    seen_towns.add(full_town_name)
-
-                            # 3단계(읍/면/동) 데이터
-                            if town_name not in seen_towns:
-                                towns.append({
-                                    'name': town_name,
-                                    'code': code[:6] + '00',  # 읍/면/동 코드
-                                    'full_name': f"{target_prefix} {town_name}",
-                                    'level': 3  # 읍/면/동 단위
-                                })
-                                seen_towns.add(town_name)
-
-            return sorted(towns, key=lambda x: (x.get('level', 3), x['name']))
+            return get_region_index().towns(city, district)
         except Exception as e:
             self.logger.error(f"읍/면/동 목록 조회 오류: {e}")
             return []
 
     def get_dongs_from_file(self, city: str, district: str) -> List[Dict]:
-        """dong_code_active.txt에서 특정 시/도, 군/구의 법정동 목록 반환"""
-        dongs = []
-
+        """dong_code_active.txt 색인에서 특정 시/도, 군/구의 법정동 목록 반환"""
         try:
-            with open('dong_code_active.txt', 'r', encoding='utf-8') as f:
-                lines = f.readlines()[1:]  # 헤더 제외
-
-            target_prefix = f"{city} {district}"
-            seen_dongs = set()
-
-            for line in lines:
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    code = parts[0]
-                    name = parts[1]
-
-                    # 해당 시/도, 군/구에 속하는지 확인
-                    if name.startswith(target_prefix):
-                        # 읍/면/동 레벨만 가져오기 (리 단위 제외)
-                        # 시/군/구는 끝 5자리가 00000이므로 제외
-                        name_parts = name.split()
-                        if not code.endswith('00000'):
-                            # target_prefix 다음에 오는 첫 번째 단어가 읍/면/동
-                            target_parts = target_prefix.split()
-                            if len(name_parts) > len(target_parts):
-                                dong_name = name_parts[len(target_parts)]  # target_prefix 다음 단어
-                                # 리 단위가 아닌 읍/면/동만 (리로 끝나지 않는 것)
-                                if dong_name and not dong_name.endswith('리') and dong_name not in seen_dongs:
-                                    dongs.append({
-                                        'name': dong_name,
-                                        'code': code[:5],  # 앞 5자리만 사용 (LAWD_CD)
-                                        'full_name': name
-                                    })
-                                    seen_dongs.add(dong_name)
-
-            return sorted(dongs, key=lambda x: x['name'])
-
+            return get_region_index().dongs(city, district)
         except FileNotFoundError:
             logging.error("dong_code_active.txt 파일을 찾을 수 없습니다")
             return []
 
     def get_region_code_by_city_district(self, city: str, district: str) -> str:
-        """시/도와 군/구로 지역코드 조회 (구 단위 세분화 지원)"""
-        if city in self.region_hierarchy:
-            city_data = self.region_hierarchy[city]
+        """시/도와 군/구로 지역코드 조회 (구 단위 세분화 지원, 계층 데이터에 없으면 법정동 파일 기준)"""
+        code = self.region_code_map.get((city, district))
+        if code:
+            return code
 
-            # 정확한 매칭 시도
-            if district in city_data:
-                code_or_dict = city_data[district]
-                if isinstance(code_or_dict, str):
-                    return code_or_dict
-                elif isinstance(code_or_dict, dict) and '_main' in code_or_dict:
-                    return code_or_dict['_main']
-
-            # 구 단위로 세분화된 경우 검색
-            for city_name, code_or_dict in city_data.items():
-                if isinstance(code_or_dict, dict):
-                    for sub_district, sub_code in code_or_dict.items():
-                        if sub_district != '_main' and f"{city_name} {sub_district}" == district:
-                            return sub_code
-                        elif sub_district != '_main' and sub_district == district:
-                            return sub_code
-        return ''
+        try:
+            return get_region_index().district_code(city, district) or ''
+        except FileNotFoundError:
+            return ''
 
     def get_region_list(self) -> List[Dict]:
         """지원하는 지역 목록 반환 (기존 호환성)"""
@@ -1403,7 +1378,10 @@ class MolitRealEstateAPI:
                 'numOfRows': 1000,
                 'pageNo': 1
             }
-            
+
+            # Rate Limiting 적용
+            self._rate_limit()
+
             response = self.session.get(self.base_url, params=params, timeout=30)
             self.logger.info(f"📡 원본 XML 요청: {self.base_url}")
             self.logger.info(f"📋 요청 파라미터:")
@@ -1431,6 +1409,9 @@ class MolitRealEstateAPI:
                 'pageNo': 1
             }
 
+            # Rate Limiting 적용
+            self._rate_limit()
+
             response = self.session.get(self.rent_url, params=params, timeout=30)
             self.logger.info(f"📡 전월세 원본 XML 요청: {self.rent_url}")
             self.logger.info(f"📋 요청 파라미터:")
@@ -1446,7 +1427,8 @@ class MolitRealEstateAPI:
             self.logger.error(f"전월세 원본 XML 응답 조회 실패: {e}")
             return f"전월세 XML 응답 조회 실패: {str(e)}"
 
-    def get_apt_rent_data(self, lawd_cd: str, deal_ymd: str, page_no: int = 1, num_of_rows: int = 1000) -> Dict:
+    def get_apt_rent_data(self, lawd_cd: str, deal_ymd: str, page_no: int = 1, num_of_rows: int = 1000, use_store: bool = True,
+                          refresh: bool = False) -> Dict:
         """
         아파트 전월세 거래 데이터 조회
 
@@ -1455,16 +1437,24 @@ class MolitRealEstateAPI:
             deal_ymd: 거래년월 (예: 202506)
             page_no: 페이지 번호 (기본값: 1)
             num_of_rows: 한 페이지 결과 수 (기본값: 100)
+            use_store: 원본 응답 저장소 사용 여부 (변경 감지 프로브는 False)
+            refresh: 저장된 응답을 재사용하지 않고 API 호출 (받은 응답은 저장소에 저장 - 강제 새로고침용)
 
         Returns:
             전월세 거래 데이터 딕셔너리
         """
         try:
+            # 재사용 가능한 원본 응답이 저장되어 있으면 네트워크 호출 생략
+            if use_store and not refresh:
+                stored_result = self._load_stored_response('rent', lawd_cd, deal_ymd, page_no, num_of_rows, self._parse_rent_xml_response)
+                if stored_result is not None:
+                    return stored_result
+
             # Rate Limiting 적용
             self._rate_limit()
 
             # API URL 구성
-            url = f"{self.rent_base_url}?serviceKey={self.service_key}&LAWD_CD={lawd_cd}&DEAL_YMD={deal_ymd}&pageNo={page_no}&numOfRows={num_of_rows}"
+            url = self._build_request_url('rent', lawd_cd, deal_ymd, page_no, num_of_rows)
 
             self.logger.info(f"🏠 국토교통부 전월세 API 호출: 지역={lawd_cd}({self.get_region_name(lawd_cd)}), 기간={deal_ymd}")
             self.logger.info(f"📊 요청 파라미터: 페이지={page_no}, 조회건수={num_of_rows}")
@@ -1473,25 +1463,8 @@ class MolitRealEstateAPI:
             # API 호출 시작 시간 기록
             start_time = time.time()
 
-            # 재사용 가능한 세션 사용
-            # SSL 검증으로 먼저 시도
-            try:
-                response = self.session.get(url, timeout=self.timeout)
-            except requests.exceptions.SSLError as ssl_error:
-                self.logger.warning(f"SSL 인증서 오류 발생, 인증서 검증 비활성화로 재시도: {ssl_error}")
-                # SSL 오류 시에만 검증 비활성화
-                import urllib3
-                original_verify = self.session.verify
-                self.session.verify = False
-                try:
-                    with urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning):
-                        response = self.session.get(url, timeout=self.timeout)
-                finally:
-                    # 원래 설정 복원
-                    self.session.verify = original_verify
-            except requests.exceptions.ConnectionError as conn_error:
-                self.logger.error(f"연결 오류: {conn_error}")
-                raise
+            # 재사용 가능한 세션 사용 (스트리밍 파싱 모드에서는 본문을 청크 단위로 수신)
+            response = self._http_get(url, stream=self.streaming_parse)
 
             # 응답 상태 확인
             self.logger.info(f"HTTP 상태코드: {response.status_code}")
@@ -1500,7 +1473,15 @@ class MolitRealEstateAPI:
             response_time = time.time() - start_time
 
             if response.status_code == 200:
-                result = self._parse_rent_xml_response(response.text, lawd_cd, deal_ymd)
+                if self.streaming_parse:
+                    # 스트리밍 모드는 받은 청크를 바로 저장소에 기록 (응답 전체를 메모리에 모으지 않음)
+                    result = self._parse_response_stream('rent', response, lawd_cd, deal_ymd, page_no, num_of_rows,
+                                                         save=use_store)
+                else:
+                    xml_text = response.text
+                    result = self._parse_rent_xml_response(xml_text, lawd_cd, deal_ymd)
+                    if use_store:
+                        self._save_response('rent', lawd_cd, deal_ymd, page_no, num_of_rows, xml_text, result)
 
                 # API 호출 추적 기록
                 if self.api_tracker and self.current_operation_id:
@@ -1561,136 +1542,114 @@ class MolitRealEstateAPI:
         try:
             root = ET.fromstring(xml_content)
 
-            # 결과 코드 확인
-            result_code = root.find('.//resultCode')
-            result_msg = root.find('.//resultMsg')
+            # 결과 코드 및 API 호출 한도 초과 확인
+            header = read_header(root)
+            error_result = self._check_response_header(header, 'rent')
+            if error_result:
+                return error_result
 
-            # API 호출 한도 초과 에러 체크
-            err_msg = root.find('.//errMsg')
-            return_auth_msg = root.find('.//returnAuthMsg')
-            return_reason_code = root.find('.//returnReasonCode')
+            # 데이터 파싱 (필드 매핑 테이블 기반 단일 순회)
+            item_parser = self._create_item_parser('rent', lawd_cd)
+            transactions = []
 
-            if return_reason_code is not None and return_reason_code.text == '22':
-                error_msg = "API 호출 한도 초과 - 전월세 데이터를 가져올 수 없습니다. 내일 다시 시도해주세요."
-                self.logger.warning(f"전월세 API 호출 한도 초과: {return_auth_msg.text if return_auth_msg is not None else ''}")
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'data': [],
-                    'total_count': 0,
-                    'quota_exceeded': True
-                }
+            for item in root.iter('item'):
+                transaction = item_parser.parse(item)
+                if transaction is not None:
+                    transactions.append(transaction)
 
-            if result_code is not None and result_code.text and result_code.text != '000':
-                error_msg = result_msg.text if result_msg is not None else '알 수 없는 오류'
-                self.logger.error(f"전월세 API 오류: {error_msg}")
-                return {
-                    'success': False,
-                    'error': error_msg,
-                    'data': [],
-                    'total_count': 0
-                }
+            return self._build_rent_result(transactions, item_parser.skipped_count, header, lawd_cd, deal_ymd)
 
-            # 데이터 파싱
-            items = root.findall('.//item')
-            transactions = []
-            skipped_count = 0
+        except ET.ParseError as e:
+            self.logger.error(f"전월세 XML 파싱 오류: {e}")
+            return {
+                'success': False,
+                'error': f'XML 파싱 오류: {e}',
+                'data': [],
+                'total_count': 0
+            }
 
-            for item in items:
-                try:
-                    deal_year = int(self._get_xml_text(item, 'dealYear', '0'))
-                    deal_month = int(self._get_xml_text(item, 'dealMonth', '0'))
-                    deal_day = int(self._get_xml_text(item, 'dealDay', '0'))
-
-                    if not (1900 <= deal_year <= 2100):
-                        skipped_count += 1
-                        self.logger.debug(f"전월세 데이터 스킵: 유효하지 않은 거래년도 {deal_year}")
-                        continue
-                    if not (1 <= deal_month <= 12):
-                        skipped_count += 1
-                        self.logger.debug(f"전월세 데이터 스킵: 유효하지 않은 거래월 {deal_month}")
-                        continue
-                    if not (1 <= deal_day <= 31):
-                        skipped_count += 1
-                        self.logger.debug(f"전월세 데이터 스킵: 유효하지 않은 거래일 {deal_year}-{deal_month}-{deal_day}")
-                        continue
-
-                    deal_date = f"{deal_year}-{deal_month:02d}-{deal_day:02d}"
-
-                    # 전월세 특화 필드 파싱
-                    deposit = self._get_xml_text(item, 'deposit', '0')  # 보증금(만원)
-                    monthly_rent = self._get_xml_text(item, 'monthlyRent', '0')  # 월세(만원)
-
-                    # 전세/월세 구분 (월세가 0이면 전세)
-                    transaction_type = "전세" if self._safe_int(monthly_rent) == 0 else "월세"
-
-                    transaction = {
-                        'apt_name': self._get_xml_text(item, 'aptNm', ''),
-                        'build_year': int(self._get_xml_text(item, 'buildYear', '0')),
-                        'contract_term': self._get_xml_text(item, 'contractTerm', ''),
-                        'contract_type': self._get_xml_text(item, 'contractType', ''),
-                        'deal_date': deal_date,
-                        'dong': self._get_xml_text(item, 'dong', ''),
-                        'exclusive_area': float(self._get_xml_text(item, 'excluUseAr', '0')),
-                        'floor': self._get_xml_text(item, 'floor', ''),
-                        'pre_deposit': self._get_xml_text(item, 'preDeposit', ''),
-                        'pre_monthly_rent': self._get_xml_text(item, 'preMonthlyRent', ''),
-                        'region_code': lawd_cd,
-                        'road_name': self._get_xml_text(item, 'roadNm', ''),
-                        'road_name_bonbun': self._get_xml_text(item, 'roadNmBonbun', ''),
-                        'road_name_bubun': self._get_xml_text(item, 'roadNmBubun', ''),
-                        'umd_nm': self._get_xml_text(item, 'umdNm', ''),  # 법정동명
-                        'use_rr_right': self._get_xml_text(item, 'useRRRight', ''),
-
-                        # 전월세 특화 필드
-                        'deposit': self._safe_int(deposit),  # 보증금(만원)
-                        'monthly_rent': self._safe_int(monthly_rent),  # 월세(만원)
-                        'transaction_type': transaction_type,  # 전세/월세
-
-                        # 호환성을 위한 필드
-                        'deal_amount': self._safe_int(deposit),  # 보증금을 거래금액으로 사용
-                        'price_per_area': 0,  # 전월세는 평당가격 계산하지 않음
-
-                        # 추가 필드들 - 전월세용
-                        'apt_dong': self._get_xml_text(item, 'aptDong', ''),  # 아파트동명
-                        'jibun': self._get_xml_text(item, 'jibun', ''),  # 지번
-                        'rgs_date': self._get_xml_text(item, 'rgsDate', ''),  # 등기일자
-                        'sgg_cd': self._get_xml_text(item, 'sggCd', ''),  # 시군구코드
-                        'umd_cd': self._get_xml_text(item, 'umdCd', ''),  # 읍면동코드
-                    }
+    def _build_rent_result(self, transactions: List[Dict], skipped_count: int, header: Dict, lawd_cd: str, deal_ymd: str) -> Dict:
+        """파싱된 전월세 거래로 페이지 결과 구성"""
+        # 총 개수 확인 (API에서 제공하는 totalCount 사용)
+        total_count_value = int(header['totalCount']) if header.get('totalCount') else len(transactions)
 
-                    transactions.append(transaction)
+        self.logger.info(f"✅ 전월세 데이터 파싱 완료: {len(transactions)}건 파싱 (API 총 {total_count_value}건, 스킵 {skipped_count}건)")
 
-                except (ValueError, TypeError) as e:
-                    skipped_count += 1
-                    self.logger.warning(f"전월세 거래 데이터 파싱 실패: {e}")
-                    continue
+        # totalCount와 파싱된 데이터 개수 차이 로깅
+        if total_count_value > len(transactions):
+            self.logger.warning(f"⚠️ totalCount({total_count_value})와 파싱된 데이터({len(transactions)})에 차이가 있습니다.")
+            self.logger.warning(f"파싱 중 스킵된 데이터: {skipped_count}건")
+            expected_parsed = total_count_value - skipped_count
+            if expected_parsed != len(transactions):
+                self.logger.warning(f"예상 파싱 건수({expected_parsed})와 실제 파싱 건수({len(transactions)})가 다릅니다.")
 
-            # 총 개수 확인 (API에서 제공하는 totalCount 사용)
-            total_count_element = root.find('.//totalCount')
-            total_count_value = int(total_count_element.text) if total_count_element is not None else len(transactions)
+        return {
+            'success': True,
+            'data': transactions,
+            'total_count': total_count_value,  # API에서 제공하는 값 사용
+            'parsed_count': len(transactions),  # 실제 파싱된 개수 추가
+            'region_code': lawd_cd,
+            'period': deal_ymd
+        }
 
-            self.logger.info(f"✅ 전월세 데이터 파싱 완료: {len(transactions)}건 파싱 (API 총 {total_count_value}건, 스킵 {skipped_count}건)")
+    def _check_response_header(self, header: Dict, endpoint: str) -> Optional[Dict]:
+        """결과 코드/호출 한도 초과 확인 (오류 응답이면 실패 결과, 정상이면 None)"""
+        data_name = '매매' if endpoint == 'sale' else '전월세'
 
-            # totalCount와 파싱된 데이터 개수 차이 로깅
-            if total_count_value > len(transactions):
-                self.logger.warning(f"⚠️ totalCount({total_count_value})와 파싱된 데이터({len(transactions)})에 차이가 있습니다.")
-                self.logger.warning(f"파싱 중 스킵된 데이터: {skipped_count}건")
-                expected_parsed = total_count_value - skipped_count
-                if expected_parsed != len(transactions):
-                    self.logger.warning(f"예상 파싱 건수({expected_parsed})와 실제 파싱 건수({len(transactions)})가 다릅니다.")
+        if header.get('returnReasonCode') == '22':
+            error_msg = f"API 호출 한도 초과 - {data_name} 데이터를 가져올 수 없습니다. 내일 다시 시도해주세요."
+            self.logger.warning(f"{data_name} API 호출 한도 초과: {header.get('returnAuthMsg') or ''}")
+            return {
+                'success': False,
+                'error': error_msg,
+                'data': [],
+                'total_count': 0,
+                'quota_exceeded': True
+            }
 
+        # resultCode가 없거나 '000'이 아닌 경우에만 오류 처리
+        result_code = header.get('resultCode')
+        if result_code and result_code != '000':
+            error_msg = header.get('resultMsg') or '알 수 없는 오류'
+            self.logger.error(f"{data_name} API 오류: {error_msg}")
             return {
-                'success': True,
-                'data': transactions,
-                'total_count': total_count_value,  # API에서 제공하는 값 사용
-                'parsed_count': len(transactions),  # 실제 파싱된 개수 추가
-                'region_code': lawd_cd,
-                'period': deal_ymd
+                'success': False,
+                'error': error_msg,
+                'data': [],
+                'total_count': 0
             }
 
+        # resultMsg가 'OK'인 경우는 정상 응답으로 처리
+        if header.get('resultMsg') == 'OK':
+            self.logger.info("API 정상 응답: OK")
+
+        return None
+
+    def _create_item_parser(self, endpoint: str, lawd_cd: str):
+        """엔드포인트별 <item> 변환기 생성 (페이지 단위)"""
+        if endpoint == 'sale':
+            return SaleItemParser(lawd_cd, self.get_region_name(lawd_cd))
+        return RentItemParser(lawd_cd)
+
+    def _parse_xml_stream(self, endpoint: str, chunks, lawd_cd: str, deal_ymd: str, on_record=None) -> Dict:
+        """
+        응답 바이트 청크를 증분 파싱하여 페이지 결과 구성 (_parse_xml_response와 동일한 결과)
+
+        Args:
+            endpoint: 'sale' 또는 'rent'
+            chunks: 응답 본문 바이트 청크 이터러블
+            on_record: 레코드가 완성될 때마다 호출되는 콜백 (페이지 파싱 완료 전 후속 처리용)
+        """
+        page_parser = StreamingPageParser(self._create_item_parser(endpoint, lawd_cd))
+        transactions = []
+
+        try:
+            for record in page_parser.iter_records(chunks):
+                transactions.append(record)
+                if on_record:
+                    on_record(record)
         except ET.ParseError as e:
-            self.logger.error(f"전월세 XML 파싱 오류: {e}")
+            self.logger.error(f"{'매매' if endpoint == 'sale' else '전월세'} XML 스트리밍 파싱 오류: {e}")
             return {
                 'success': False,
                 'error': f'XML 파싱 오류: {e}',
@@ -1698,6 +1657,45 @@ class MolitRealEstateAPI:
                 'total_count': 0
             }
 
+        error_result = self._check_response_header(page_parser.header, endpoint)
+        if error_result:
+            return error_result
+
+        if endpoint == 'sale':
+            return self._build_sale_result(transactions, page_parser.header, lawd_cd, deal_ymd)
+        return self._build_rent_result(transactions, page_parser.item_parser.skipped_count, page_parser.header, lawd_cd, deal_ymd)
+
+    def _parse_response_stream(self, endpoint: str, response, lawd_cd: str, deal_ymd: str, page_no: int,
+                               num_of_rows: int, save: bool = False) -> Dict:
+        """
+        스트리밍 응답 파싱
+
+        save이고 저장소가 있으면 받은 청크를 바로 압축 임시 파일에 기록하고, 정상 응답일 때만
+        저장소에 반영합니다 (오류/한도 초과 응답은 버림).
+
+        Returns:
+            페이지 결과 딕셔너리
+        """
+        writer = (self.response_store.open_writer(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows)
+                  if save and self.response_store else None)
+
+        def read_chunks():
+            for chunk in response.iter_content(chunk_size=self.stream_chunk_size):
+                if writer:
+                    writer.write(chunk)
+                yield chunk
+
+        try:
+            result = self._parse_xml_stream(endpoint, read_chunks(), lawd_cd, deal_ymd)
+            if writer and result.get('success'):
+                writer.commit(result.get('total_count', 0))
+        finally:
+            response.close()
+            if writer:
+                writer.discard()
+
+        return result
+
     def _get_demo_rent_data(self, lawd_cd: str, deal_ymd: str) -> Dict:
         """전월세 데모 데이터 생성"""
         demo_transactions = [
@@ -1757,12 +1755,13 @@ class MolitRealEstateAPI:
             'total_count': len(demo_transactions),
             'region_code': lawd_cd,
             'period': deal_ymd,
-            'demo': True
+            'is_demo': True
         }
 
-    def get_combined_apt_data(self, lawd_cd: str, deal_ymd: str, page_no: int = 1, num_of_rows: int = 100, fetch_all: bool = True) -> Dict:
+    def get_combined_apt_data(self, lawd_cd: str, deal_ymd: str, page_no: int = 1, num_of_rows: int = 100, fetch_all: bool = True, search_type: str = 'all',
+                              refresh: bool = False) -> Dict:
         """
-        아파트 매매 + 전월세 통합 조회
+        아파트 매매 + 전월세 통합 조회 (검색 유형에 필요한 엔드포인트만 호출)
 
         Args:
             lawd_cd: 지역코드 (예: 11110)
@@ -1770,32 +1769,42 @@ class MolitRealEstateAPI:
             page_no: 페이지 번호 (기본값: 1)
             num_of_rows: 한 페이지 결과 수 (기본값: 100)
             fetch_all: 전체 데이터 수집 여부 (기본값: True)
+            search_type: 검색 유형 ('sale', 'rent', 'all') - FETCH_PLANS 참고
+            refresh: 저장된 원본 응답을 재사용하지 않고 API로 다시 조회 (강제 새로고침)
 
         Returns:
             매매 + 전월세 통합 데이터 딕셔너리
         """
-        self.logger.info(f"🏡 통합 아파트 데이터 조회 시작: 지역={lawd_cd}, 기간={deal_ymd}")
+        plan = FETCH_PLANS.get(search_type, FETCH_PLANS['all'])
+        self.logger.info(f"🏡 통합 아파트 데이터 조회 시작: 지역={lawd_cd}, 기간={deal_ymd}, 호출 대상={'/'.join(plan)}")
 
         if fetch_all:
-            # 전체 데이터 수집 - 병렬 처리
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                self.logger.info(f"🔄 매매/전월세 데이터 병렬 수집 시작")
-                # 병렬로 매매와 전월세 데이터 수집
-                sale_future = executor.submit(self.get_all_apt_trade_data, lawd_cd, deal_ymd, num_of_rows)
-                rent_future = executor.submit(self.get_all_apt_rent_data, lawd_cd, deal_ymd, num_of_rows)
+            # 전체 데이터 수집
+            fetchers = {
+                'sale': lambda: self.get_all_apt_trade_data(lawd_cd, deal_ymd, num_of_rows, refresh=refresh),
+                'rent': lambda: self.get_all_apt_rent_data(lawd_cd, deal_ymd, num_of_rows, refresh=refresh)
+            }
+        else:
+            # 단일 페이지 데이터 수집
+            fetchers = {
+                'sale': lambda: self.get_apt_trade_data(lawd_cd, deal_ymd, page_no, num_of_rows, refresh=refresh),
+                'rent': lambda: self.get_apt_rent_data(lawd_cd, deal_ymd, page_no, num_of_rows, refresh=refresh)
+            }
 
-                # 결과 대기
-                sale_data = sale_future.result()
-                rent_data = rent_future.result()
+        if len(plan) > 1:
+            # 매매/전월세 모두 필요한 경우에만 병렬 처리
+            with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+                self.logger.info(f"🔄 매매/전월세 데이터 병렬 수집 시작")
+                futures = {endpoint: executor.submit(fetchers[endpoint]) for endpoint in plan}
+                results = {endpoint: future.result() for endpoint, future in futures.items()}
                 self.logger.info(f"✅ 매매/전월세 데이터 병렬 수집 완료")
         else:
-            # 단일 페이지 데이터 수집 - 병렬 처리
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                sale_future = executor.submit(self.get_apt_trade_data, lawd_cd, deal_ymd, page_no, num_of_rows)
-                rent_future = executor.submit(self.get_apt_rent_data, lawd_cd, deal_ymd, page_no, num_of_rows)
+            results = {plan[0]: fetchers[plan[0]]()}
 
-                sale_data = sale_future.result()
-                rent_data = rent_future.result()
+        # 계획에 없는 엔드포인트는 빈 결과로 처리
+        empty_result = {'success': True, 'data': [], 'total_count': 0}
+        sale_data = results.get('sale', empty_result)
+        rent_data = results.get('rent', empty_result)
 
         # 매매 데이터에 거래 유형 추가
         sale_transactions = []
@@ -1844,5 +1853,7 @@ class MolitRealEstateAPI:
             'region_code': lawd_cd,
             'period': deal_ymd,
             'sale_data': sale_data,
-            'rent_data': rent_data
+            'rent_data': rent_data,
+            'quota_exceeded': sale_data.get('quota_exceeded', False) or rent_data.get('quota_exceeded', False),
+            'is_demo': self._is_demo_result(sale_data) or self._is_demo_result(rent_data)
         }
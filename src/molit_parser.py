@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+국토교통부 실거래가 XML 항목(<item>) 파서
+
+필드 매핑 테이블(출력 키 → XML 태그, 변환기, 기본값)을 기반으로
+각 <item>의 자식 요소를 한 번만 순회하여 거래 레코드(Transaction)로 변환합니다.
+매매/전월세 엔드포인트가 같은 변환기 테이블을 공유합니다.
+응답 전체를 메모리에 올리지 않는 스트리밍(증분) 파서도 제공합니다.
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from datetime import date
+from typing import Dict, Iterable, Iterator, Optional
+
+from .transaction import Transaction, SaleTransaction, RentTransaction
+
+logger = logging.getLogger(__name__)
+
+
+def parse_amount(amount_str: str) -> int:
+    """거래금액 파싱 (쉼표 제거 후 정수 변환, 만원 단위)"""
+    try:
+        return int(amount_str.replace(',', '').strip())
+    except:
+        return 0
+
+
+def safe_int(value_str: str) -> int:
+    """안전한 정수 변환 (쉼표 제거)"""
+    try:
+        return int(value_str.replace(',', '').strip()) if value_str else 0
+    except:
+        return 0
+
+
+# 필드 변환기 테이블 (매매/전월세 공용)
+CONVERTERS = {
+    'text': None,  # 문자열 그대로 사용
+    'int': int,
+    'float': float,
+    'amount': parse_amount,
+    'safe_int': safe_int,
+}
+
+
+def extract_item_values(item) -> Dict[str, Optional[str]]:
+    """
+    <item>의 자식 요소를 한 번 순회하여 태그별 텍스트 추출
+
+    같은 태그가 여러 번 나오면 첫 번째 요소를 사용하고,
+    텍스트가 없는 요소는 None으로 기록합니다 (element.find 기반 조회와 동일한 결과).
+    """
+    values = {}
+    for child in item:
+        tag = child.tag
+        if tag not in values:
+            text = child.text
+            values[tag] = text.strip() if text else None
+    return values
+
+
+class ItemSchema:
+    """출력 레코드 필드 매핑 테이블"""
+
+    def __init__(self, record_type, fields):
+        """
+        Args:
+            record_type: 생성할 레코드 타입 (SaleTransaction / RentTransaction)
+            fields: (출력 키, XML 태그, 변환기 이름, 기본값) 튜플 목록
+                    XML 태그가 None인 필드는 파서가 계산한 값을 사용
+        """
+        self.record_type = record_type
+        self.fields = tuple(
+            (key, tag, CONVERTERS[converter] if converter else None, default)
+            for key, tag, converter, default in fields
+        )
+
+        unknown = [key for key, _, _, _ in self.fields if key not in record_type._FIELD_SET]
+        if unknown:
+            raise ValueError(f"{record_type.__name__}에 없는 필드: {', '.join(unknown)}")
+
+    def build(self, values: Dict[str, Optional[str]], computed: Dict) -> Transaction:
+        """추출된 태그 값과 계산된 값으로 레코드 생성 (변환 실패 시 예외 전파)"""
+        record = self.record_type.__new__(self.record_type)
+        record._extra = None
+
+        for key, tag, convert, default in self.fields:
+            if tag is None:
+                setattr(record, key, computed[key])
+                continue
+
+            text = values.get(tag)
+            if text is None:
+                text = default
+            setattr(record, key, convert(text) if convert else text)
+        return record
+
+
+SALE_SCHEMA = ItemSchema(SaleTransaction, (
+    ('apt_dong', 'aptDong', 'text', ''),
+    ('apt_name', 'aptNm', 'text', ''),
+    ('apt_seq', 'aptSeq', 'text', ''),
+    ('bonbun', 'bonbun', 'text', ''),
+    ('bubun', 'bubun', 'text', ''),
+    ('build_year', None, None, None),
+    ('buyer_gbn', 'buyerGbn', 'text', ''),
+    ('cdeal_type', 'cdealType', 'text', ''),
+    ('deal_amount', None, None, None),
+    ('deal_day', None, None, None),
+    ('deal_month', None, None, None),
+    ('deal_year', None, None, None),
+    ('dealing_gbn', 'dealingGbn', 'text', ''),
+    ('estate_agent_sgg_nm', 'estateAgentSggNm', 'text', ''),
+    ('exclusive_area', None, None, None),
+    ('floor', None, None, None),
+    ('jibun', 'jibun', 'text', ''),
+    ('road_name', 'roadNm', 'text', ''),
+    ('road_name_bonbun', 'roadNmBonbun', 'text', ''),
+    ('road_name_bubun', 'roadNmBubun', 'text', ''),
+    ('sgg_cd', 'sggCd', 'text', ''),
+    ('sler_gbn', 'slerGbn', 'text', ''),
+    ('umd_cd', 'umdCd', 'text', ''),
+    ('umd_nm', 'umdNm', 'text', ''),
+    ('region_code', None, None, None),
+    ('region_name', None, None, None),
+    ('deal_date', None, None, None),
+    ('price_per_area', None, None, None),
+    ('rgs_date', 'rgsDate', 'text', ''),  # 등기일자
+    ('cancel_deal_type', 'cancelDealType', 'text', ''),  # 해제여부
+    ('cancel_deal_day', 'cancelDealDay', 'text', ''),  # 해제사유발생일
+    ('req_gbn', 'reqGbn', 'text', ''),  # 거래유형
+    ('house_type', 'houseType', 'text', ''),  # 주택유형
+))
+
+RENT_SCHEMA = ItemSchema(RentTransaction, (
+    ('apt_name', 'aptNm', 'text', ''),
+    ('build_year', 'buildYear', 'int', '0'),
+    ('contract_term', 'contractTerm', 'text', ''),
+    ('contract_type', 'contractType', 'text', ''),
+    ('deal_date', None, None, None),
+    ('dong', 'dong', 'text', ''),
+    ('exclusive_area', 'excluUseAr', 'float', '0'),
+    ('floor', 'floor', 'text', ''),
+    ('pre_deposit', 'preDeposit', 'text', ''),
+    ('pre_monthly_rent', 'preMonthlyRent', 'text', ''),
+    ('region_code', None, None, None),
+    ('road_name', 'roadNm', 'text', ''),
+    ('road_name_bonbun', 'roadNmBonbun', 'text', ''),
+    ('road_name_bubun', 'roadNmBubun', 'text', ''),
+    ('umd_nm', 'umdNm', 'text', ''),  # 법정동명
+    ('use_rr_right', 'useRRRight', 'text', ''),
+
+    # 전월세 특화 필드
+    ('deposit', 'deposit', 'safe_int', '0'),  # 보증금(만원)
+    ('monthly_rent', 'monthlyRent', 'safe_int', '0'),  # 월세(만원)
+    ('transaction_type', None, None, None),  # 전세/월세
+
+    # 호환성을 위한 필드
+    ('deal_amount', 'deposit', 'safe_int', '0'),  # 보증금을 거래금액으로 사용
+    ('price_per_area', None, None, None),  # 전월세는 평당가격 계산하지 않음
+
+    # 추가 필드들 - 전월세용
+    ('apt_dong', 'aptDong', 'text', ''),  # 아파트동명
+    ('jibun', 'jibun', 'text', ''),  # 지번
+    ('rgs_date', 'rgsDate', 'text', ''),  # 등기일자
+    ('sgg_cd', 'sggCd', 'text', ''),  # 시군구코드
+    ('umd_cd', 'umdCd', 'text', ''),  # 읍면동코드
+))
+
+
+def _text(values: Dict[str, Optional[str]], tag: str, default: str = '') -> str:
+    text = values.get(tag)
+    return default if text is None else text
+
+
+class SaleItemParser:
+    """매매 <item> → 거래 레코드 변환기 (페이지 단위로 생성)"""
+
+    def __init__(self, lawd_cd: str, region_name: str, today: date = None):
+        self.lawd_cd = lawd_cd
+        self.region_name = region_name
+        # 미래 거래일 필터 기준일 (행마다 시계를 읽지 않도록 한 번만 계산)
+        self.today = today or date.today()
+
+    def parse(self, item) -> Optional[SaleTransaction]:
+        """<item> 하나를 변환 (유효하지 않은 거래는 None)"""
+        values = extract_item_values(item)
+
+        # 거래일 생성 및 유효성 검사
+        try:
+            deal_year = int(_text(values, 'dealYear', '0'))
+            deal_month = int(_text(values, 'dealMonth', '0'))
+            deal_day = int(_text(values, 'dealDay', '0'))
+
+            # 유효한 날짜 범위 검사
+            if not (1900 <= deal_year <= 2100):
+                logger.warning(f"유효하지 않은 연도: {deal_year}")
+                return None
+            if not (1 <= deal_month <= 12):
+                logger.warning(f"유효하지 않은 월: {deal_month}")
+                return None
+            if not (1 <= deal_day <= 31):
+                logger.warning(f"유효하지 않은 일: {deal_day}")
+                return None
+
+            deal_date = f"{deal_year}-{deal_month:0>2}-{deal_day:0>2}"
+        except (ValueError, TypeError) as e:
+            logger.warning(f"날짜 파싱 오류: {e}, 해당 거래 건너뜀")
+            return None
+
+        # 미래 거래일 필터링
+        try:
+            if date(deal_year, deal_month, deal_day) > self.today:
+                logger.warning(f"미래 거래일 필터링: {deal_date}")
+                return None
+        except ValueError:
+            logger.warning(f"잘못된 거래일 형식: {deal_date}")
+            return None
+
+        # 숫자 필드들에 안전한 파싱 적용
+        try:
+            build_year = int(_text(values, 'buildYear', '0'))
+            exclusive_area = float(_text(values, 'excluUseAr', '0'))
+            floor = int(_text(values, 'floor', '0'))
+            deal_amount = parse_amount(_text(values, 'dealAmount'))
+
+            # 데이터 유효성 검사
+            if build_year < 1900 or build_year > 2100:
+                logger.warning(f"유효하지 않은 건축년도: {build_year}")
+                build_year = 0
+            if exclusive_area < 0 or exclusive_area > 1000:  # 1000㎡ 이상은 비정상적
+                logger.warning(f"유효하지 않은 전용면적: {exclusive_area}")
+                exclusive_area = 0
+            if floor < 0 or floor > 200:  # 200층 이상은 비정상적
+                logger.warning(f"유효하지 않은 층수: {floor}")
+                floor = 0
+
+        except (ValueError, TypeError) as e:
+            logger.warning(f"숫자 필드 파싱 오류: {e}, 기본값 사용")
+            build_year = 0
+            exclusive_area = 0
+            floor = 0
+            deal_amount = 0
+
+        return SALE_SCHEMA.build(values, {
+            'build_year': build_year,
+            'deal_amount': deal_amount,
+            'deal_day': deal_day,
+            'deal_month': deal_month,
+            'deal_year': deal_year,
+            'exclusive_area': exclusive_area,
+            'floor': floor,
+            'region_code': self.lawd_cd,
+            'region_name': self.region_name,
+            'deal_date': deal_date,
+            'price_per_area': (deal_amount * 10000) / exclusive_area if exclusive_area > 0 else 0,
+        })
+
+
+class RentItemParser:
+    """전월세 <item> → 거래 레코드 변환기 (페이지 단위로 생성)"""
+
+    def __init__(self, lawd_cd: str):
+        self.lawd_cd = lawd_cd
+        self.skipped_count = 0
+
+    def parse(self, item) -> Optional[RentTransaction]:
+        """<item> 하나를 변환 (유효하지 않은 거래는 None, skipped_count 증가)"""
+        values = extract_item_values(item)
+
+        try:
+            deal_year = int(_text(values, 'dealYear', '0'))
+            deal_month = int(_text(values, 'dealMonth', '0'))
+            deal_day = int(_text(values, 'dealDay', '0'))
+
+            if not (1900 <= deal_year <= 2100):
+                self.skipped_count += 1
+                logger.debug(f"전월세 데이터 스킵: 유효하지 않은 거래년도 {deal_year}")
+                return None
+            if not (1 <= deal_month <= 12):
+                self.skipped_count += 1
+                logger.debug(f"전월세 데이터 스킵: 유효하지 않은 거래월 {deal_month}")
+                return None
+            if not (1 <= deal_day <= 31):
+                self.skipped_count += 1
+                logger.debug(f"전월세 데이터 스킵: 유효하지 않은 거래일 {deal_year}-{deal_month}-{deal_day}")
+                return None
+
+            # 전세/월세 구분 (월세가 0이면 전세)
+            monthly_rent = safe_int(_text(values, 'monthlyRent', '0'))
+
+            return RENT_SCHEMA.build(values, {
+                'deal_date': f"{deal_year}-{deal_month:02d}-{deal_day:02d}",
+                'region_code': self.lawd_cd,
+                'transaction_type': "전세" if monthly_rent == 0 else "월세",
+                'price_per_area': 0,
+            })
+
+        except (ValueError, TypeError) as e:
+            self.skipped_count += 1
+            logger.warning(f"전월세 거래 데이터 파싱 실패: {e}")
+            return None
+
+
+# 응답 헤더/본문에서 수집하는 메타 정보 태그
+HEADER_TAGS = ('resultCode', 'resultMsg', 'errMsg', 'returnAuthMsg', 'returnReasonCode', 'totalCount')
+
+
+def read_header(root) -> Dict[str, Optional[str]]:
+    """파싱된 응답 트리에서 결과 코드/한도 초과 사유/전체 건수 추출 (요소가 없으면 키 없음)"""
+    header = {}
+    for tag in HEADER_TAGS:
+        element = root.find(f'.//{tag}')
+        if element is not None:
+            header[tag] = element.text
+    return header
+
+
+def is_error_header(header: Dict[str, Optional[str]]) -> bool:
+    """호출 한도 초과 또는 정상(000)이 아닌 결과 코드인지 확인"""
+    if header.get('returnReasonCode') == '22':
+        return True
+    result_code = header.get('resultCode')
+    return bool(result_code) and result_code != '000'
+
+
+class StreamingPageParser:
+    """
+    XMLPullParser 기반 페이지 스트리밍 파서
+
+    응답 바이트 청크를 받는 대로 파싱하여 <item> 하나가 완성될 때마다 레코드를 내보내고,
+    처리한 요소는 트리에서 제거하여 페이지 크기와 관계없이 메모리 사용량을 일정하게 유지합니다.
+    resultCode/returnReasonCode/totalCount 등은 header에 기록됩니다
+    (totalCount는 items 뒤에 오므로 스트림을 끝까지 소비한 뒤 확인).
+    """
+
+    def __init__(self, item_parser):
+        """
+        Args:
+            item_parser: SaleItemParser 또는 RentItemParser
+        """
+        self.item_parser = item_parser
+        self.header: Dict[str, Optional[str]] = {}
+        self.item_count = 0
+        self._items_element = None
+
+    def iter_records(self, chunks: Iterable[bytes]) -> Iterator[Transaction]:
+        """
+        바이트 청크를 소비하며 거래 레코드를 하나씩 생성
+
+        Raises:
+            xml.etree.ElementTree.ParseError: 잘못되었거나 중간에 끊긴 XML
+        """
+        parser = ET.XMLPullParser(events=('start', 'end'))
+
+        for chunk in chunks:
+            if chunk:
+                parser.feed(chunk)
+                yield from self._read_events(parser)
+
+        parser.close()
+        yield from self._read_events(parser)
+
+    def _read_events(self, parser) -> Iterator[Transaction]:
+        for event, element in parser.read_events():
+            tag = element.tag
+
+            if event == 'start':
+                if tag == 'items':
+                    self._items_element = element
+                continue
+
+            if tag == 'item':
+                self.item_count += 1
+                # 오류 응답이면 항목을 레코드로 만들지 않음
+                if not is_error_header(self.header):
+                    record = self.item_parser.parse(element)
+                    if record is not None:
+                        yield record
+                self._release(element)
+
+            elif tag in HEADER_TAGS and tag not in self.header:
+                self.header[tag] = element.text
+
+    def _release(self, element):
+        """처리한 <item>을 트리에서 제거"""
+        if self._items_element is not None:
+            try:
+                self._items_element.remove(element)
+                return
+            except ValueError:
+                pass
+        element.clear()
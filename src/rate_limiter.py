@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+API 호출 속도 제한 모듈 (프로세스 전역 토큰 버킷)
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class TokenBucketRateLimiter:
+    """스레드 간 공유되는 토큰 버킷 속도 제한기"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 초당 토큰 충전량 (지속 호출 속도, 0 이하이면 제한 없음)
+            capacity: 버킷 최대 용량 (유휴 상태 이후 허용되는 버스트 호출 수)
+        """
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+        # 메트릭
+        self._acquired_count = 0
+        self._waited_count = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전 (lock 보유 상태에서 호출)"""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 충전될 때까지 대기)
+
+        토큰을 먼저 예약(차감)한 뒤 lock 밖에서 대기하므로
+        여러 스레드가 동시에 호출해도 요청 순서대로 간격이 배정됩니다.
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            대기한 시간(초)
+        """
+        if self.rate <= 0:
+            with self._lock:
+                self._acquired_count += 1
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self._acquired_count += 1
+            self._last_wait = wait_time
+            if wait_time > 0:
+                self._waited_count += 1
+                self._total_wait += wait_time
+                self._max_wait = max(self._max_wait, wait_time)
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        return wait_time
+
+    def get_metrics(self) -> Dict:
+        """현재 버킷 상태 및 대기 시간 통계 반환"""
+        with self._lock:
+            if self.rate > 0:
+                self._refill(time.monotonic())
+            available = max(0.0, self._tokens)
+            backlog = max(0.0, -self._tokens)
+
+            return {
+                'rate_per_second': self.rate,
+                'capacity': self.capacity,
+                'available_tokens': round(available, 3),
+                'fill_ratio': round(available / self.capacity, 3),
+                'queued_wait_seconds': round(backlog / self.rate, 3) if self.rate > 0 else 0.0,
+                'acquired_count': self._acquired_count,
+                'waited_count': self._waited_count,
+                'total_wait_seconds': round(self._total_wait, 3),
+                'avg_wait_seconds': round(self._total_wait / self._waited_count, 3) if self._waited_count else 0.0,
+                'max_wait_seconds': round(self._max_wait, 3),
+                'last_wait_seconds': round(self._last_wait, 3)
+            }
+
+
+# 프로세스 전역 제한기 인스턴스
+_shared_rate_limiter: Optional[TokenBucketRateLimiter] = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> TokenBucketRateLimiter:
+    """
+    프로세스 전역 속도 제한기 반환 (최초 호출 시 환경 변수로 생성)
+
+    - API_RATE_LIMIT_PER_SEC: 초당 지속 호출 수 (미설정 시 1 / API_REQUEST_DELAY)
+    - API_RATE_LIMIT_BURST: 버스트 허용 호출 수 (기본값: 5)
+    """
+    global _shared_rate_limiter
+
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            rate_env = os.getenv('API_RATE_LIMIT_PER_SEC')
+            if rate_env:
+                rate = float(rate_env)
+            else:
+                request_delay = float(os.getenv('API_REQUEST_DELAY', '0.05'))
+                rate = 1.0 / request_delay if request_delay > 0 else 0.0
+
+            burst = float(os.getenv('API_RATE_LIMIT_BURST', '5'))
+            _shared_rate_limiter = TokenBucketRateLimiter(rate, burst)
+            logger.info(f"API 속도 제한기 생성: 초당 {rate:g}회, 버스트 {burst:g}회")
+
+        return _shared_rate_limiter
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+법정동 코드 지역 색인 모듈
+
+dong_code_active.txt(약 2만 줄)를 프로세스당 한 번만 읽어 시/도 → 군/구 → 읍/면/동 계층과
+이름 접두어 검색용 정렬 색인을 만들어 둡니다. 지역 선택 API는 매 요청마다 파일을 다시 읽지 않고
+결과 크기에 비례하는 시간으로 응답합니다.
+"""
+
+import bisect
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DONG_CODE_FILE = 'dong_code_active.txt'
+
+
+class RegionIndex:
+    """법정동 코드/이름 색인"""
+
+    def __init__(self, entries: List[Tuple[str, str]]):
+        """
+        Args:
+            entries: 파일 순서대로의 (법정동코드, 법정동명) 목록
+        """
+        self.entries = entries
+
+        # 이름 접두어 검색용: (법정동명, 파일 내 순번) 정렬 목록
+        self._sorted_names = sorted((name, position) for position, (_, name) in enumerate(entries))
+        self._names_only = [name for name, _ in self._sorted_names]
+
+        self._cities: List[Dict] = []
+        self._districts_by_city: Dict[str, List[Dict]] = {}
+        self._district_codes: Dict[Tuple[str, str], str] = {}
+        self._build_hierarchy()
+
+        # 접두어 기반 목록은 요청된 (시/도, 군/구)별로 한 번만 계산
+        self._towns_cached = lru_cache(maxsize=1024)(self._build_towns)
+        self._dongs_cached = lru_cache(maxsize=1024)(self._build_dongs)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_DONG_CODE_FILE) -> 'RegionIndex':
+        """파일을 읽어 색인 생성 (FileNotFoundError 전파)"""
+        entries = []
+        with open(path, 'r', encoding='utf-8') as f:
+            next(f, None)  # 헤더 제외
+            for line in f:
+                parts = line.strip().split('\t')
+                if len(parts) >= 2:
+                    entries.append((parts[0], parts[1]))
+
+        index = cls(entries)
+        logger.info(f"📍 지역 색인 생성: 법정동 {len(entries)}개, 시/도 {len(index._cities)}개")
+        return index
+
+    def _build_hierarchy(self):
+        """시/도 목록, 시/도별 군/구 목록, (시/도, 군/구) → LAWD_CD 역색인 생성"""
+        seen_cities = set()
+        seen_district_keys = set()
+
+        for code, name in self.entries:
+            name_parts = name.split(' ')
+            if len(name_parts) < 3:  # 시/도 + 군/구 + 동 형태만 사용
+                continue
+
+            city = name_parts[0]
+            district = name_parts[1]
+
+            if city not in seen_cities:
+                seen_cities.add(city)
+                self._cities.append({'name': city, 'full_name': city})
+
+            # 군/구는 파일에서 처음 나온 행 기준 (중복 제거)
+            district_key = f"{city}_{district}"
+            if district_key not in seen_district_keys:
+                seen_district_keys.add(district_key)
+                self._districts_by_city.setdefault(city, []).append({
+                    'name': district,
+                    'code': code[:5] + '00000',
+                    'full_name': f'{city} {district}',
+                    'key': district_key
+                })
+                self._district_codes[(city, district)] = code[:5]
+
+        self._cities.sort(key=lambda x: x['name'])
+        for districts in self._districts_by_city.values():
+            districts.sort(key=lambda x: x['name'])
+
+    def _iter_prefix(self, prefix: str):
+        """이름이 prefix로 시작하는 항목을 파일 순서대로 반환 (정렬 색인 이진 탐색)"""
+        start = bisect.bisect_left(self._names_only, prefix)
+        positions = []
+        for name, position in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+
+        positions.sort()
+        return [self.entries[position] for position in positions]
+
+    def cities(self) -> List[Dict]:
+        """시/도 목록"""
+        return [dict(city) for city in self._cities]
+
+    def districts(self, city: str) -> List[Dict]:
+        """특정 시/도의 군/구 목록 (이름순)"""
+        return [dict(district) for district in self._districts_by_city.get(city, [])]
+
+    def towns(self, city: str, district: str) -> List[Dict]:
+        """특정 시/도, 군/구의 읍/면/동(3단계) 및 리(4단계) 목록"""
+        return [dict(town) for town in self._towns_cached(city, district)]
+
+    def dongs(self, city: str, district: str) -> List[Dict]:
+        """특정 시/도, 군/구의 법정동 목록 (리 단위 제외)"""
+        return [dict(dong) for dong in self._dongs_cached(city, district)]
+
+    def district_code(self, city: str, district: str) -> Optional[str]:
+        """(시/도, 군/구 이름) → LAWD_CD (5자리)"""
+        return self._district_codes.get((city, district))
+
+    def _build_towns(self, city: str, district: str) -> Tuple[Dict, ...]:
+        towns = []
+        seen_towns = set()
+        target_prefix = f"{city} {district}"
+
+        for code, name in self._iter_prefix(target_prefix):
+            name_parts = name.split(' ')
+            if len(name_parts) < 3:  # 최소 시/도 + 군/구 + 읍/면/동
+                continue
+
+            town_name = name_parts[2]  # 세 번째가 읍/면/동
+
+            # 4단계(리) 데이터가 있는 경우도 포함 ("산성면 백학리" 형태)
+            if len(name_parts) >= 4:
+                full_town_name = f"{town_name} {name_parts[3]}"
+                if full_town_name not in seen_towns:
+                    towns.append({
+                        'name': full_town_name,
+                        'code': code[:8],  # 읍/면/동 + 리 코드
+                        'full_name': name,
+                        'level': 4  # 리 단위
+                    })
+                    seen_towns.add(full_town_name)
+
+            # 3단계(읍/면/동) 데이터
+            if town_name not in seen_towns:
+                towns.append({
+                    'name': town_name,
+                    'code': code[:6] + '00',  # 읍/면/동 코드
+                    'full_name': f"{target_prefix} {town_name}",
+                    'level': 3  # 읍/면/동 단위
+                })
+                seen_towns.add(town_name)
+
+        return tuple(sorted(towns, key=lambda x: (x.get('level', 3), x['name'])))
+
+    def _build_dongs(self, city: str, district: str) -> Tuple[Dict, ...]:
+        dongs = []
+        seen_dongs = set()
+        target_prefix = f"{city} {district}"
+        target_length = len(target_prefix.split())
+
+        for code, name in self._iter_prefix(target_prefix):
+            # 시/군/구는 끝 5자리가 00000이므로 제외
+            if code.endswith('00000'):
+                continue
+
+            # target_prefix 다음에 오는 첫 번째 단어가 읍/면/동
+            name_parts = name.split()
+            if len(name_parts) > target_length:
+                dong_name = name_parts[target_length]
+                # 리 단위가 아닌 읍/면/동만 (리로 끝나지 않는 것)
+                if dong_name and not dong_name.endswith('리') and dong_name not in seen_dongs:
+                    dongs.append({
+                        'name': dong_name,
+                        'code': code[:5],  # 앞 5자리만 사용 (LAWD_CD)
+                        'full_name': name
+                    })
+                    seen_dongs.add(dong_name)
+
+        return tuple(sorted(dongs, key=lambda x: x['name']))
+
+
+# 프로세스 전역 색인 인스턴스 (경로별)
+_region_indexes: Dict[str, RegionIndex] = {}
+_region_index_lock = threading.Lock()
+
+
+def get_region_index(path: str = DEFAULT_DONG_CODE_FILE) -> RegionIndex:
+    """
+    프로세스 전역 지역 색인 반환 (최초 호출 시 파일을 읽어 생성)
+
+    Raises:
+        FileNotFoundError: 법정동 코드 파일이 없는 경우 (다음 호출에서 다시 시도)
+    """
+    index = _region_indexes.get(path)
+    if index is not None:
+        return index
+
+    with _region_index_lock:
+        if path not in _region_indexes:
+            _region_indexes[path] = RegionIndex.load(path)
+        return _region_indexes[path]
+
+
+def build_hierarchy_code_map(region_hierarchy: Dict) -> Dict[Tuple[str, str], str]:
+    """
+    시-군-구 계층 데이터에서 (시/도, 군/구 이름) → LAWD_CD 역색인 생성
+
+    정확한 군/구 이름(구가 나뉜 시는 '_main' 코드)이 우선이고, 그 다음으로
+    구 단위로 세분화된 시의 "시 구" 및 "구" 이름을 계층 데이터 순서대로 등록합니다.
+    """
+    code_map = {}
+
+    for city, city_data in region_hierarchy.items():
+        for district, code_or_dict in city_data.items():
+            if isinstance(code_or_dict, str):
+                code_map[(city, district)] = code_or_dict
+            elif isinstance(code_or_dict, dict) and '_main' in code_or_dict:
+                code_map[(city, district)] = code_or_dict['_main']
+
+        for city_name, code_or_dict in city_data.items():
+            if isinstance(code_or_dict, dict):
+                for sub_district, sub_code in code_or_dict.items():
+                    if sub_district != '_main':
+                        code_map.setdefault((city, f"{city_name} {sub_district}"), sub_code)
+                        code_map.setdefault((city, sub_district), sub_code)
+
+    return code_map
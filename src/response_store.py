@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+국토교통부 API 원본 응답 로컬 저장소 모듈
+
+신고 기한이 지난(마감된) 월의 응답은 사실상 바뀌지 않으므로 영구 보관하고
+네트워크 없이 재사용합니다. 아직 변동 가능한 최근 월은 TTL 동안만 재사용합니다.
+마감 전에 받은 응답은 일부 거래만 담고 있을 수 있으므로, 마감 이후에 받았거나 확인한
+응답만 불변으로 봅니다.
+스트리밍 수신 중에는 응답 전체를 모아 두지 않고 받은 청크를 바로 압축 임시 파일에 기록합니다.
+"""
+
+import os
+import gzip
+import json
+import codecs
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class RawResponseStore:
+    """(엔드포인트, LAWD_CD, DEAL_YMD, pageNo, numOfRows) 키 기반 원본 XML 저장소"""
+
+    def __init__(self, base_dir: str, immutable_lag_months: int = 3, hot_ttl_hours: float = 6):
+        """
+        Args:
+            base_dir: 저장 디렉토리
+            immutable_lag_months: 현재 월 기준 이 개월 수 이상 지난 월은 불변(영구 보관)으로 간주
+            hot_ttl_hours: 아직 변동 가능한 최근 월 응답의 재사용 시간
+        """
+        self.base_dir = base_dir
+        self.immutable_lag_months = immutable_lag_months
+        self.hot_ttl_seconds = hot_ttl_hours * 3600
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._stats = {
+            'immutable_hits': 0,
+            'hot_hits': 0,
+            'expired': 0,
+            'misses': 0,
+            'writes': 0,
+            'touches': 0,
+            'bytes_written': 0
+        }
+
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional['RawResponseStore']:
+        """환경 변수 설정으로 저장소 생성 (RAW_STORE_ENABLED=false 이면 None)"""
+        if os.getenv('RAW_STORE_ENABLED', 'true').lower() != 'true':
+            return None
+
+        return cls(
+            base_dir=os.getenv('RAW_STORE_DIR', 'data/raw_responses'),
+            immutable_lag_months=int(os.getenv('RAW_STORE_IMMUTABLE_LAG_MONTHS', '3')),
+            hot_ttl_hours=float(os.getenv('RAW_STORE_HOT_TTL_HOURS', '6'))
+        )
+
+    @staticmethod
+    def make_key(endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int) -> str:
+        """요청 식별자로부터 저장 키(해시) 생성"""
+        identity = f"{endpoint}|{lawd_cd}|{deal_ymd}|{int(page_no)}|{int(num_of_rows)}"
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        """저장 키에 해당하는 파일 경로 (디렉토리당 파일 수 분산)"""
+        return os.path.join(self.base_dir, key[:2], f"{key}.json.gz")
+
+    def immutable_since(self, deal_ymd: str) -> Optional[datetime]:
+        """월의 신고 기한 마감 시각 (이 시각 이후의 응답은 더 이상 바뀌지 않음)"""
+        try:
+            year, month = int(deal_ymd[:4]), int(deal_ymd[4:6])
+        except (ValueError, TypeError):
+            return None
+
+        month_index = year * 12 + (month - 1) + self.immutable_lag_months
+        return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+    def is_immutable(self, deal_ymd: str, checked_at: float = None) -> bool:
+        """
+        응답이 불변인지 확인
+
+        Args:
+            deal_ymd: 계약년월
+            checked_at: 응답을 받았거나 최신임을 확인한 시각 (timestamp, 기본값: 현재)
+                        - 마감 전에 받은 응답은 일부 거래만 담고 있을 수 있어 불변이 아님
+        """
+        cutoff = self.immutable_since(deal_ymd)
+        if cutoff is None:
+            return False
+        return (checked_at if checked_at is not None else time.time()) >= cutoff.timestamp()
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    def lookup(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int) -> Optional[Dict]:
+        """
+        저장된 응답 조회 (만료 여부와 관계없이)
+
+        Returns:
+            {'xml', 'total_count', 'fetched_at', 'verified_at', 'immutable', 'fresh'} 또는 None
+        """
+        path = self._get_path(self.make_key(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows))
+
+        try:
+            verified_at = os.path.getmtime(path)
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"손상된 원본 응답 파일 무시: {path} ({e})")
+            return None
+
+        # 받은 시각(put) 또는 최신 확인 시각(touch) 중 나중 시각이 마감 이후여야 불변
+        immutable = self.is_immutable(deal_ymd, checked_at=verified_at)
+        entry['verified_at'] = verified_at
+        entry['immutable'] = immutable
+        entry['fresh'] = immutable or (time.time() - verified_at) < self.hot_ttl_seconds
+        return entry
+
+    def get(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int) -> Optional[str]:
+        """정책상 재사용 가능한 응답이 있으면 원본 XML 반환, 없거나 만료되었으면 None"""
+        entry = self.lookup(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows)
+
+        if entry is None:
+            self._count('misses')
+            return None
+
+        if not entry['fresh']:
+            self._count('expired')
+            return None
+
+        self._count('immutable_hits' if entry['immutable'] else 'hot_hits')
+        return entry['xml']
+
+    def put(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int,
+            xml_text: str, total_count: int = 0) -> bool:
+        """응답 저장 (임시 파일에 쓴 뒤 교체하여 동시 읽기에도 안전)"""
+        writer = self.open_writer(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows)
+        if writer is None:
+            return False
+
+        writer.write(xml_text.encode('utf-8'))
+        return writer.commit(total_count)
+
+    def open_writer(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int,
+                    num_of_rows: int) -> Optional['RawResponseWriter']:
+        """응답을 받는 대로 기록하는 저장기 생성 (임시 파일을 만들 수 없으면 None)"""
+        path = self._get_path(self.make_key(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows))
+        entry = {
+            'endpoint': endpoint,
+            'lawd_cd': lawd_cd,
+            'deal_ymd': deal_ymd,
+            'page_no': int(page_no),
+            'num_of_rows': int(num_of_rows),
+            'fetched_at': datetime.now().isoformat()
+        }
+
+        try:
+            return RawResponseWriter(self, path, entry)
+        except OSError as e:
+            self.logger.warning(f"원본 응답 저장 실패: {endpoint} {lawd_cd} {deal_ymd} p{page_no} ({e})")
+            return None
+
+    def touch(self, endpoint: str, lawd_cd: str, deal_ymd: str, page_no: int, num_of_rows: int) -> bool:
+        """저장된 응답이 여전히 최신임이 확인되었을 때 검증 시각 갱신 (TTL 재시작)"""
+        path = self._get_path(self.make_key(endpoint, lawd_cd, deal_ymd, page_no, num_of_rows))
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            return False
+
+        self._count('touches')
+        return True
+
+    def get_statistics(self) -> Dict:
+        """저장소 사용 통계 반환"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        lookups = stats['immutable_hits'] + stats['hot_hits'] + stats['expired'] + stats['misses']
+        stats['hit_rate'] = round((stats['immutable_hits'] + stats['hot_hits']) / lookups * 100, 1) if lookups else 0.0
+        stats['base_dir'] = self.base_dir
+        stats['immutable_lag_months'] = self.immutable_lag_months
+        stats['hot_ttl_hours'] = self.hot_ttl_seconds / 3600
+        return stats
+
+
+class RawResponseWriter:
+    """
+    원본 응답 스트리밍 저장기
+
+    받은 바이트 청크를 UTF-8 증분 디코딩 후 JSON 문자열로 이스케이프하여 압축 임시 파일에 바로 기록합니다.
+    파일 내용은 put과 같은 JSON 항목이므로 lookup은 형식 차이 없이 읽습니다. commit하면 저장 위치로
+    교체하고, discard하거나 기록 중 오류가 나면 임시 파일을 지웁니다.
+    """
+
+    def __init__(self, store: RawResponseStore, path: str, entry: Dict):
+        self._store = store
+        self._path = path
+        self._entry = entry
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._closed = False
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        self._raw_file = os.fdopen(fd, 'wb')
+        self._gz_file = gzip.GzipFile(fileobj=self._raw_file, mode='wb')
+
+        # 항목 메타데이터 뒤에 xml 문자열 값을 열어 두고, 청크마다 이스케이프한 조각을 이어 씀
+        self._gz_file.write((json.dumps(entry, ensure_ascii=False)[:-1] + ', "xml": "').encode('utf-8'))
+
+    def _write_text(self, text: str):
+        if text:
+            self._gz_file.write(json.dumps(text, ensure_ascii=False)[1:-1].encode('utf-8'))
+
+    def write(self, chunk: bytes):
+        """응답 청크 기록 (실패하면 저장을 포기하고 이후 청크는 무시)"""
+        if self._closed:
+            return
+
+        try:
+            self._write_text(self._decoder.decode(chunk))
+        except (OSError, UnicodeDecodeError) as e:
+            self._store.logger.warning(f"원본 응답 기록 실패, 저장 생략: {self._path} ({e})")
+            self.discard()
+
+    def commit(self, total_count: int = 0) -> bool:
+        """기록을 마치고 저장 위치로 교체 (동시 읽기에도 안전)"""
+        if self._closed:
+            return False
+
+        try:
+            self._write_text(self._decoder.decode(b'', final=True))
+            self._gz_file.write(f'", "total_count": {int(total_count or 0)}}}'.encode('utf-8'))
+            self._gz_file.close()
+            self._raw_file.close()
+            self._closed = True
+            os.replace(self._tmp_path, self._path)
+
+        except (OSError, UnicodeDecodeError) as e:
+            entry = self._entry
+            self._store.logger.warning(f"원본 응답 저장 실패: {entry['endpoint']} {entry['lawd_cd']} "
+                                       f"{entry['deal_ymd']} p{entry['page_no']} ({e})")
+            self.discard()
+            return False
+
+        self._store._count('writes')
+        self._store._count('bytes_written', os.path.getsize(self._path))
+        return True
+
+    def discard(self):
+        """기록 중단 및 임시 파일 삭제"""
+        if not self._closed:
+            self._closed = True
+            try:
+                self._gz_file.close()
+                self._raw_file.close()
+            except OSError:
+                pass
+
+        try:
+            os.unlink(self._tmp_path)
+        except OSError:
+            pass
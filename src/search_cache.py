@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+월 구간 검색 캐시 모듈
+
+검색 결과를 (지역, 엔드포인트, 계약년월) 구간으로 나눠 search_cache에 저장하고, 어떤 기간의
+검색이든 캐시된 구간을 조합한 뒤 캐시에 없는 구간만 API로 조회합니다. 6개월/12개월 검색이나
+다음 날의 같은 검색은 대부분의 달을 공유하므로 바뀐 달만 다시 받으면 됩니다. 구간은 법정동별로
+나뉘어 저장되므로(cache_codec) 동 하나의 거래나 단지별 집계만 꺼낼 수도 있습니다.
+
+만료된 지 CACHE_MAX_STALENESS_HOURS 이내인 구간은 바로 제공하고(stale-while-revalidate), 그 구간은
+백그라운드 스레드 하나가 다시 조회해 캐시를 갱신합니다. 같은 구간의 갱신은 한 번에 하나만 실행됩니다.
+"""
+
+import os
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .molit_api import FETCH_PLANS
+from .cache_codec import summarize_apartments, merge_apartment_summaries, apartment_list_from_summary
+
+
+class SearchSegmentCache:
+    """(지역, 엔드포인트, 계약년월) 구간 단위 검색 캐시"""
+
+    def __init__(self, db, molit_api, refresh_callback=None):
+        """
+        Args:
+            db: ApartmentDatabase (구간 저장소)
+            molit_api: MolitRealEstateAPI (캐시에 없는 구간 조회)
+            refresh_callback: 백그라운드 갱신으로 새로 받은 거래를 넘겨받을 함수 (region_name, 거래 목록)
+        """
+        self.db = db
+        self.molit_api = molit_api
+        self.refresh_callback = refresh_callback
+        self.logger = logging.getLogger(__name__)
+        self.recent_month_hours = int(os.getenv('CACHE_RECENT_MONTH_HOURS', '24'))
+        self.closed_month_hours = int(os.getenv('CACHE_CLOSED_MONTH_HOURS', '168'))
+        self.max_staleness_hours = float(os.getenv('CACHE_MAX_STALENESS_HOURS', '24'))
+
+        self._refreshing = set()  # 백그라운드 갱신 중인 구간 캐시 키
+        self._refresh_lock = threading.Lock()
+
+    def cache_hours(self, deal_ymd: str, today: datetime = None) -> int:
+        """구간 캐시 유지 시간 (신고 기한 30일이 지나지 않은 이번 달/지난달은 짧게)"""
+        today = today or datetime.now()
+        months_ago = (today.year - int(deal_ymd[:4])) * 12 + today.month - int(deal_ymd[4:])
+        return self.recent_month_hours if months_ago <= 1 else self.closed_month_hours
+
+    def _plan(self, search_type: str, months: int, start_date: str, end_date: str) -> tuple:
+        """조회 대상 계약년월 목록(조회 순서)과 검색 유형의 엔드포인트"""
+        target_months = self.molit_api._get_target_months(months, start_date, end_date)
+        endpoints = FETCH_PLANS.get(search_type, FETCH_PLANS['all'])
+        return [target.strftime("%Y%m") for target in target_months], endpoints
+
+    @staticmethod
+    def _compose(deal_ymds: List[str], endpoints: tuple, segments: Dict[tuple, List],
+                 start_date: str = None, end_date: str = None) -> List:
+        """
+        구간을 월 순서대로 이어 붙이기 (get_multiple_months_by_plan과 같은 순서)
+
+        한 달 안에서는 매매 → 전월세 순서로 합친 뒤 거래일 내림차순으로 안정 정렬합니다.
+        """
+        data = []
+        for deal_ymd in deal_ymds:
+            month_data = [tx for endpoint in endpoints for tx in segments.get((endpoint, deal_ymd), [])]
+            if len(endpoints) > 1:
+                month_data.sort(key=lambda tx: tx['deal_date'], reverse=True)
+            data.extend(month_data)
+
+        if start_date and end_date:
+            # 날짜 범위에 맞는 데이터만 필터링 (YYYY-MM-DD 문자열 비교)
+            data = [tx for tx in data if start_date <= tx['deal_date'] <= end_date]
+        return data
+
+    def load(self, region_code: str, search_type: str = 'sale', months: int = 6,
+             start_date: str = None, end_date: str = None, dong: str = None,
+             region_name: str = None) -> Optional[Dict]:
+        """
+        모든 구간이 캐시에 있을 때만 조합한 결과 반환 (API 호출 없음)
+
+        dong을 주면 각 구간에서 해당 법정동 묶음만 해제해 조합합니다. 만료됐지만 허용 시간 이내인
+        구간도 사용하며, 그 구간은 백그라운드 갱신을 시작합니다.
+
+        Returns:
+            {'data', 'total_count', 'created_at'(가장 오래된 구간 저장 시각), 'stale'} 또는 None
+        """
+        deal_ymds, endpoints = self._plan(search_type, months, start_date, end_date)
+        keys = [(endpoint, deal_ymd) for deal_ymd in deal_ymds for endpoint in endpoints]
+        cached = self.db.get_search_segments(region_code, keys, dong=dong, max_stale_hours=self.max_staleness_hours)
+        if len(cached) < len(keys):
+            return None
+
+        stale_keys = [key for key, segment in cached.items() if segment['stale']]
+        self._revalidate(region_code, region_name, stale_keys)
+
+        data = self._compose(deal_ymds, endpoints, {key: segment['data'] for key, segment in cached.items()},
+                             start_date, end_date)
+        return {
+            'data': data,
+            'total_count': len(data),
+            'created_at': min((segment['created_at'] for segment in cached.values()), default=None),
+            'stale': bool(stale_keys)
+        }
+
+    def _gather(self, region_code: str, region_name: str, search_type: str, months: int,
+                start_date: str, end_date: str, progress_callback, force_refresh: bool,
+                dong: str, summary: bool) -> Dict:
+        """
+        캐시된 구간과 캐시에 없어 새로 조회한 구간 모으기
+
+        월마다 캐시에 없는 엔드포인트만 조회하고, 실패 페이지 없이 받은 구간만 캐시에 저장합니다.
+        summary면 구간 값은 단지별 집계, 아니면 거래 목록입니다 (dong을 주면 해당 법정동만).
+        만료됐지만 허용 시간 이내인 구간은 그대로 쓰고 백그라운드 갱신을 시작합니다.
+        """
+        deal_ymds, endpoints = self._plan(search_type, months, start_date, end_date)
+        keys = [(endpoint, deal_ymd) for deal_ymd in deal_ymds for endpoint in endpoints]
+        cached = {} if force_refresh else self.db.get_search_segments(
+            region_code, keys, dong=dong, summary=summary, max_stale_hours=self.max_staleness_hours)
+        stale_keys = [key for key, segment in cached.items() if segment['stale']]
+        self._revalidate(region_code, region_name, stale_keys)
+        value_key = 'apartments' if summary else 'data'
+        segments = {key: segment[value_key] for key, segment in cached.items()}
+        counts = {key: segment['count'] if summary else len(segment['data']) for key, segment in cached.items()}
+        region_count = sum(segment['total_count'] for segment in cached.values())
+
+        # 월마다 캐시에 없는 엔드포인트만 조회 (둘 다 없으면 통합 조회로 병렬 수집)
+        month_plans = {}
+        for deal_ymd in deal_ymds:
+            missing = [endpoint for endpoint in endpoints if (endpoint, deal_ymd) not in cached]
+            if missing:
+                month_plans[deal_ymd] = missing[0] if len(missing) == 1 else 'all'
+
+        fetched = []
+        if month_plans:
+            self.logger.info(f"📡 구간 캐시 {len(cached)}/{len(keys)}개 사용, {len(month_plans)}개월 API 조회: "
+                             f"{region_name} ({search_type})")
+            fetched_segments = self.molit_api.get_month_segments(region_code, month_plans,
+                                                                 progress_callback=progress_callback,
+                                                                 refresh=force_refresh)
+            for (deal_ymd, endpoint), segment in fetched_segments.items():
+                data = (segment['data'] if dong is None else
+                        [tx for tx in segment['data'] if dong in (tx.get('umd_nm'), tx.get('umd_cd'))])
+                segments[(endpoint, deal_ymd)] = summarize_apartments(data) if summary else data
+                counts[(endpoint, deal_ymd)] = len(data)
+                if not segment['is_demo']:
+                    fetched.extend(segment['data'])
+            region_count += sum(len(segment['data']) for segment in fetched_segments.values())
+
+            self.db.save_search_segments(region_code, region_name, [
+                (endpoint, deal_ymd, segment['data'], self.cache_hours(deal_ymd))
+                for (deal_ymd, endpoint), segment in fetched_segments.items() if segment['complete']
+            ])
+
+        return {
+            'deal_ymds': deal_ymds,
+            'endpoints': endpoints,
+            'segments': segments,
+            'count': sum(counts.values()),
+            'fetched': fetched,
+            'region_count': region_count,
+            'cached_segments': len(cached),
+            'stale_segments': len(stale_keys),
+            'fetched_months': len(month_plans),
+            'from_cache': not month_plans,
+            'created_at': min((segment['created_at'] for segment in cached.values()), default=None)
+        }
+
+    def _revalidate(self, region_code: str, region_name: Optional[str], segment_keys: List[tuple]):
+        """만료된 구간 백그라운드 갱신 시작 (이미 갱신 중인 구간은 제외)"""
+        if not segment_keys:
+            return
+
+        cache_keys = {key: self.db.generate_segment_cache_key(region_code, *key) for key in segment_keys}
+        with self._refresh_lock:
+            claimed = [key for key, cache_key in cache_keys.items() if cache_key not in self._refreshing]
+            self._refreshing.update(cache_keys[key] for key in claimed)
+        if not claimed:
+            return
+
+        self.logger.info(f"♻️ 만료된 구간 {len(claimed)}개는 캐시로 제공하고 백그라운드 갱신: {region_name or region_code}")
+        thread = threading.Thread(target=self._refresh_segments,
+                                  args=(region_code, region_name or region_code, claimed,
+                                        [cache_keys[key] for key in claimed]),
+                                  daemon=True)
+        thread.start()
+
+    def _refresh_segments(self, region_code: str, region_name: str, segment_keys: List[tuple],
+                          cache_keys: List[str]):
+        """구간 다시 조회 후 캐시 저장 (백그라운드 스레드)"""
+        try:
+            month_plans = {}
+            for endpoint, deal_ymd in segment_keys:
+                month_plans[deal_ymd] = 'all' if deal_ymd in month_plans else endpoint
+
+            fetched_segments = self.molit_api.get_month_segments(region_code, month_plans)
+            saved = self.db.save_search_segments(region_code, region_name, [
+                (endpoint, deal_ymd, segment['data'], self.cache_hours(deal_ymd))
+                for (deal_ymd, endpoint), segment in fetched_segments.items() if segment['complete']
+            ])
+            self.logger.info(f"♻️ 구간 백그라운드 갱신 완료: {region_name} {saved}/{len(segment_keys)}개 구간")
+
+            fetched = [tx for segment in fetched_segments.values() if not segment['is_demo'] for tx in segment['data']]
+            if self.refresh_callback and fetched:
+                self.refresh_callback(region_name, fetched)
+
+        except Exception as e:
+            self.logger.error(f"구간 백그라운드 갱신 실패: {region_name} - {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.difference_update(cache_keys)
+
+    def _report_cache_hit(self, gathered: Dict, region_name: str, search_type: str, count: int,
+                          progress_callback=None):
+        if gathered['from_cache']:
+            months = len(gathered['deal_ymds'])
+            self.logger.info(f"🎯 구간 캐시로 검색 완료: {region_name} ({search_type}, {months}개월 {count}건)")
+            if progress_callback:
+                progress_callback(months, months, "완료", count, "캐시에서 데이터를 가져왔습니다")
+
+    def fetch(self, region_code: str, region_name: str, search_type: str = 'sale', months: int = 6,
+              start_date: str = None, end_date: str = None, progress_callback=None,
+              force_refresh: bool = False, dong: str = None) -> Dict:
+        """
+        캐시된 구간과 새로 조회한 구간을 조합한 검색 결과
+
+        force_refresh면 캐시와 저장된 원본 응답을 무시하고 모든 구간을 API로 다시 조회합니다. dong을 주면
+        캐시된 구간은 해당 법정동 묶음만 해제하고, data에는 그 법정동 거래만 담습니다.
+
+        Returns:
+            {'data': 조합한 거래 목록, 'fetched': 새로 조회한 거래 목록(지역 전체, DB 저장용 - 데모 구간 제외),
+             'region_count': 법정동 필터 전 구간 거래 수, 'cached_segments',
+             'stale_segments': 만료됐지만 제공한(백그라운드 갱신 중인) 구간 수, 'fetched_months',
+             'from_cache', 'created_at'}
+        """
+        gathered = self._gather(region_code, region_name, search_type, months, start_date, end_date,
+                                progress_callback, force_refresh, dong, summary=False)
+        data = self._compose(gathered['deal_ymds'], gathered['endpoints'], gathered['segments'],
+                             start_date, end_date)
+        self._report_cache_hit(gathered, region_name, search_type, len(data), progress_callback)
+
+        return {
+            'data': data,
+            'fetched': gathered['fetched'],
+            'region_count': gathered['region_count'],
+            'cached_segments': gathered['cached_segments'],
+            'stale_segments': gathered['stale_segments'],
+            'fetched_months': gathered['fetched_months'],
+            'from_cache': gathered['from_cache'],
+            'created_at': gathered['created_at']
+        }
+
+    def fetch_apartments(self, region_code: str, region_name: str, dong: str, search_type: str = 'sale',
+                         months: int = 36, progress_callback=None, force_refresh: bool = False) -> Dict:
+        """
+        법정동의 단지 목록 (1단계용)
+
+        캐시된 구간은 해당 법정동의 단지별 집계만 해제해 합치므로, 같은 구의 다른 동을 골라도 거래를
+        다시 훑지 않습니다. 새로 조회한 구간은 그 자리에서 집계합니다.
+
+        Returns:
+            {'apartment_list', 'total_count': 법정동 거래 수, 'fetched': 새로 조회한 거래 목록(DB 저장용),
+             'region_count', 'cached_segments', 'stale_segments', 'fetched_months', 'from_cache', 'created_at'}
+        """
+        gathered = self._gather(region_code, region_name, search_type, months, None, None,
+                                progress_callback, force_refresh, dong, summary=True)
+        summary = merge_apartment_summaries(
+            gathered['segments'].get((endpoint, deal_ymd), {})
+            for deal_ymd in gathered['deal_ymds'] for endpoint in gathered['endpoints']
+        )
+        self._report_cache_hit(gathered, region_name, search_type, gathered['count'], progress_callback)
+
+        return {
+            'apartment_list': apartment_list_from_summary(summary),
+            'total_count': gathered['count'],
+            'fetched': gathered['fetched'],
+            'region_count': gathered['region_count'],
+            'cached_segments': gathered['cached_segments'],
+            'stale_segments': gathered['stale_segments'],
+            'fetched_months': gathered['fetched_months'],
+            'from_cache': gathered['from_cache'],
+            'created_at': gathered['created_at']
+        }
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+실거래 레코드 타입 모듈
+
+파싱된 거래 한 건을 키 문자열 ~30개짜리 dict 대신 __slots__ 기반 객체로 보관하여
+행당 메모리를 줄입니다. 기존 코드와의 호환을 위해 dict와 같은 방식
+(tx.get('apt_name'), tx['deal_amount'], tx['region_name'] = ...)으로 접근할 수 있고,
+JSON 직렬화 시점에만 to_dict()로 변환합니다.
+"""
+
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, Tuple
+
+
+class Transaction(MutableMapping):
+    """
+    거래 레코드 공통 기반 클래스
+
+    FIELDS에 선언된 필드는 슬롯에 저장하고, 그 밖의 키는 필요할 때만 만들어지는
+    보조 dict(_extra)에 저장합니다. 값이 설정되지 않은 필드는 dict에 키가 없는 것과
+    동일하게 취급됩니다 (get은 기본값, []는 KeyError).
+    """
+
+    __slots__ = ('_extra',)
+
+    FIELDS: Tuple[str, ...] = ()
+    _FIELD_SET = frozenset()
+
+    def __init__(self, values: Mapping = None, **fields):
+        self._extra = None
+        if values:
+            for key, value in values.items():
+                self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_pairs(cls, pairs) -> 'Transaction':
+        """(키, 값) 쌍으로 레코드 생성 (파서용 빠른 경로)"""
+        record = cls.__new__(cls)
+        record._extra = None
+        field_set = cls._FIELD_SET
+        for key, value in pairs:
+            if key in field_set:
+                setattr(record, key, value)
+            else:
+                record[key] = value
+        return record
+
+    # dict 호환 인터페이스
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        extra = self._extra
+        return extra.get(key, default) if extra else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        extra = self._extra
+        if extra and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+                return
+            except AttributeError:
+                raise KeyError(key) from None
+        extra = self._extra
+        if extra and key in extra:
+            del extra[key]
+            return
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        extra = self._extra
+        return bool(extra) and key in extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+    def copy(self) -> 'Transaction':
+        return type(self).from_pairs(self.items())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 응답/캐시 저장용 dict 변환"""
+        result = {}
+        for key in self.FIELDS:
+            try:
+                result[key] = getattr(self, key)
+            except AttributeError:
+                pass
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+
+SALE_FIELDS = (
+    'apt_dong', 'apt_name', 'apt_seq', 'bonbun', 'bubun', 'build_year', 'buyer_gbn', 'cdeal_type',
+    'deal_amount', 'deal_day', 'deal_month', 'deal_year', 'dealing_gbn', 'estate_agent_sgg_nm',
+    'exclusive_area', 'floor', 'jibun', 'road_name', 'road_name_bonbun', 'road_name_bubun', 'sgg_cd',
+    'sler_gbn', 'umd_cd', 'umd_nm', 'region_code', 'region_name', 'deal_date', 'price_per_area',
+    'rgs_date', 'cancel_deal_type', 'cancel_deal_day', 'req_gbn', 'house_type',
+    # 매매/전월세 통합 조회 시 추가되는 필드
+    'transaction_type', 'deposit', 'monthly_rent',
+)
+
+RENT_FIELDS = (
+    'apt_name', 'build_year', 'contract_term', 'contract_type', 'deal_date', 'dong', 'exclusive_area',
+    'floor', 'pre_deposit', 'pre_monthly_rent', 'region_code', 'road_name', 'road_name_bonbun',
+    'road_name_bubun', 'umd_nm', 'use_rr_right', 'deposit', 'monthly_rent', 'transaction_type',
+    'deal_amount', 'price_per_area', 'apt_dong', 'jibun', 'rgs_date', 'sgg_cd', 'umd_cd',
+    # 저장 전에 추가되는 필드
+    'region_name',
+)
+
+
+class SaleTransaction(Transaction):
+    """아파트 매매 거래 레코드"""
+
+    __slots__ = SALE_FIELDS
+    FIELDS = SALE_FIELDS
+    _FIELD_SET = frozenset(SALE_FIELDS)
+
+
+class RentTransaction(Transaction):
+    """아파트 전월세 거래 레코드"""
+
+    __slots__ = RENT_FIELDS
+    FIELDS = RENT_FIELDS
+    _FIELD_SET = frozenset(RENT_FIELDS)
+
+
+def transaction_json_default(obj):
+    """json.dumps(default=...)용 변환 함수 (Transaction → dict)"""
+    if isinstance(obj, Transaction):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -4,6 +4,8 @@
 """
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for, Response
+from flask.json.provider import DefaultJSONProvider
+from collections.abc import Mapping
 import os
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
@@ -14,17 +16,29 @@ import time
 
 from .molit_api import MolitRealEstateAPI
 from .database import ApartmentDatabase
+from .search_cache import SearchSegmentCache
 from .api_estimation import APICallEstimator
 from .api_tracker import APICallTracker
+from .transaction import Transaction
 
 # .env 파일 로드
 load_dotenv()
 
+class TransactionJSONProvider(DefaultJSONProvider):
+    """거래 레코드(Transaction)를 응답 직렬화 시점에 dict로 변환하는 JSON 제공자"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, Transaction):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
 class ApartmentTrackerApp:
     """아파트 실거래가 추적 웹 애플리케이션"""
 
     def __init__(self):
         self.app = Flask(__name__, template_folder='../templates', static_folder='../static')
+        self.app.json = TransactionJSONProvider(self.app)
 
         # 진행률 저장소
         self.search_progress = {}
@@ -73,6 +87,10 @@ class ApartmentTrackerApp:
             self.logger.error(f"데이터베이스 초기화 실패: {e}")
             self.db = None
 
+        # 월 구간 검색 캐시 (API와 데이터베이스가 모두 있을 때)
+        self.search_cache = (SearchSegmentCache(self.db, self.molit_api, refresh_callback=self._ingest_refreshed_transactions)
+                             if self.db and self.molit_api else None)
+
         self.setup_routes()
 
     def _calculate_cache_age_hours(self, cache_created_at):
@@ -83,7 +101,8 @@ class ApartmentTrackerApp:
                 cache_time = datetime.fromisoformat(cache_created_at.replace('Z', '+00:00'))
             else:
                 cache_time = cache_created_at
-            now = datetime.now(cache_time.tzinfo) if cache_time.tzinfo else datetime.now()
+            # SQLite CURRENT_TIMESTAMP는 UTC 기준
+            now = datetime.now(cache_time.tzinfo) if cache_time.tzinfo else datetime.utcnow()
             age_delta = now - cache_time
             return round(age_delta.total_seconds() / 3600, 1)  # 시간 단위로 반환
         except Exception:
@@ -251,35 +270,18 @@ class ApartmentTrackerApp:
         def api_dongs_legacy(city, district):
             """특정 시/도, 군/구의 법정동 목록 API (기존 API 호출 방식)"""
             try:
-                if not self.molit_api:
-                    return jsonify({'success': False, 'message': 'API 연결 실패'})
+                if not self.search_cache:
+                    return jsonify({'success': False, 'message': 'API 또는 데이터베이스 연결 실패'})
 
                 # 5자리 지역 코드 조회
                 region_code = self.molit_api.get_region_code_by_city_district(city, district)
                 if not region_code:
                     return jsonify({'success': False, 'message': '해당 지역을 찾을 수 없습니다.'})
 
-                # 캐시에서 동 목록 조회 시도
-                cache_data = self.db.get_search_cache(region_code, 36, datetime.now().strftime('%Y-%m-%d'))
-
-                if cache_data and cache_data.get('raw_data'):
-                    # 캐시된 데이터에서 동 목록 추출
-                    dong_list = list(set([tx.get('umd_nm', '') for tx in cache_data['raw_data'] if tx.get('umd_nm')]))
-                    dong_list = [dong for dong in dong_list if dong]  # 빈 문자열 제거
-                    dong_list.sort()
-
-                    return jsonify({
-                        'success': True,
-                        'dongs': dong_list,
-                        'region_code': region_code,
-                        'region_name': f"{city} {district}",
-                        'from_cache': True
-                    })
-
-                # 캐시가 없으면 짧은 기간으로 API 호출해서 동 목록만 추출
+                # 최근 6개월 구간 캐시(없는 달만 API 호출)에서 동 목록 추출
                 try:
-                    # 최근 6개월 데이터로 동 목록 추출
-                    api_data = self.molit_api.get_multiple_months_data(region_code, months=6)
+                    segment_result = self.search_cache.fetch(region_code, f"{city} {district}", 'sale', months=6)
+                    api_data = segment_result['data']
                     if api_data:
                         dong_list = list(set([tx.get('umd_nm', '') for tx in api_data if tx.get('umd_nm')]))
                         dong_list = [dong for dong in dong_list if dong]  # 빈 문자열 제거
@@ -290,7 +292,7 @@ class ApartmentTrackerApp:
                             'dongs': dong_list,
                             'region_code': region_code,
                             'region_name': f"{city} {district}",
-                            'from_cache': False
+                            'from_cache': segment_result['from_cache']
                         })
                     else:
                         return jsonify({'success': False, 'message': '해당 지역의 거래 데이터가 없습니다.'})
@@ -342,8 +344,8 @@ class ApartmentTrackerApp:
         def api_search():
             """아파트 검색 API (캐시 시스템 적용)"""
             try:
-                if not self.molit_api:
-                    return jsonify({'success': False, 'message': 'API 연결 실패'})
+                if not self.search_cache:
+                    return jsonify({'success': False, 'message': 'API 또는 데이터베이스 연결 실패'})
 
                 data = request.get_json()
                 city = data.get('city', '')
@@ -385,14 +387,13 @@ class ApartmentTrackerApp:
                 if not region_code:
                     return jsonify({'success': False, 'message': '유효하지 않은 지역입니다.'})
 
-                # 검색 날짜 생성 (캐시 키용)
-                search_date = datetime.now().strftime('%Y-%m-%d')
                 region_name = f"{city} {district}"
 
-                # 캐시 확인 (특정 아파트 검색이 아닌 경우에만)
+                # 캐시 확인 (특정 아파트 검색이 아닌 경우에만, 모든 월 구간이 캐시에 있을 때)
                 cache_choice = data.get('cache_choice', 'auto')  # 'auto', 'use_cache', 'refresh'
-                if not apt_name and not force_refresh and self.db:
-                    cache_data = self.db.get_search_cache(region_code, months, search_date)
+                if not apt_name and not force_refresh:
+                    cache_data = self.search_cache.load(region_code, 'sale', months, start_date, end_date,
+                                                        region_name=region_name)
                     if cache_data:
                         # 캐시 선택이 자동이고 확인되지 않은 경우, 사용자에게 선택권 제공
                         if cache_choice == 'auto' and not confirmed:
@@ -402,9 +403,10 @@ class ApartmentTrackerApp:
                                 'has_cache': True,
                                 'cache_info': {
                                     'total_count': cache_data['total_count'],
-                                    'region_name': cache_data['region_name'],
+                                    'region_name': region_name,
                                     'created_at': cache_created,
-                                    'data_age_hours': self._calculate_cache_age_hours(cache_created)
+                                    'data_age_hours': self._calculate_cache_age_hours(cache_created),
+                                    'stale': cache_data['stale']
                                 },
                                 'message': '캐시된 데이터가 있습니다. 캐시를 사용할지 새로 조회할지 선택해주세요.'
                             })
@@ -414,14 +416,15 @@ class ApartmentTrackerApp:
                             self.logger.info(f"캐시된 데이터 사용: {region_name} ({cache_data['total_count']}건)")
                             return jsonify({
                                 'success': True,
-                                'data': cache_data['raw_data'],
-                                'classified_data': cache_data['classified_data'],
+                                'data': cache_data['data'],
+                                'classified_data': self._classify_by_dong(cache_data['data']),
                                 'total_count': cache_data['total_count'],
-                                'region_name': cache_data['region_name'],
-                                'region_code': cache_data['region_code'],
+                                'region_name': region_name,
+                                'region_code': region_code,
                                 'is_demo': False,
                                 'from_cache': True,
-                                'cache_created': cache_data['created_at']
+                                'cache_created': cache_data['created_at'],
+                                'stale': cache_data['stale']
                             })
 
                 # 캐시가 없을 때만 API 추적 시작
@@ -439,13 +442,14 @@ class ApartmentTrackerApp:
                 # API 호출하여 새 데이터 조회
                 self.logger.info(f"새 데이터 조회: {region_name}")
                 
+                from_cache = False
+                stale_result = None
+                refresh = force_refresh or cache_choice == 'refresh'
                 if apt_name:
-                    # 특정 아파트 검색
-                    if start_date and end_date:
-                        all_data = self.molit_api.get_multiple_months_data(region_code, months, start_date, end_date)
-                        transactions = [tx for tx in all_data if apt_name.lower() in tx['apt_name'].lower()]
-                    else:
-                        transactions = self.molit_api.search_apartments_by_name(region_code, apt_name, months)
+                    # 특정 아파트 검색 (지역 전체 월 구간을 조합한 뒤 단지명 부분 일치)
+                    all_data = self.search_cache.fetch(region_code, region_name, 'sale', months, start_date, end_date,
+                                                       force_refresh=refresh)['data']
+                    transactions = [tx for tx in all_data if apt_name.lower() in tx['apt_name'].lower()]
 
                     # 특정 아파트 검색에도 읍/면/동 필터 적용
                     if town and transactions:
@@ -454,8 +458,13 @@ class ApartmentTrackerApp:
                         filtered_count = len(transactions)
                         self.logger.info(f"아파트 '{apt_name}' + 읍/면/동 '{town}' 필터 적용: {original_count}건 → {filtered_count}건")
                 else:
-                    # 전체 아파트 조회
-                    transactions = self.molit_api.get_multiple_months_data(region_code, months, start_date, end_date)
+                    # 전체 아파트 조회 (캐시된 월 구간은 재사용하고 없는 구간만 API 호출)
+                    segment_result = self.search_cache.fetch(region_code, region_name, 'sale', months, start_date, end_date,
+                                                             force_refresh=refresh)
+                    transactions = segment_result['data']
+                    from_cache = segment_result['from_cache']
+                    if segment_result['stale_segments']:
+                        stale_result = segment_result
 
                 # 읍/면/동 필터 적용 (town이 지정된 경우)
                 if town and transactions:
@@ -464,30 +473,16 @@ class ApartmentTrackerApp:
                     filtered_count = len(transactions)
                     self.logger.info(f"읍/면/동 '{town}' 필터 적용: {original_count}건 → {filtered_count}건")
                 
-                # 데이터베이스에 저장
-                if self.db and transactions:
-                    saved_count = self.db.save_transaction_data(transactions)
+                # 데이터베이스에 저장 (API 실패로 대체된 데모 거래 제외)
+                real_transactions = [tx for tx in transactions if not tx.get('is_demo')]
+                if self.db and real_transactions:
+                    saved_count = self.db.save_transaction_data(real_transactions)
                     self.logger.info(f"{saved_count}건의 거래 데이터 저장")
                 
                 # 법정동 단위로 분류
                 classified_data = self._classify_by_dong(transactions)
                 self.logger.info(f"법정동별 분류 완료: {len(classified_data)}개 동")
                 
-                # 캐시 저장 (특정 아파트 검색이 아닌 경우에만)
-                if not apt_name and self.db:
-                    cache_saved = self.db.save_search_cache(
-                        region_code=region_code,
-                        region_name=region_name,
-                        months=months,
-                        search_date=search_date,
-                        total_count=len(transactions),
-                        classified_data=classified_data,
-                        raw_data=transactions,
-                        cache_hours=24  # 24시간 캐시
-                    )
-                    if cache_saved:
-                        self.logger.info(f"검색 결과 캐시 저장 완료: {region_name}")
-                
                 # API 추적 완료 및 결과 가져오기
                 api_tracking_result = None
                 if hasattr(self, 'api_tracker') and operation_id:
@@ -502,9 +497,14 @@ class ApartmentTrackerApp:
                     'region_name': region_name,
                     'region_code': region_code,
                     'is_demo': transactions[0].get('is_demo', False) if transactions else False,
-                    'from_cache': False
+                    'from_cache': from_cache,
+                    'stale': stale_result is not None
                 }
 
+                # 만료된 구간을 제공한 경우 데이터 경과 시간 (해당 구간은 백그라운드 갱신 중)
+                if stale_result:
+                    response_data['data_age_hours'] = self._calculate_cache_age_hours(stale_result['created_at'])
+
                 # API 추적 결과가 있으면 포함
                 if api_tracking_result:
                     response_data['api_tracking_result'] = api_tracking_result
@@ -594,6 +594,31 @@ class ApartmentTrackerApp:
                 self.logger.error(f"거래 내역 조회 오류: {e}")
                 return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'})
 
+        @self.app.route('/api/apartments/search')
+        def api_apartments_search():
+            """전국 단지 검색 API (저장된 거래 데이터 기준, API 호출 없음)"""
+            try:
+                if not self.db:
+                    return jsonify({'success': False, 'message': '데이터베이스 연결 실패'})
+
+                query = request.args.get('q', '').strip()
+                if not query:
+                    return jsonify({'success': False, 'message': '검색어를 입력해주세요.'})
+
+                limit = min(max(int(request.args.get('limit', 20)), 1), 100)
+                results = self.db.search_apartments(query, limit)
+
+                return jsonify({
+                    'success': True,
+                    'query': query,
+                    'count': len(results),
+                    'results': results
+                })
+
+            except Exception as e:
+                self.logger.error(f"단지 검색 오류: {e}")
+                return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'})
+
         @self.app.route('/api/refresh/estimate/<apt_name>/<region_code>')
         def api_refresh_estimate(apt_name, region_code):
             """데이터 새로고침 API 호출 횟수 예측"""
@@ -647,7 +672,7 @@ class ApartmentTrackerApp:
                     })
 
                 # 최근 6개월 데이터 조회
-                transactions = self.molit_api.search_apartments_by_name(region_code, apt_name, 6)
+                transactions = self.molit_api.search_apartments_by_name(region_code, apt_name, 6, refresh=True)
                 
                 if transactions:
                     saved_count = self.db.save_transaction_data(transactions)
@@ -692,7 +717,7 @@ class ApartmentTrackerApp:
         def api_search_step1():
             """1단계: 시도/군구 선택 후 법정동 목록 조회"""
             try:
-                if not self.molit_api or not self.db:
+                if not self.search_cache:
                     return jsonify({'success': False, 'message': 'API 또는 데이터베이스 연결 실패'})
 
                 data = request.get_json()
@@ -729,122 +754,55 @@ class ApartmentTrackerApp:
                 if not region_code:
                     return jsonify({'success': False, 'message': '해당 지역의 코드를 찾을 수 없습니다.'})
                 
-                # 데이터베이스에서 먼저 확인 (36개월 캐시) - 검색 타입별로 별도 캐시 키 사용
-                search_date = datetime.now().strftime('%Y-%m-%d')
                 if search_type == "all":
                     search_type_name = "통합"
                 else:
                     search_type_name = "매매" if search_type == "sale" else "전월세"
-                cache_key = f"{region_code}_{search_type}"  # 검색 타입별 캐시 키
-                cached_data = self.db.get_search_cache(cache_key, 36, search_date)
-                if cached_data and cached_data.get('raw_data'):
-                    # 캐시된 데이터에서 선택된 법정동으로 필터링
-                    raw_data = cached_data['raw_data']
-
-                    # 선택된 동으로 데이터 필터링
-                    filtered_data = [tx for tx in raw_data if tx.get('umd_nm') == dong]
 
-                    if not filtered_data:
-                        return jsonify({
-                            'success': False,
-                            'message': f'선택하신 법정동({dong})에서 {search_type_name} 거래 데이터를 찾을 수 없습니다.',
-                            'suggestion': '다른 법정동을 선택해주세요.'
-                        })
-
-                    # 아파트 목록 추출 (선택된 동만) - 개선된 버전
-                    apartment_list = self._extract_apartment_list_improved(filtered_data)
-
-                    return jsonify({
-                        'success': True,
-                        'region_code': region_code,
-                        'dong_name': dong,
-                        'apartment_list': apartment_list,
-                        'from_cache': True,
-                        'total_count': len(filtered_data),
-                        'search_type': search_type,
-                        'search_type_name': search_type_name
-                    })
-                
-                # 캐시된 데이터가 없으면 API 호출
-                self.logger.info(f"{search_type_name} API 호출: {city} {district} (지역코드: {region_code})")
+                # 36개월 월 구간 캐시 조합 - 검색 타입의 엔드포인트별 구간 중 캐시에 없는 것만 API 호출
+                # (캐시된 구간은 선택된 동의 단지별 집계만 해제해 합침)
                 try:
-                    # 검색 타입에 따라 다른 API 호출
-                    if search_type == "sale":
-                        api_data = self.molit_api.get_multiple_months_data(region_code, months=36)
-                    elif search_type == "rent":
-                        api_data = self.molit_api.get_multiple_months_rent_data(region_code, months=36)
-                    else:  # all - 통합 검색
-                        # 매매와 전월세 데이터를 모두 가져와서 합치기
-                        sale_data = self.molit_api.get_multiple_months_data(region_code, months=36)
-                        rent_data = self.molit_api.get_multiple_months_rent_data(region_code, months=36)
-                        api_data = (sale_data or []) + (rent_data or [])
-
-                    self.logger.info(f"{search_type_name} API 호출 결과: {len(api_data) if api_data else 0}건의 데이터")
+                    segment_result = self.search_cache.fetch_apartments(region_code, f"{city} {district}", dong,
+                                                                        search_type, months=36)
+                    self.logger.info(f"{search_type_name} 데이터 조합 결과: 지역 {segment_result['region_count']}건 중 "
+                                     f"{dong} {segment_result['total_count']}건 (구간 캐시 {segment_result['cached_segments']}개, "
+                                     f"API 조회 {segment_result['fetched_months']}개월)")
                 except Exception as e:
                     self.logger.error(f"{search_type_name} API 호출 중 오류 발생: {e}")
                     return jsonify({'success': False, 'message': f'{search_type_name} API 호출 중 오류가 발생했습니다: {str(e)}'})
 
-                if not api_data:
+                if not segment_result['region_count']:
                     return jsonify({
                         'success': False,
                         'message': f'해당 지역({city} {district})의 최근 {search_type_name} 거래 데이터가 없습니다.',
                         'suggestion': '다른 지역을 선택하거나, 서울특별시나 인천광역시 등 대도시 지역을 시도해보세요.'
                     })
-                
-                # 데이터베이스에 저장 (캐시 + 개별 거래기록) - 검색 타입별로 별도 저장
-                region_name = f"{city} {district} ({search_type_name})"
-                self.db.save_search_cache(
-                    region_code=cache_key,  # 검색 타입별 캐시 키 사용
-                    region_name=region_name,
-                    months=36,
-                    search_date=search_date,
-                    total_count=len(api_data),
-                    classified_data={},  # 법정동별 분류는 나중에 필요시
-                    raw_data=api_data,
-                    cache_hours=24
-                )
 
-                # 거래기록을 배치로 데이터베이스에 저장
-                if api_data:
-                    # 유효한 거래 데이터만 필터링하고 region_name 추가
-                    valid_transactions = []
-                    for transaction in api_data:
-                        if isinstance(transaction, dict):
-                            # region_name 추가
-                            transaction['region_name'] = region_name
-                            valid_transactions.append(transaction)
-                        elif isinstance(transaction, str):
-                            self.logger.warning(f"문자열 데이터 건너뛰기: {transaction[:50]}...")
-                        else:
-                            self.logger.warning(f"예상치 못한 데이터 타입: {type(transaction)}")
-
-                    # 배치로 저장 (효율적)
-                    if valid_transactions:
-                        saved_count = self.db.save_transaction_data(valid_transactions)
-                        self.logger.info(f"거래 데이터 배치 저장 완료: {saved_count}건")
+                # 새로 조회한 구간의 거래기록만 배치로 데이터베이스에 저장 (캐시된 구간은 조회 당시 저장됨)
+                if segment_result['fetched']:
+                    # 유효한 거래 데이터만 region_name을 붙여 스트리밍 저장
+                    region_name = f"{city} {district} ({search_type_name})"
+                    ingest = self.db.ingest_transactions(self._iter_region_transactions(segment_result['fetched'], region_name))
+                    if ingest['total']:
+                        self.logger.info(f"거래 데이터 배치 저장 완료: {ingest['inserted']}건 (갱신 {ingest['updated']}건, 중복 {ingest['duplicates']}건)")
                     else:
                         self.logger.warning("저장할 유효한 거래 데이터가 없습니다.")
-                
-                # 선택된 동으로 API 데이터 필터링
-                filtered_data = [tx for tx in api_data if tx.get('umd_nm') == dong]
 
-                if not filtered_data:
+                if not segment_result['total_count']:
                     return jsonify({
                         'success': False,
-                        'message': f'선택하신 법정동({dong})에서 거래 데이터를 찾을 수 없습니다.',
+                        'message': f'선택하신 법정동({dong})에서 {search_type_name} 거래 데이터를 찾을 수 없습니다.',
                         'suggestion': '다른 법정동을 선택해주세요.'
                     })
 
-                # 아파트 목록 추출 (선택된 동만) - 개선된 버전
-                apartment_list = self._extract_apartment_list_improved(filtered_data)
-
                 return jsonify({
                     'success': True,
                     'region_code': region_code,
                     'dong_name': dong,
-                    'apartment_list': apartment_list,
-                    'from_cache': False,
-                    'total_count': len(filtered_data),
+                    'apartment_list': segment_result['apartment_list'],
+                    'from_cache': segment_result['from_cache'],
+                    'stale': segment_result['stale_segments'] > 0,
+                    'total_count': segment_result['total_count'],
                     'search_type': search_type,
                     'search_type_name': search_type_name
                 })
@@ -904,8 +862,7 @@ class ApartmentTrackerApp:
 
                 if len(transactions) == 0:
                     # 디버깅을 위해 데이터베이스에서 직접 확인
-                    import sqlite3
-                    with sqlite3.connect(self.db.db_path) as conn:
+                    with self.db.connections.connection() as conn:
                         cursor = conn.cursor()
                         cursor.execute('SELECT COUNT(*) FROM transaction_data WHERE region_code = ?', (region_code,))
                         region_count = cursor.fetchone()[0]
@@ -934,13 +891,32 @@ class ApartmentTrackerApp:
 
                 return jsonify({
                     'success': True,
-                    'statistics': stats
+                    'statistics': stats,
+                    'connections': self.db.get_connection_statistics(),
+                    'memory_cache': self.db.get_memory_cache_statistics(),
+                    'archive': self.db.get_archive_statistics()
                 })
 
             except Exception as e:
                 self.logger.error(f"캐시 통계 조회 오류: {e}")
                 return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'})
 
+        @self.app.route('/api/molit/statistics')
+        def api_molit_statistics():
+            """국토교통부 API 수집 통계 API (호출 속도 제한 상태 등)"""
+            try:
+                if not self.molit_api:
+                    return jsonify({'success': False, 'message': 'MOLIT API 연결 실패'})
+
+                return jsonify({
+                    'success': True,
+                    'statistics': self.molit_api.get_fetch_statistics()
+                })
+
+            except Exception as e:
+                self.logger.error(f"API 수집 통계 조회 오류: {e}")
+                return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'})
+
         @self.app.route('/api/cache/invalidate', methods=['POST'])
         def api_cache_invalidate():
             """캐시 무효화 API"""
@@ -1161,7 +1137,7 @@ class ApartmentTrackerApp:
             try:
                 self.logger.info("🚀 진행률 검색 API 호출됨")
 
-                if not self.molit_api or not self.db:
+                if not self.search_cache:
                     self.logger.error("❌ API 또는 데이터베이스 연결 실패")
                     return jsonify({'success': False, 'message': 'API 또는 데이터베이스 연결 실패'})
 
@@ -1198,117 +1174,44 @@ class ApartmentTrackerApp:
                     try:
                         self.logger.info(f"🚀 백그라운드 검색 시작 - Search ID: {search_id}, Type: {search_type}, Region: {region_code}")
 
-                        # 캐시에서 기존 데이터 확인
-                        search_date = datetime.now().strftime('%Y-%m-%d')
-                        cached_data = self.db.get_search_cache(region_code, months, search_date)
-
-                        if cached_data and cached_data.get('raw_data'):
-                            self.logger.info(f"🎯 캐시에서 데이터 발견! 총 {len(cached_data['raw_data'])}건")
-                            # 검색 타입에 따라 필터링
-                            if search_type == "sale":
-                                # 매매 데이터만 필터링 (전월세 제외)
-                                api_data = [
-                                    tx for tx in cached_data['raw_data']
-                                    if not tx.get('rentFee') and not tx.get('deposit') and not tx.get('monthlyRent')
-                                ]
-                                self.logger.info(f"🏢 캐시에서 매매 데이터 {len(api_data)}건 추출")
-                            elif search_type == "rent":
-                                # 전월세 데이터만 필터링 (매매 제외)
-                                api_data = [
-                                    tx for tx in cached_data['raw_data']
-                                    if tx.get('rentFee') or tx.get('deposit') or tx.get('monthlyRent')
-                                ]
-                                self.logger.info(f"🏠 캐시에서 전월세 데이터 {len(api_data)}건 추출")
-                            else:  # all - 통합 검색
-                                # 모든 데이터 사용 (필터링 없음)
-                                api_data = cached_data['raw_data']
-                                self.logger.info(f"🌟 캐시에서 통합 데이터 {len(api_data)}건 추출")
-
-                            # 즉시 완료 상태로 진행률 업데이트
-                            progress_callback(months, months, "완료", len(api_data), "캐시에서 데이터를 가져왔습니다")
-                        else:
-                            # 캐시가 없으면 API 호출
-                            self.logger.info(f"📡 캐시 없음 - API 호출 시작")
-                            if search_type == "sale":
-                                self.logger.info(f"📊 매매 데이터 조회 시작 - {months}개월")
-                                api_data = self.molit_api.get_multiple_months_data(region_code, months=months, progress_callback=progress_callback)
-                            elif search_type == "rent":
-                                self.logger.info(f"🏠 전월세 데이터 조회 시작 - {months}개월")
-                                api_data = self.molit_api.get_multiple_months_rent_data(region_code, months=months, progress_callback=progress_callback)
-                            else:  # all - 통합 검색
-                                self.logger.info(f"🌟 통합 데이터 조회 시작 - {months}개월")
-                                # 매매와 전월세 데이터를 모두 가져와서 합치기
-                                sale_data = self.molit_api.get_multiple_months_data(region_code, months=months, progress_callback=progress_callback)
-                                rent_data = self.molit_api.get_multiple_months_rent_data(region_code, months=months, progress_callback=progress_callback)
-                                api_data = (sale_data or []) + (rent_data or [])
-
-                        # 거래 데이터를 transaction_data 테이블에 저장 (캐시 유무와 관계없이)
-                        if api_data:
-                            # 유효한 거래 데이터만 필터링하고 region_name 추가
-                            valid_transactions = []
-                            region_name = f"{city} {district}"
-                            for transaction in api_data:
-                                if isinstance(transaction, dict):
-                                    # region_name 추가
-                                    transaction['region_name'] = region_name
-                                    valid_transactions.append(transaction)
-
-                            # 배치로 저장 (효율적) - 중복 체크는 데이터베이스에서 처리
-                            if valid_transactions:
-                                saved_count = self.db.save_transaction_data(valid_transactions)
-                                self.logger.info(f"백그라운드 거래 데이터 배치 저장 완료: {saved_count}건")
+                        # 월 구간 캐시 조합 - 검색 타입의 엔드포인트별 구간 중 캐시에 없는 것만 API 호출
+                        if search_type == "sale":
+                            self.logger.info(f"📊 매매 데이터 조회 시작 - {months}개월")
+                        elif search_type == "rent":
+                            self.logger.info(f"🏠 전월세 데이터 조회 시작 - {months}개월")
+                        else:  # all - 통합 검색
+                            self.logger.info(f"🌟 통합 데이터 조회 시작 - {months}개월")
+                        region_name = f"{city} {district}"
+                        segment_result = self.search_cache.fetch_apartments(region_code, region_name, dong, search_type,
+                                                                            months=months, progress_callback=progress_callback)
+                        self.logger.info(f"🎯 구간 캐시 {segment_result['cached_segments']}개 사용, "
+                                         f"API 조회 {segment_result['fetched_months']}개월 - 총 {segment_result['region_count']}건")
+
+                        # 새로 조회한 구간의 거래만 transactions 테이블에 저장 (캐시된 구간은 조회 당시 저장됨)
+                        if segment_result['fetched']:
+                            # 유효한 거래 데이터만 region_name을 붙여 스트리밍 저장 - 중복 체크는 데이터베이스에서 처리
+                            ingest = self.db.ingest_transactions(self._iter_region_transactions(segment_result['fetched'], region_name))
+                            if ingest['total']:
+                                self.logger.info(f"백그라운드 거래 데이터 배치 저장 완료: {ingest['inserted']}건 (갱신 {ingest['updated']}건, 중복 {ingest['duplicates']}건)")
                             else:
                                 self.logger.warning("백그라운드: 저장할 유효한 거래 데이터가 없습니다.")
 
-                        # 선택된 동으로 필터링
-                        self.logger.info(f"🔍 동 필터링 시작: 검색하는 동='{dong}', API 데이터 총 {len(api_data)}건")
-
-                        # 실제 데이터에 포함된 동 이름들 확인
-                        actual_dongs = set([tx.get('umd_nm', '') for tx in api_data[:10]])  # 처음 10개만 확인
-                        self.logger.info(f"📍 실제 데이터의 동 이름들 (샘플): {actual_dongs}")
-
-                        filtered_data = [tx for tx in api_data if tx.get('umd_nm') == dong]
-                        self.logger.info(f"🎯 동 필터링 결과: {len(filtered_data)}건 ('{dong}' 동 매칭)")
-
-                        # 아파트 목록 추출
-                        apartment_list = self._extract_apartment_list_improved(filtered_data)
-
-                        # 캐시에 원본 데이터 저장 (동 필터링 전 전체 데이터)
-                        if not cached_data:  # 캐시에서 가져오지 않았을 때만 저장
-                            try:
-                                # 지역 이름 생성
-                                region_name = f"{city} {district}"
-                                search_date = datetime.now().strftime('%Y-%m-%d')
-
-                                # 캐시에 저장 (전체 API 데이터를 저장하여 다른 동 검색에서 재사용)
-                                cache_saved = self.db.save_search_cache(
-                                    region_code=region_code,
-                                    region_name=region_name,
-                                    months=months,
-                                    search_date=search_date,
-                                    total_count=len(api_data),
-                                    classified_data={},  # 백그라운드 검색에서는 분류 데이터 없음
-                                    raw_data=api_data,
-                                    cache_hours=24
-                                )
-                                if cache_saved:
-                                    self.logger.info(f"🎯 캐시 저장 완료: {region_name} ({len(api_data)}건)")
-                                else:
-                                    self.logger.warning(f"⚠️ 캐시 저장 실패: {region_name}")
-                            except Exception as cache_error:
-                                self.logger.error(f"캐시 저장 중 오류: {cache_error}")
+                        # 선택된 동의 단지 목록 (캐시된 구간은 해당 동 단지별 집계만 해제됨)
+                        self.logger.info(f"🎯 동 단지 목록: {segment_result['total_count']}건, "
+                                         f"{len(segment_result['apartment_list'])}개 단지 ('{dong}' 동 매칭)")
 
                         # 최종 진행률 업데이트
-                        progress_callback(months, months, "완료", len(filtered_data), "검색이 완료되었습니다")
+                        progress_callback(months, months, "완료", segment_result['total_count'], "검색이 완료되었습니다")
 
                         # 결과 저장 (나중에 결과 조회용)
                         with self.search_lock:
                             self.search_progress[search_id + '_result'] = {
-                                'apartment_list': apartment_list,
-                                'total_count': len(filtered_data),
+                                'apartment_list': segment_result['apartment_list'],
+                                'total_count': segment_result['total_count'],
                                 'region_code': region_code,
                                 'dong_name': dong,
                                 'search_type': search_type,
+                                'stale': segment_result['stale_segments'] > 0,
                                 'completed': True
                             }
 
@@ -1482,86 +1385,24 @@ class ApartmentTrackerApp:
         
         return apartment_list
 
-    def _extract_apartment_list_improved(self, transactions):
-        """개선된 아파트 목록 추출 (1단계용) - 매매/전월세 구분 처리"""
-        apartment_dict = {}
+    def _ingest_refreshed_transactions(self, region_name: str, transactions):
+        """백그라운드 갱신으로 새로 받은 구간 거래를 transactions 테이블에 저장"""
+        ingest = self.db.ingest_transactions(self._iter_region_transactions(transactions, region_name))
+        if ingest['total']:
+            self.logger.info(f"♻️ 갱신 구간 거래 저장: {region_name} {ingest['inserted']}건 (갱신 {ingest['updated']}건)")
 
+    def _iter_region_transactions(self, transactions, region_name: str):
+        """거래 레코드만 골라 region_name을 붙여 하나씩 반환 (DB 일괄 저장용, 데모 거래 제외)"""
         for transaction in transactions:
-            apt_name = transaction.get('apt_name', '')
-            if not apt_name:
-                continue
-
-            if apt_name not in apartment_dict:
-                apartment_dict[apt_name] = {
-                    'apt_name': apt_name,
-                    'region_code': transaction.get('region_code', ''),
-                    'region_name': transaction.get('region_name', ''),
-                    'build_year': transaction.get('build_year', 0),
-                    'transaction_count': 0,
-                    'sale_count': 0,      # 매매 거래 건수
-                    'rent_count': 0,      # 전월세 거래 건수
-                    'avg_price': 0,
-                    'min_price': float('inf'),
-                    'max_price': 0,
-                    'dong_list': set(),
-                }
-
-            # 거래 건수 증가
-            apartment_dict[apt_name]['transaction_count'] += 1
-
-            # 매매/전월세 구분하여 카운팅
-            is_rent = transaction.get('transaction_type') is not None or transaction.get('rentFee') or transaction.get('deposit') or transaction.get('monthlyRent')
-            if is_rent:
-                apartment_dict[apt_name]['rent_count'] += 1
+            if isinstance(transaction, Mapping):
+                if transaction.get('is_demo'):
+                    continue
+                transaction['region_name'] = region_name
+                yield transaction
+            elif isinstance(transaction, str):
+                self.logger.warning(f"문자열 데이터 건너뛰기: {transaction[:50]}...")
             else:
-                apartment_dict[apt_name]['sale_count'] += 1
-
-            # 가격 통계 계산
-            if is_rent:  # 전월세 데이터인 경우
-                # 전월세는 보증금(deal_amount) 기준으로 계산
-                price = transaction.get('deal_amount', 0)  # 보증금
-            else:  # 매매 데이터인 경우
-                price = transaction.get('deal_amount', 0)
-
-            if price > 0:
-                apartment_dict[apt_name]['min_price'] = min(
-                    apartment_dict[apt_name]['min_price'], price
-                )
-                apartment_dict[apt_name]['max_price'] = max(
-                    apartment_dict[apt_name]['max_price'], price
-                )
-
-            # 법정동 목록 추가
-            dong_name = transaction.get('umd_nm', '')
-            if dong_name:
-                apartment_dict[apt_name]['dong_list'].add(dong_name)
-
-        # 평균 가격 계산 및 정리
-        apartment_list = []
-        for apt_name, apt_data in apartment_dict.items():
-            if apt_data['transaction_count'] > 0:
-                # 평균 가격 계산 - 해당 아파트의 모든 거래에서 계산
-                apt_transactions = [tx for tx in transactions if tx.get('apt_name') == apt_name]
-                prices = [tx.get('deal_amount', 0) for tx in apt_transactions if tx.get('deal_amount', 0) > 0]
-
-                if prices:
-                    apt_data['avg_price'] = sum(prices) / len(prices)
-                else:
-                    apt_data['avg_price'] = 0
-
-                # 무한대 처리
-                if apt_data['min_price'] == float('inf'):
-                    apt_data['min_price'] = 0
-
-                # 법정동 목록을 리스트로 변환
-                apt_data['dong_list'] = list(apt_data['dong_list'])
-
-                apartment_list.append(apt_data)
-
-        # 거래 건수 기준으로 정렬
-        apartment_list.sort(key=lambda x: x['transaction_count'], reverse=True)
-
-        return apartment_list
+                self.logger.warning(f"예상치 못한 데이터 타입: {type(transaction)}")
 
     def _classify_by_dong(self, transactions):
         """법정동 단위로 거래 데이터 분류"""